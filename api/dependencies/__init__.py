@@ -3,15 +3,25 @@
 from __future__ import annotations
 
 from api.dependencies.auth import (
+    STEP_UP_SCOPE,
     create_access_token,
     get_admin_person,
     get_current_person,
+    get_stream_person,
+    require_step_up,
+    revoke_person_tokens,
+    revoke_token,
 )
 from api.dependencies.db import get_session
 
 __all__ = [
+    "STEP_UP_SCOPE",
     "get_session",
     "get_current_person",
     "get_admin_person",
+    "get_stream_person",
     "create_access_token",
+    "require_step_up",
+    "revoke_person_tokens",
+    "revoke_token",
 ]
@@ -4,21 +4,37 @@ from __future__ import annotations
 
 from datetime import datetime, timedelta, timezone
 from typing import Any
+from uuid import uuid4
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Query, status
+from fastapi.requests import HTTPConnection
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jose import JWTError, jwt
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from api.dependencies.db import get_session
+from api.dependencies.revocation import TokenRevocationStore
+from api.dependencies.token_cache import TokenClaimsCache
 from choreboss.config import get_config
+from choreboss.repositories import TokenRevocationRepository
 
 config = get_config()
 security = HTTPBearer()
+claims_cache = TokenClaimsCache(config.jwt_claims_cache_size)
+revocations = TokenRevocationStore(
+    config.token_revocation_sync_seconds,
+    config.token_revocation_sync_overlap_seconds,
+)
+
+ACCESS_TOKEN_LIFETIME = timedelta(days=7)
+STEP_UP_SCOPE = "step_up"
 
 
 def create_access_token(
     person_id: int,
     is_admin: bool,
     expires_delta: timedelta | None = None,
+    scope: str | None = None,
 ) -> str:
     """Create a JWT access token.
 
@@ -26,18 +42,24 @@ def create_access_token(
         person_id: Person ID to encode in token.
         is_admin: Whether person is admin.
         expires_delta: Token expiration delta (default 7 days).
+        scope: Optional scope claim, e.g. ``STEP_UP_SCOPE``.
 
     Returns:
         str: Encoded JWT token.
     """
     if expires_delta is None:
-        expires_delta = timedelta(days=7)
+        expires_delta = ACCESS_TOKEN_LIFETIME
 
+    now = datetime.now(timezone.utc)
     to_encode = {
         "sub": str(person_id),
         "is_admin": is_admin,
-        "exp": datetime.now(timezone.utc) + expires_delta,
+        "jti": uuid4().hex,
+        "iat": now.timestamp(),
+        "exp": now + expires_delta,
     }
+    if scope is not None:
+        to_encode["scope"] = scope
 
     encoded_jwt = jwt.encode(
         to_encode,
@@ -48,28 +70,31 @@ def create_access_token(
     return encoded_jwt
 
 
-async def get_current_person(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-) -> dict[str, Any]:
-    """Validate JWT token and return person data.
+def _decode_claims(token: str) -> dict[str, Any]:
+    """Decode and validate a token, using the claims cache when possible.
 
     Args:
-        credentials: HTTP bearer credentials from request.
+        token: Encoded JWT.
 
     Returns:
-        dict: Decoded token payload.
+        dict: Validated claims.
 
     Raises:
         HTTPException: If token is invalid or expired.
     """
+    cached = claims_cache.get(token)
+    if cached is not None:
+        return cached
+
     try:
         payload = jwt.decode(
-            credentials.credentials,
+            token,
             config.secret_key,
             algorithms=["HS256"],
         )
         person_id: str | None = payload.get("sub")
         is_admin: bool = payload.get("is_admin", False)
+        scope: str | None = payload.get("scope")
 
         if person_id is None:
             raise HTTPException(
@@ -77,10 +102,17 @@ async def get_current_person(
                 detail="Invalid token",
             )
 
-        return {
+        claims = {
             "person_id": int(person_id),
             "is_admin": is_admin,
+            "scope": scope,
+            "jti": payload.get("jti"),
+            "iat": payload.get("iat"),
+            "exp": payload.get("exp"),
         }
+        if claims["exp"] is not None:
+            claims_cache.put(token, claims, claims["exp"])
+        return claims
 
     except JWTError:
         raise HTTPException(
@@ -89,6 +121,128 @@ async def get_current_person(
         )
 
 
+async def get_current_person(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    session: AsyncSession = Depends(get_session),
+) -> dict[str, Any]:
+    """Validate JWT token and return person data.
+
+    Validated claims are cached by token digest until the token's ``exp``,
+    so polling clients that reuse one token skip the signature check.
+    Revocation is checked against the in-memory mirror, which only reads
+    the database when its sync interval has elapsed.
+
+    Args:
+        credentials: HTTP bearer credentials from request.
+        session: Database session used for revocation syncs.
+
+    Returns:
+        dict: Decoded token payload.
+
+    Raises:
+        HTTPException: If token is invalid, expired or revoked.
+    """
+    claims = _decode_claims(credentials.credentials)
+
+    await revocations.maybe_sync(session)
+    if revocations.is_revoked(
+        claims["person_id"],
+        claims["jti"],
+        claims["iat"],
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token has been revoked",
+        )
+    return claims
+
+
+async def get_stream_person(
+    connection: HTTPConnection,
+    access_token: str | None = Query(
+        None,
+        description="Bearer token, for clients that cannot set headers",
+    ),
+    session: AsyncSession = Depends(get_session),
+) -> dict[str, Any]:
+    """Authenticate a long-lived event stream or WebSocket.
+
+    Browsers' ``EventSource`` and ``WebSocket`` cannot send an
+    ``Authorization`` header, so the token may also come as the
+    ``access_token`` query parameter.
+
+    Args:
+        connection: Incoming HTTP request or WebSocket.
+        access_token: Token from the query string.
+        session: Database session used for revocation syncs.
+
+    Returns:
+        dict: Decoded token payload.
+
+    Raises:
+        HTTPException: If no token is given, or it is invalid or revoked.
+    """
+    scheme, _, token = connection.headers.get("authorization", "").partition(
+        " "
+    )
+    if scheme.lower() != "bearer" or not token:
+        token = access_token
+    if not token:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated",
+        )
+    return await get_current_person(
+        HTTPAuthorizationCredentials(scheme="Bearer", credentials=token),
+        session,
+    )
+
+
+async def revoke_token(
+    session: AsyncSession,
+    claims: dict[str, Any],
+) -> None:
+    """Revoke the token the given claims were decoded from.
+
+    Args:
+        session: Database session (caller commits).
+        claims: Claims returned by ``get_current_person``.
+    """
+    if claims["jti"] is None:
+        # Tokens minted before jti existed can only be revoked per person
+        await revoke_person_tokens(session, claims["person_id"])
+        return
+    expires_at = datetime.fromtimestamp(claims["exp"], timezone.utc)
+    repo = TokenRevocationRepository(session)
+    revocation = await repo.revoke_token(
+        jti=claims["jti"],
+        expires_at=expires_at.replace(tzinfo=None),
+    )
+    revocations.apply(revocation)
+
+
+async def revoke_person_tokens(
+    session: AsyncSession,
+    person_id: int,
+) -> None:
+    """Revoke every token issued to a person so far.
+
+    Used when a person's PIN or role changes.
+
+    Args:
+        session: Database session (caller commits).
+        person_id: Person whose tokens are revoked.
+    """
+    now = datetime.utcnow()
+    repo = TokenRevocationRepository(session)
+    revocation = await repo.revoke_person(
+        person_id=person_id,
+        revoked_before=now,
+        expires_at=now + ACCESS_TOKEN_LIFETIME,
+    )
+    revocations.apply(revocation)
+
+
 async def get_admin_person(
     current_person: dict[str, Any] = Depends(get_current_person),
 ) -> dict[str, Any]:
@@ -109,3 +263,28 @@ async def get_admin_person(
             detail="Admin privileges required",
         )
     return current_person
+
+
+async def require_step_up(
+    current_person: dict[str, Any] = Depends(get_current_person),
+) -> dict[str, Any]:
+    """Ensure the request carries a step-up token from ``/auth/step-up``.
+
+    Destructive routes require the caller to have confirmed their PIN
+    within the step-up TTL, not just to hold a 7-day access token.
+
+    Args:
+        current_person: Current authenticated person.
+
+    Returns:
+        dict: Authenticated person data from the step-up token.
+
+    Raises:
+        HTTPException: If the token is not a step-up token.
+    """
+    if current_person.get("scope") != STEP_UP_SCOPE:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="PIN confirmation required",
+        )
+    return current_person
@@ -2,18 +2,115 @@
 
 from __future__ import annotations
 
-from typing import AsyncGenerator
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, AsyncGenerator
 
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
-from choreboss.config import get_config
+from choreboss.config import Settings, get_config
+
+sql_logger = logging.getLogger("choreboss.sql")
 
 # Lazy initialization - don't create engine at import time
 _engine = None
 _AsyncSessionLocal = None
 
 
+@dataclass
+class PoolWaitStats:
+    """How long requests waited to check a connection out of the pool."""
+
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+
+    @property
+    def mean_ms(self) -> float:
+        """Mean checkout wait in milliseconds."""
+        return self.total_ms / self.count if self.count else 0.0
+
+
+pool_wait_stats = PoolWaitStats()
+_pool_wait_lock = threading.Lock()
+
+
+class TimedQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long each checkout waited."""
+
+    def _do_get(self):
+        """Check out a connection, timing the wait."""
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            with _pool_wait_lock:
+                pool_wait_stats.count += 1
+                pool_wait_stats.total_ms += elapsed_ms
+                pool_wait_stats.max_ms = max(
+                    pool_wait_stats.max_ms, elapsed_ms
+                )
+
+
+def _engine_options(config: Settings) -> dict[str, Any]:
+    """Build ``create_async_engine`` keyword arguments from settings.
+
+    Pool sizing does not apply to in-memory SQLite, and the statement
+    cache size is an asyncpg connect argument.
+
+    Args:
+        config: Application settings.
+
+    Returns:
+        dict: Engine keyword arguments.
+    """
+    options: dict[str, Any] = {
+        "echo": config.db_echo,
+        "future": True,
+    }
+    if ":memory:" not in config.database_url:
+        options.update(
+            poolclass=TimedQueuePool,
+            pool_size=config.db_pool_size,
+            max_overflow=config.db_max_overflow,
+            pool_timeout=config.db_pool_timeout,
+            pool_recycle=config.db_pool_recycle,
+            pool_pre_ping=config.db_pool_pre_ping,
+        )
+    if "+asyncpg" in config.database_url:
+        options["connect_args"] = {
+            "statement_cache_size": config.db_statement_cache_size,
+        }
+    return options
+
+
+def install_statement_logger(engine: Engine, min_duration_ms: float) -> None:
+    """Log each SQL statement with its duration to ``choreboss.sql``.
+
+    Args:
+        engine: Sync engine to instrument.
+        min_duration_ms: Only log statements at least this slow.
+    """
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _start(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _finish(conn, cursor, statement, parameters, context, executemany):
+        start = conn.info["query_start"].pop()
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        if elapsed_ms >= min_duration_ms:
+            sql_logger.info("%.2f ms %s", elapsed_ms, statement)
+
+
 def _get_engine():
     """Get or create the async engine.
 
@@ -25,9 +122,13 @@ def _get_engine():
         config = get_config()
         _engine = create_async_engine(
             config.database_url,
-            echo=config.debug,
-            future=True,
+            **_engine_options(config),
         )
+        if config.sql_log_statements:
+            install_statement_logger(
+                _engine.sync_engine,
+                config.sql_log_min_duration_ms,
+            )
     return _engine
 
 
@@ -0,0 +1,94 @@
+"""Conditional GETs keyed on the household data version."""
+
+from __future__ import annotations
+
+import hashlib
+from urllib.parse import parse_qsl, urlencode
+
+from fastapi import Depends, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.dependencies.db import get_session
+from choreboss.repositories import get_data_version
+
+
+class NotModified(Exception):
+    """The client's cached representation is still current."""
+
+    def __init__(self, etag: str) -> None:
+        """Initialize the exception.
+
+        Args:
+            etag: Entity tag the client already holds.
+        """
+        super().__init__(etag)
+        self.etag = etag
+
+
+def compute_etag(version: int, path: str, query: str) -> str:
+    """Build a strong entity tag for a read at a data version.
+
+    The representation of every list and detail endpoint is fully
+    determined by the data version and the request URL, so the tag needs
+    neither the rows nor their serialized form.
+
+    Args:
+        version: Household data version.
+        path: Request path.
+        query: Raw query string.
+
+    Returns:
+        str: Quoted entity tag.
+    """
+    canonical = urlencode(sorted(parse_qsl(query, keep_blank_values=True)))
+    digest = hashlib.sha256(f"{path}?{canonical}".encode()).hexdigest()
+    return f'"{version}-{digest[:16]}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Check an ``If-None-Match`` header against an entity tag.
+
+    Args:
+        if_none_match: Raw header value.
+        etag: Current entity tag.
+
+    Returns:
+        bool: True if the client already holds this representation.
+    """
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+async def conditional_get(
+    request: Request,
+    response: Response,
+    session: AsyncSession = Depends(get_session),
+) -> str:
+    """Tag the response and short-circuit if the client is current.
+
+    Declare it after the authentication dependency so unauthenticated
+    requests are rejected before the version is revealed.
+
+    Args:
+        request: Incoming request.
+        response: Response whose headers the endpoint will use.
+        session: Database session.
+
+    Returns:
+        str: Entity tag of the response.
+
+    Raises:
+        NotModified: If ``If-None-Match`` matches the current tag.
+    """
+    version = await get_data_version(session)
+    etag = compute_etag(version, request.url.path, request.url.query)
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        raise NotModified(etag)
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "no-cache"
+    return etag
@@ -0,0 +1,52 @@
+"""Opt-in relationship expansion via ``?expand=``."""
+
+from __future__ import annotations
+
+from fastapi import HTTPException, Query, status
+
+
+class ExpandParam:
+    """Dependency parsing a comma-separated ``?expand=`` parameter.
+
+    Example:
+        ``expand: frozenset[str] = Depends(ExpandParam("assignee"))``
+    """
+
+    def __init__(self, *choices: str) -> None:
+        """Initialize the dependency.
+
+        Args:
+            choices: Relationship names the endpoint can expand.
+        """
+        self.choices = frozenset(choices)
+
+    def __call__(
+        self,
+        expand: str | None = Query(
+            None,
+            description="Comma-separated relationships to embed",
+        ),
+    ) -> frozenset[str]:
+        """Parse and validate the requested expansions.
+
+        Args:
+            expand: Raw query parameter value.
+
+        Returns:
+            frozenset: Requested relationship names.
+
+        Raises:
+            HTTPException: If an unknown relationship is requested.
+        """
+        if not expand:
+            return frozenset()
+        requested = frozenset(
+            part.strip() for part in expand.split(",") if part.strip()
+        )
+        unknown = requested - self.choices
+        if unknown:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Cannot expand: {', '.join(sorted(unknown))}",
+            )
+        return requested
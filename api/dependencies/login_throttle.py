@@ -0,0 +1,421 @@
+"""Failed-login throttling with exponential backoff."""
+
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import partial
+from typing import Any
+
+from choreboss.config import get_config
+
+
+@dataclass
+class ThrottleState:
+    """Failure history for one throttle key."""
+
+    failures: int = 0
+    blocked_until: float = 0.0
+    last_failure: float = 0.0
+
+
+Updater = Callable[[ThrottleState | None], ThrottleState | None]
+
+
+class MemoryThrottleBackend:
+    """Per-process throttle state, bounded by LRU eviction."""
+
+    # Calls never wait on I/O, so they can run on the event loop
+    blocking = False
+
+    def __init__(self, max_entries: int = 10_000) -> None:
+        """Initialize the backend.
+
+        Args:
+            max_entries: Maximum number of keys to remember.
+        """
+        self.max_entries = max_entries
+        self._states: OrderedDict[str, ThrottleState] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> ThrottleState | None:
+        """Get the state for a key.
+
+        Args:
+            key: Throttle key.
+
+        Returns:
+            ThrottleState: Current state or None.
+        """
+        with self._lock:
+            return self._states.get(key)
+
+    def update(self, key: str, updater: Updater) -> None:
+        """Atomically replace the state for a key.
+
+        Args:
+            key: Throttle key.
+            updater: Maps the current state to the new one (None deletes).
+        """
+        with self._lock:
+            state = updater(self._states.get(key))
+            if state is None:
+                self._states.pop(key, None)
+                return
+            self._states[key] = state
+            self._states.move_to_end(key)
+            while len(self._states) > self.max_entries:
+                self._states.popitem(last=False)
+
+    def clear(self) -> None:
+        """Forget every key."""
+        with self._lock:
+            self._states.clear()
+
+
+class SqliteThrottleBackend:
+    """Throttle state in a SQLite file shared by every local worker.
+
+    Each update runs in a ``BEGIN IMMEDIATE`` transaction so concurrent
+    workers serialize their read-modify-write on the same key. Calls can
+    wait up to 5 s for the file lock, so ``LoginThrottle.run`` moves them
+    off the event loop.
+    """
+
+    blocking = True
+
+    def __init__(self, path: str) -> None:
+        """Open (and if needed create) the throttle database.
+
+        Args:
+            path: SQLite database file path.
+        """
+        self.path = path
+        self._local = threading.local()
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS login_throttle ("
+                "key TEXT PRIMARY KEY, failures INTEGER NOT NULL, "
+                "blocked_until REAL NOT NULL, last_failure REAL NOT NULL)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        """Get this thread's connection."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self.path, timeout=5, isolation_level=None
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str) -> ThrottleState | None:
+        """Get the state for a key.
+
+        Args:
+            key: Throttle key.
+
+        Returns:
+            ThrottleState: Current state or None.
+        """
+        row = self._connect().execute(
+            "SELECT failures, blocked_until, last_failure "
+            "FROM login_throttle WHERE key = ?",
+            (key,),
+        ).fetchone()
+        return ThrottleState(*row) if row else None
+
+    def update(self, key: str, updater: Updater) -> None:
+        """Atomically replace the state for a key.
+
+        Args:
+            key: Throttle key.
+            updater: Maps the current state to the new one (None deletes).
+        """
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            state = updater(self.get(key))
+            if state is None:
+                conn.execute(
+                    "DELETE FROM login_throttle WHERE key = ?", (key,)
+                )
+            else:
+                conn.execute(
+                    "INSERT OR REPLACE INTO login_throttle "
+                    "VALUES (?, ?, ?, ?)",
+                    (
+                        key,
+                        state.failures,
+                        state.blocked_until,
+                        state.last_failure,
+                    ),
+                )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def clear(self) -> None:
+        """Forget every key."""
+        self._connect().execute("DELETE FROM login_throttle")
+
+
+class LoginThrottle:
+    """Rejects login attempts before any PIN hashing once failures pile up.
+
+    Failures are tracked per normalized login name and per client address.
+    After ``free_attempts`` failures a key is blocked for ``base_delay``
+    seconds, doubling with each further failure up to ``max_delay``. A key
+    that sees no failures for ``window`` seconds starts over. Clients get a
+    larger allowance than single login names, so a shared household device
+    is not locked out by one person's typos.
+
+    Request handlers call ``reserve`` before hashing, which counts the
+    attempt as a failure in the same atomic update that checks the
+    lockout, so concurrent guesses cannot all slip past one check. A
+    good PIN then refunds the reservation with ``record_success``.
+    """
+
+    def __init__(
+        self,
+        backend: MemoryThrottleBackend | SqliteThrottleBackend,
+        free_attempts: int,
+        client_free_attempts: int,
+        base_delay: float,
+        max_delay: float,
+        window: float,
+    ) -> None:
+        """Initialize the throttle.
+
+        Args:
+            backend: Where throttle state is kept.
+            free_attempts: Failures allowed per login name before backoff.
+            client_free_attempts: Failures allowed per client before backoff.
+            base_delay: First lockout length in seconds.
+            max_delay: Longest lockout in seconds.
+            window: Idle seconds after which failures are forgotten.
+        """
+        self.backend = backend
+        self.free_attempts = free_attempts
+        self.client_free_attempts = client_free_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.window = window
+
+    @staticmethod
+    def _keys(
+        login_name: str | None,
+        client: str,
+        person_id: int | None = None,
+    ) -> dict[str, str]:
+        """Build throttle keys for an attempt."""
+        if person_id is not None:
+            subject = f"person:{person_id}"
+        else:
+            subject = f"login:{login_name.strip().lower()}"
+        return {"login": subject, "client": f"client:{client}"}
+
+    def _allowances(self, keys: dict[str, str]) -> dict[str, int]:
+        """Map each throttle key to its free attempts."""
+        return {
+            keys["login"]: self.free_attempts,
+            keys["client"]: self.client_free_attempts,
+        }
+
+    async def run(self, method: Callable[..., Any], *args, **kwargs) -> Any:
+        """Call a throttle method without blocking the event loop.
+
+        Args:
+            method: Bound method of this throttle, e.g. ``self.reserve``.
+            *args: Positional arguments for ``method``.
+            **kwargs: Keyword arguments for ``method``.
+
+        Returns:
+            Any: What ``method`` returned.
+        """
+        if self.backend.blocking:
+            return await asyncio.to_thread(method, *args, **kwargs)
+        return method(*args, **kwargs)
+
+    def retry_after(
+        self,
+        login_name: str | None,
+        client: str,
+        person_id: int | None = None,
+    ) -> float:
+        """Seconds until an attempt is allowed, or 0 if it is allowed now.
+
+        Args:
+            login_name: Login name being attempted.
+            client: Client address.
+            person_id: Key on this person instead of a login name.
+
+        Returns:
+            float: Remaining lockout in seconds.
+        """
+        now = time.time()
+        wait = 0.0
+        for key in self._keys(login_name, client, person_id).values():
+            state = self.backend.get(key)
+            if state is not None:
+                wait = max(wait, state.blocked_until - now)
+        return wait
+
+    def reserve(
+        self,
+        login_name: str | None,
+        client: str,
+        person_id: int | None = None,
+    ) -> float:
+        """Admit an attempt by counting it as a failure up front.
+
+        Each key is checked and bumped in one atomic backend update. If a
+        key is locked out, keys already bumped for this attempt are
+        refunded and nothing is counted.
+
+        Args:
+            login_name: Login name being attempted.
+            client: Client address.
+            person_id: Key on this person instead of a login name.
+
+        Returns:
+            float: 0 if the attempt may proceed, else the remaining
+                lockout in seconds.
+        """
+        now = time.time()
+        allowances = self._allowances(
+            self._keys(login_name, client, person_id)
+        )
+        bumped = []
+        for key, allowance in allowances.items():
+            wait = [0.0]
+
+            def admit(state, allowance=allowance, wait=wait):
+                if state is not None and state.blocked_until > now:
+                    wait[0] = state.blocked_until - now
+                    return state
+                return self._bump(state, now=now, allowance=allowance)
+
+            self.backend.update(key, admit)
+            if wait[0] > 0:
+                for done in bumped:
+                    self.backend.update(
+                        done,
+                        partial(self._refund, allowance=allowances[done]),
+                    )
+                return wait[0]
+            bumped.append(key)
+        return 0.0
+
+    def record_failure(
+        self,
+        login_name: str | None,
+        client: str,
+        person_id: int | None = None,
+    ) -> None:
+        """Record a failed attempt and extend lockouts as needed.
+
+        Args:
+            login_name: Login name that was attempted.
+            client: Client address.
+            person_id: Key on this person instead of a login name.
+        """
+        now = time.time()
+        allowances = self._allowances(
+            self._keys(login_name, client, person_id)
+        )
+        for key, allowance in allowances.items():
+            self.backend.update(
+                key,
+                partial(self._bump, now=now, allowance=allowance),
+            )
+
+    def _bump(
+        self,
+        state: ThrottleState | None,
+        now: float,
+        allowance: int,
+    ) -> ThrottleState:
+        """Return ``state`` with one more failure applied."""
+        if state is None or now - state.last_failure > self.window:
+            state = ThrottleState()
+        failures = state.failures + 1
+        blocked_until = state.blocked_until
+        excess = failures - allowance
+        if excess > 0:
+            delay = min(self.base_delay * 2 ** (excess - 1), self.max_delay)
+            blocked_until = now + delay
+        return ThrottleState(failures, blocked_until, now)
+
+    @staticmethod
+    def _refund(
+        state: ThrottleState | None,
+        allowance: int,
+    ) -> ThrottleState | None:
+        """Return ``state`` with one reserved failure taken back."""
+        if state is None or state.failures <= 1:
+            return None
+        failures = state.failures - 1
+        blocked_until = state.blocked_until if failures > allowance else 0.0
+        return ThrottleState(failures, blocked_until, state.last_failure)
+
+    def record_success(
+        self,
+        login_name: str | None,
+        client: str,
+        person_id: int | None = None,
+        reserved: bool = False,
+    ) -> None:
+        """Clear the login name's failure history after a good login.
+
+        Client history is left to decay so one valid account cannot be
+        used to reset a client that is guessing at others; only this
+        attempt's own reservation is refunded.
+
+        Args:
+            login_name: Login name that succeeded.
+            client: Client address.
+            person_id: Key on this person instead of a login name.
+            reserved: Whether the attempt went through ``reserve``.
+        """
+        keys = self._keys(login_name, client, person_id)
+        self.backend.update(keys["login"], lambda state: None)
+        if reserved:
+            self.backend.update(
+                keys["client"],
+                partial(self._refund, allowance=self.client_free_attempts),
+            )
+
+
+_throttle: LoginThrottle | None = None
+
+
+def get_login_throttle() -> LoginThrottle:
+    """Get the process-wide login throttle singleton.
+
+    Returns:
+        LoginThrottle: Throttle configured from settings.
+    """
+    global _throttle
+    if _throttle is None:
+        config = get_config()
+        if config.login_throttle_sqlite_path:
+            backend = SqliteThrottleBackend(config.login_throttle_sqlite_path)
+        else:
+            backend = MemoryThrottleBackend()
+        _throttle = LoginThrottle(
+            backend=backend,
+            free_attempts=config.login_throttle_free_attempts,
+            client_free_attempts=config.login_throttle_client_free_attempts,
+            base_delay=config.login_throttle_base_delay_seconds,
+            max_delay=config.login_throttle_max_delay_seconds,
+            window=config.login_throttle_window_seconds,
+        )
+    return _throttle
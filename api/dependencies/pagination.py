@@ -0,0 +1,55 @@
+"""Opaque keyset cursors for paginated listings."""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from typing import Any
+
+from fastapi import HTTPException, status
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+def encode_cursor(key: list[Any]) -> str:
+    """Encode the sort key of a page's last row as a cursor token.
+
+    Args:
+        key: JSON-serializable sort key values, in ORDER BY order.
+
+    Returns:
+        str: URL-safe cursor token.
+    """
+    raw = json.dumps(key, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str | None, size: int) -> list[Any] | None:
+    """Decode a cursor token back into its sort key.
+
+    Args:
+        cursor: Token from a previous page, or None for the first page.
+        size: Number of sort key values the listing expects.
+
+    Returns:
+        list: Sort key values, or None for the first page.
+
+    Raises:
+        HTTPException: If the token is malformed or was issued by a
+            listing with a different sort order.
+    """
+    if cursor is None:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        key = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, ValueError):
+        key = None
+    if not isinstance(key, list) or len(key) != size:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        )
+    return key
@@ -0,0 +1,140 @@
+"""In-memory mirror of persisted token revocations."""
+
+from __future__ import annotations
+
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from choreboss.models.revoked_token import RevokedToken
+from choreboss.repositories import TokenRevocationRepository
+
+
+def _timestamp(value: datetime) -> float:
+    """Convert a naive UTC datetime column value to a Unix timestamp."""
+    return value.replace(tzinfo=timezone.utc).timestamp()
+
+
+class TokenRevocationStore:
+    """Per-worker mirror of the ``revoked_tokens`` table.
+
+    Checks are pure in-memory lookups: an exact set of revoked token IDs
+    and a per-person "revoked before" watermark. The mirror catches up with
+    revocations written by other workers at most once per
+    ``sync_interval`` seconds, so requests never pay a database round trip
+    just to be authorized.
+
+    Rows become visible at commit, not in ``id`` or ``created_at`` order,
+    so each sync re-reads everything created within ``sync_overlap``
+    seconds of the newest row already seen. Applying a row twice is
+    harmless, so the overlap only costs a few repeated rows.
+    """
+
+    def __init__(
+        self,
+        sync_interval: float,
+        sync_overlap: float = 60.0,
+    ) -> None:
+        """Initialize an empty store.
+
+        Args:
+            sync_interval: Minimum seconds between database syncs.
+            sync_overlap: Seconds re-read before the newest synced row;
+                longer than any revoking transaction plus clock skew.
+        """
+        self.sync_interval = sync_interval
+        self.sync_overlap = timedelta(seconds=sync_overlap)
+        self._jtis: dict[str, float] = {}
+        self._person_watermarks: dict[int, float] = {}
+        self._created_until: datetime | None = None
+        self._last_sync = float("-inf")
+        self._lock = threading.Lock()
+
+    def apply(self, revocation: RevokedToken) -> None:
+        """Apply a revocation row to the in-memory mirror.
+
+        Args:
+            revocation: Persisted revocation.
+        """
+        with self._lock:
+            if revocation.jti is not None:
+                self._jtis[revocation.jti] = _timestamp(
+                    revocation.expires_at
+                )
+            if revocation.person_id is not None:
+                watermark = _timestamp(revocation.revoked_before)
+                current = self._person_watermarks.get(revocation.person_id)
+                if current is None or watermark > current:
+                    self._person_watermarks[revocation.person_id] = watermark
+
+    def is_revoked(
+        self,
+        person_id: int,
+        jti: str | None,
+        issued_at: float | None,
+    ) -> bool:
+        """Check whether a token has been revoked.
+
+        Args:
+            person_id: Token subject.
+            jti: Token identifier, if the token carries one.
+            issued_at: Token ``iat``, if the token carries one.
+
+        Returns:
+            bool: True if the token must be rejected.
+        """
+        if jti is not None and jti in self._jtis:
+            return True
+        watermark = self._person_watermarks.get(person_id)
+        if watermark is None:
+            return False
+        return issued_at is None or issued_at <= watermark
+
+    async def sync(self, session: AsyncSession) -> None:
+        """Load revocations recorded since the last sync.
+
+        Args:
+            session: Database session to read from.
+        """
+        repo = TokenRevocationRepository(session)
+        since = None
+        if self._created_until is not None:
+            since = self._created_until - self.sync_overlap
+        for revocation in await repo.get_revocations_since(since):
+            self.apply(revocation)
+            if (
+                self._created_until is None
+                or revocation.created_at > self._created_until
+            ):
+                self._created_until = revocation.created_at
+        self._last_sync = time.monotonic()
+        self._prune()
+
+    async def maybe_sync(self, session: AsyncSession) -> None:
+        """Sync from the database if the sync interval has elapsed.
+
+        Args:
+            session: Database session to read from.
+        """
+        if time.monotonic() - self._last_sync >= self.sync_interval:
+            await self.sync(session)
+
+    def _prune(self) -> None:
+        """Forget token IDs whose tokens have expired anyway."""
+        now = time.time()
+        with self._lock:
+            self._jtis = {
+                jti: expires_at
+                for jti, expires_at in self._jtis.items()
+                if expires_at > now
+            }
+
+    def reset(self) -> None:
+        """Drop all state so the next check resyncs from scratch."""
+        with self._lock:
+            self._jtis.clear()
+            self._person_watermarks.clear()
+            self._created_until = None
+            self._last_sync = float("-inf")
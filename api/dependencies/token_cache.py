@@ -0,0 +1,111 @@
+"""Bounded cache of validated JWT claims."""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+
+class TokenClaimsCache:
+    """LRU cache mapping a token digest to its validated claims.
+
+    Entries are keyed by the SHA-256 of the raw token so the cache never
+    holds bearer credentials, and each entry is dropped once the token's
+    ``exp`` passes, so a cached token can never outlive its signature.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_size: Maximum number of tokens to remember.
+        """
+        self.max_size = max_size
+        self._entries: OrderedDict[str, tuple[float, dict[str, Any]]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def digest(token: str) -> str:
+        """Compute the cache key for a raw token.
+
+        Args:
+            token: Encoded JWT.
+
+        Returns:
+            str: Hex SHA-256 digest.
+        """
+        return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+    def get(self, token: str) -> dict[str, Any] | None:
+        """Return cached claims for a token if present and unexpired.
+
+        Args:
+            token: Encoded JWT.
+
+        Returns:
+            dict: Copy of the cached claims, or None on a miss.
+        """
+        key = self.digest(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, claims = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return dict(claims)
+
+    def put(
+        self,
+        token: str,
+        claims: dict[str, Any],
+        expires_at: float,
+    ) -> None:
+        """Remember validated claims until the token expires.
+
+        Args:
+            token: Encoded JWT.
+            claims: Validated claims to return on later hits.
+            expires_at: Token ``exp`` as a Unix timestamp.
+        """
+        if self.max_size <= 0:
+            return
+        key = self.digest(token)
+        with self._lock:
+            self._entries[key] = (expires_at, dict(claims))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def compact(self) -> int:
+        """Drop entries for tokens that have expired.
+
+        Returns:
+            int: Number of entries dropped.
+        """
+        now = time.time()
+        with self._lock:
+            expired = [
+                key
+                for key, (expires_at, _) in self._entries.items()
+                if expires_at <= now
+            ]
+            for key in expired:
+                del self._entries[key]
+            return len(expired)
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        """Return the number of cached entries."""
+        return len(self._entries)
@@ -3,11 +3,22 @@
 from __future__ import annotations
 
 from contextlib import asynccontextmanager
+from dataclasses import asdict
+from typing import Any
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, Response
 
-from api.routers import auth, chores, people
+from api.dependencies import db
+from api.dependencies.etag import NotModified
+from api.routers import auth, changes, chores, events, people, stats
+from api.scheduler import Scheduler
+from api.tasks import build_jobs
+from choreboss.config import get_config
+from choreboss.hashing import PasswordHasherOverloaded, get_password_hasher
+from choreboss.repositories import list_cache
+from choreboss.security import get_pin_pepper
 
 
 @asynccontextmanager
@@ -15,9 +26,15 @@ async def lifespan(app: FastAPI):
     """Startup and shutdown hooks."""
     # Startup
     print("🚀 ChoreBoss API starting...")
+    config = get_config()
+    scheduler = Scheduler(build_jobs(config))
+    if config.scheduler_enabled:
+        scheduler.start()
     yield
     # Shutdown
     print("🛑 ChoreBoss API shutting down...")
+    await scheduler.stop()
+    get_password_hasher().shutdown()
 
 
 def create_app() -> FastAPI:
@@ -25,7 +42,11 @@ def create_app() -> FastAPI:
 
     Returns:
         FastAPI: Configured application instance.
+
+    Raises:
+        RuntimeError: If ``PIN_PEPPER`` is not set.
     """
+    get_pin_pepper()
     app = FastAPI(
         title="ChoreBoss API",
         description="Household chore tracker API",
@@ -40,12 +61,95 @@ def create_app() -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=["ETag"],
     )
 
     # Include routers
     app.include_router(auth.router, prefix="/api/auth", tags=["auth"])
     app.include_router(chores.router, prefix="/api/chores", tags=["chores"])
     app.include_router(people.router, prefix="/api/people", tags=["people"])
+    app.include_router(
+        changes.router, prefix="/api/changes", tags=["changes"]
+    )
+    app.include_router(events.router, prefix="/api/events", tags=["events"])
+    app.include_router(stats.router, prefix="/api/stats", tags=["stats"])
+
+    @app.exception_handler(PasswordHasherOverloaded)
+    async def hasher_overloaded_handler(
+        request: Request,
+        exc: PasswordHasherOverloaded,
+    ) -> JSONResponse:
+        """Shed load when the PIN hashing queue is full.
+
+        Returns:
+            JSONResponse: 503 response asking the client to retry.
+        """
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={"detail": "Server busy, please retry"},
+            headers={"Retry-After": "1"},
+        )
+
+    @app.exception_handler(NotModified)
+    async def not_modified_handler(
+        request: Request,
+        exc: NotModified,
+    ) -> Response:
+        """Answer a conditional GET whose representation is unchanged.
+
+        Returns:
+            Response: Empty 304 response carrying the entity tag.
+        """
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={"ETag": exc.etag, "Cache-Control": "no-cache"},
+        )
+
+    @app.get("/api/health/hashing")
+    async def hashing_metrics() -> dict[str, Any]:
+        """Password hasher timing and queue metrics.
+
+        Returns:
+            dict: Per-operation counts and timings plus queue state.
+        """
+        stats = get_password_hasher().stats()
+        return {
+            "hash": {**asdict(stats.hash), "mean_ms": stats.hash.mean_ms},
+            "verify": {
+                **asdict(stats.verify),
+                "mean_ms": stats.verify.mean_ms,
+            },
+            "rejected": stats.rejected,
+            "in_flight": stats.in_flight,
+        }
+
+    @app.get("/api/health/db")
+    async def db_pool_metrics() -> dict[str, Any]:
+        """Connection pool state and checkout wait times.
+
+        Returns:
+            dict: Pool status plus checkout wait statistics.
+        """
+        stats = db.pool_wait_stats
+        return {
+            "pool": db._get_engine().pool.status(),
+            "checkout_wait": {**asdict(stats), "mean_ms": stats.mean_ms},
+        }
+
+    @app.get("/api/health/cache")
+    async def list_cache_metrics() -> dict[str, Any]:
+        """Chore and people list cache counters.
+
+        Returns:
+            dict: Hit, miss, invalidation and eviction counts plus size.
+        """
+        stats = list_cache.stats()
+        return {
+            **asdict(stats),
+            "hit_ratio": stats.hit_ratio,
+            "size": len(list_cache),
+            "max_entries": list_cache.max_entries,
+        }
 
     @app.get("/api/health")
     async def health_check() -> dict[str, str]:
@@ -2,6 +2,6 @@
 
 from __future__ import annotations
 
-from api.routers import auth, chores, people
+from api.routers import auth, changes, chores, events, people, stats
 
-__all__ = ["auth", "chores", "people"]
+__all__ = ["auth", "changes", "chores", "events", "people", "stats"]
@@ -2,14 +2,29 @@
 
 from __future__ import annotations
 
+from datetime import timedelta
 from typing import Any
 import logging
+import math
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from api.dependencies import create_access_token, get_session
-from api.schemas import PersonLogin, TokenResponse
+from api.dependencies import (
+    STEP_UP_SCOPE,
+    create_access_token,
+    get_current_person,
+    get_session,
+    revoke_token,
+)
+from api.dependencies.login_throttle import get_login_throttle
+from api.schemas import (
+    PersonLogin,
+    StepUpRequest,
+    StepUpResponse,
+    TokenResponse,
+)
+from choreboss.config import get_config
 from choreboss.repositories import PeopleRepository
 from choreboss.services import PeopleService
 
@@ -19,19 +34,27 @@ router = APIRouter()
 @router.post("/login", response_model=TokenResponse)
 async def login(
     credentials: PersonLogin,
+    request: Request,
     session: AsyncSession = Depends(get_session),
 ) -> dict[str, Any]:
     """Authenticate person with PIN and return JWT token.
 
+    Repeated failures for a login name or client are throttled with
+    exponential backoff; throttled attempts get 429 before any lookup or
+    PIN hashing happens. Each attempt is counted as a failure before the
+    PIN is checked and refunded if it succeeds, so concurrent guesses
+    cannot all pass the same lockout check.
+
     Args:
         credentials: Login credentials (login_name, pin).
+        request: Incoming request (for the client address).
         session: Database session.
 
     Returns:
         dict: JWT token and person info.
 
     Raises:
-        HTTPException: If person not found or PIN invalid.
+        HTTPException: If throttled, person not found or PIN invalid.
     """
     people_repo = PeopleRepository(session)
     service = PeopleService(people_repo)
@@ -41,19 +64,41 @@ async def login(
     # Normalize login name (case-insensitive usernames)
     login_name = credentials.login_name.strip().lower()
     logger.debug("Normalized login_name=%s", login_name)
-    person = await service.get_person_by_login_name(login_name)
+
+    throttle = get_login_throttle()
+    client = request.client.host if request.client else "unknown"
+    retry_after = await throttle.run(throttle.reserve, login_name, client)
+    if retry_after > 0:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many failed login attempts",
+            headers={"Retry-After": str(math.ceil(retry_after))},
+        )
+
+    person = await service.get_auth_principal_by_login_name(login_name)
     if not person:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Person not found",
         )
 
-    # Verify PIN (bcrypt comparison)
-    if not service.verify_pin(credentials.pin, person.pin):
+    # Verify PIN (bcrypt comparison in the hashing pool)
+    if not await service.verify_pin(credentials.pin, person.pin):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid PIN",
         )
+    await throttle.run(
+        throttle.record_success,
+        login_name,
+        client,
+        reserved=True,
+    )
+
+    # Backfill the lookup fingerprint for people created before it existed
+    if person.pin_fingerprint is None:
+        await service.backfill_pin_fingerprint(person.id, credentials.pin)
+        await session.commit()
 
     # Create token
     access_token = create_access_token(
@@ -67,3 +112,111 @@ async def login(
         "person_id": person.id,
         "is_admin": person.is_admin,
     }
+
+
+@router.post(
+    "/logout",
+    status_code=status.HTTP_204_NO_CONTENT,
+    response_model=None,
+)
+async def logout(
+    session: AsyncSession = Depends(get_session),
+    current_person: dict[str, Any] = Depends(get_current_person),
+) -> None:
+    """Revoke the bearer token used for this request.
+
+    Args:
+        session: Database session.
+        current_person: Authenticated person.
+    """
+    await revoke_token(session, current_person)
+    await session.commit()
+
+
+@router.post("/step-up", response_model=StepUpResponse)
+async def step_up(
+    confirmation: StepUpRequest,
+    request: Request,
+    session: AsyncSession = Depends(get_session),
+    current_person: dict[str, Any] = Depends(get_current_person),
+) -> dict[str, Any]:
+    """Confirm the caller's PIN and issue a short-lived elevated token.
+
+    Clients hold the step-up token for its TTL and send it on routes
+    guarded by ``require_step_up``, so a burst of admin edits pays the
+    bcrypt cost once. A refreshed access token is only returned when the
+    person's role changed since the caller's token was issued. Wrong
+    PINs are throttled per person and per client, as logins are.
+
+    Args:
+        confirmation: PIN to confirm.
+        request: Incoming request (for the client address).
+        session: Database session.
+        current_person: Authenticated person.
+
+    Returns:
+        dict: Step-up token, its TTL in seconds and, if the role changed,
+            a fresh access token.
+
+    Raises:
+        HTTPException: If throttled, person not found or PIN invalid.
+    """
+    people_repo = PeopleRepository(session)
+    service = PeopleService(people_repo)
+    person_id = current_person["person_id"]
+    throttle = get_login_throttle()
+    client = request.client.host if request.client else "unknown"
+    retry_after = await throttle.run(
+        throttle.reserve,
+        None,
+        client,
+        person_id=person_id,
+    )
+    if retry_after > 0:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many failed PIN confirmations",
+            headers={"Retry-After": str(math.ceil(retry_after))},
+        )
+
+    person = await service.get_auth_principal_by_id(person_id)
+    if not person:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Person not found",
+        )
+
+    if not await service.verify_pin(confirmation.pin, person.pin):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid PIN",
+        )
+    await throttle.run(
+        throttle.record_success,
+        None,
+        client,
+        person_id=person_id,
+        reserved=True,
+    )
+
+    access_token = None
+    if person.is_admin != current_person["is_admin"]:
+        access_token = create_access_token(
+            person_id=person.id,
+            is_admin=person.is_admin,
+        )
+    ttl = get_config().step_up_ttl_seconds
+    return {
+        "step_up_token": create_access_token(
+            person_id=person.id,
+            is_admin=person.is_admin,
+            expires_delta=timedelta(seconds=ttl),
+            scope=STEP_UP_SCOPE,
+        ),
+        "expires_in": ttl,
+        "scope": STEP_UP_SCOPE,
+        "access_token": access_token,
+        "token_type": "bearer",
+        "person_id": person.id,
+        "is_admin": person.is_admin,
+    }
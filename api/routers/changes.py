@@ -0,0 +1,71 @@
+"""Delta sync router."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.dependencies import get_current_person, get_session
+from api.dependencies.etag import conditional_get
+from api.dependencies.pagination import decode_cursor, encode_cursor
+from api.schemas import ChangeSet
+from choreboss.repositories import (
+    ChangeRepository,
+    ChoreRepository,
+    PeopleRepository,
+)
+from choreboss.services import SyncService
+
+router = APIRouter()
+
+
+@router.get("", response_model=ChangeSet)
+async def list_changes(
+    since: str | None = None,
+    session: AsyncSession = Depends(get_session),
+    current_person: dict[str, Any] = Depends(get_current_person),
+    etag: str = Depends(conditional_get),
+) -> dict[str, Any]:
+    """List chores and people changed since a sync cursor.
+
+    Omit ``since`` for a full snapshot. Every response carries the
+    ``cursor`` to pass as ``since`` on the next poll; when nothing has
+    changed the lists are empty and the cursor is unchanged.
+
+    Args:
+        since: ``cursor`` from the previous response.
+        session: Database session.
+        current_person: Authenticated person.
+        etag: Entity tag; a matching ``If-None-Match`` gets a 304.
+
+    Returns:
+        dict: Changed rows, deleted IDs and the next cursor.
+
+    Raises:
+        HTTPException: If the cursor is invalid.
+    """
+    key = decode_cursor(since, 1)
+    service = SyncService(
+        ChangeRepository(session),
+        ChoreRepository(session),
+        PeopleRepository(session),
+    )
+    try:
+        changes = await service.changes_since(
+            None if key is None else int(key[0])
+        )
+    except (TypeError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        ) from None
+    return {
+        "full": changes.full,
+        "chores": changes.chores,
+        "people": changes.people,
+        "deleted_chores": changes.deleted_chores,
+        "deleted_people": changes.deleted_people,
+        "cursor": encode_cursor([changes.version]),
+    }
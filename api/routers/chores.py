@@ -2,51 +2,183 @@
 
 from __future__ import annotations
 
+from datetime import datetime, timezone
 from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from api.dependencies import get_admin_person, get_current_person, get_session
-from api.schemas import ChoreCreate, ChoreRead, ChoreUpdate
+from api.dependencies import (
+    get_admin_person,
+    get_current_person,
+    get_session,
+    require_step_up,
+)
+from api.dependencies.etag import conditional_get
+from api.dependencies.expand import ExpandParam
+from api.dependencies.pagination import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    decode_cursor,
+    encode_cursor,
+)
+from api.schemas import (
+    ChoreCompletionPage,
+    ChoreCreate,
+    ChorePage,
+    ChoreRead,
+    ChoreUpdate,
+)
 from choreboss.repositories import ChoreRepository, PeopleRepository
 from choreboss.services import ChoreService
 
 router = APIRouter()
+expand_chore = ExpandParam(*ChoreRepository.EXPANDABLE)
 
 
-@router.get("/", response_model=list[ChoreRead])
+@router.get("/", response_model=ChorePage)
 async def list_chores(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    assignee: int | None = None,
+    unassigned: bool = False,
+    completed_since: datetime | None = None,
+    expand: frozenset[str] = Depends(expand_chore),
     session: AsyncSession = Depends(get_session),
     current_person: dict[str, Any] = Depends(get_current_person),
-) -> list[Any]:
-    """List all chores.
+    etag: str = Depends(conditional_get),
+) -> dict[str, Any]:
+    """List chores one page at a time.
 
     Args:
+        limit: Page size.
+        cursor: ``next_cursor`` from the previous page.
+        assignee: Only chores assigned to this person.
+        unassigned: Only chores with no assignee.
+        completed_since: Only chores completed at or after this time.
+        expand: Relationships to embed (``assignee``, ``last_completer``).
         session: Database session.
         current_person: Authenticated person.
+        etag: Entity tag; a matching ``If-None-Match`` gets a 304.
 
     Returns:
-        list: All chores.
+        dict: Chores on this page and the cursor for the next one.
+
+    Raises:
+        HTTPException: If the filters conflict or the cursor is invalid.
+    """
+    if assignee is not None and unassigned:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="assignee and unassigned are mutually exclusive",
+        )
+    after = decode_cursor(cursor, 2 if completed_since else 1)
+    chore_repo = ChoreRepository(session)
+    people_repo = PeopleRepository(session)
+    service = ChoreService(chore_repo, people_repo)
+    try:
+        chores, next_key = await service.list_chores(
+            limit,
+            after=after,
+            person_id=assignee,
+            unassigned=unassigned,
+            completed_since=completed_since,
+            expand=expand,
+        )
+    except (TypeError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        ) from None
+    return {
+        "chores": chores,
+        "next_cursor": encode_cursor(next_key) if next_key else None,
+    }
+
+
+@router.get("/due", response_model=ChorePage)
+async def list_due_chores(
+    before: datetime | None = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    assignee: int | None = None,
+    unassigned: bool = False,
+    expand: frozenset[str] = Depends(expand_chore),
+    session: AsyncSession = Depends(get_session),
+    current_person: dict[str, Any] = Depends(get_current_person),
+) -> dict[str, Any]:
+    """List chores due before a time, most overdue first.
+
+    Only the due slice of ``ix_chores_next_due`` is read. No ETag: with
+    ``before`` omitted, chores fall due without any write.
+
+    Args:
+        before: Cut-off (exclusive); defaults to now (UTC), which lists
+            chores due today or earlier.
+        limit: Page size.
+        cursor: ``next_cursor`` from the previous page.
+        assignee: Only chores assigned to this person.
+        unassigned: Only chores with no assignee.
+        expand: Relationships to embed (``assignee``, ``last_completer``).
+        session: Database session.
+        current_person: Authenticated person.
+
+    Returns:
+        dict: Chores on this page and the cursor for the next one.
+
+    Raises:
+        HTTPException: If the filters conflict or the cursor is invalid.
     """
+    if assignee is not None and unassigned:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="assignee and unassigned are mutually exclusive",
+        )
+    if before is None:
+        before = datetime.utcnow()
+    elif before.tzinfo is not None:
+        # Due times are stored as naive UTC
+        before = before.astimezone(timezone.utc).replace(tzinfo=None)
+    after = decode_cursor(cursor, 2)
     chore_repo = ChoreRepository(session)
     people_repo = PeopleRepository(session)
     service = ChoreService(chore_repo, people_repo)
-    return await service.get_all_chores()
+    try:
+        chores, next_key = await service.list_due(
+            limit,
+            before,
+            after=after,
+            person_id=assignee,
+            unassigned=unassigned,
+            expand=expand,
+        )
+    except (TypeError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        ) from None
+    return {
+        "chores": chores,
+        "next_cursor": encode_cursor(next_key) if next_key else None,
+    }
 
 
 @router.get("/{chore_id}", response_model=ChoreRead)
 async def get_chore(
     chore_id: int,
+    expand: frozenset[str] = Depends(expand_chore),
     session: AsyncSession = Depends(get_session),
     current_person: dict[str, Any] = Depends(get_current_person),
+    etag: str = Depends(conditional_get),
 ) -> Any:
     """Get a specific chore.
 
     Args:
         chore_id: Chore ID.
+        expand: Relationships to embed (``assignee``, ``last_completer``).
         session: Database session.
         current_person: Authenticated person.
+        etag: Entity tag; a matching ``If-None-Match`` gets a 304.
 
     Returns:
         dict: Chore data.
@@ -57,7 +189,7 @@ async def get_chore(
     chore_repo = ChoreRepository(session)
     people_repo = PeopleRepository(session)
     service = ChoreService(chore_repo, people_repo)
-    chore = await service.get_chore_by_id(chore_id)
+    chore = await service.get_chore_by_id(chore_id, expand)
 
     if not chore:
         raise HTTPException(
@@ -68,6 +200,52 @@ async def get_chore(
     return chore
 
 
+@router.get("/{chore_id}/history", response_model=ChoreCompletionPage)
+async def get_chore_history(
+    chore_id: int,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    session: AsyncSession = Depends(get_session),
+    current_person: dict[str, Any] = Depends(get_current_person),
+    etag: str = Depends(conditional_get),
+) -> dict[str, Any]:
+    """List a chore's completions, newest first, one page at a time.
+
+    Args:
+        chore_id: Chore ID.
+        limit: Page size.
+        cursor: ``next_cursor`` from the previous page.
+        session: Database session.
+        current_person: Authenticated person.
+        etag: Entity tag; a matching ``If-None-Match`` gets a 304.
+
+    Returns:
+        dict: Completions on this page and the cursor for the next one.
+
+    Raises:
+        HTTPException: If the cursor is invalid.
+    """
+    before = decode_cursor(cursor, 2)
+    chore_repo = ChoreRepository(session)
+    people_repo = PeopleRepository(session)
+    service = ChoreService(chore_repo, people_repo)
+    try:
+        completions, next_key = await service.list_completions(
+            limit,
+            before=before,
+            chore_id=chore_id,
+        )
+    except (TypeError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        ) from None
+    return {
+        "completions": completions,
+        "next_cursor": encode_cursor(next_key) if next_key else None,
+    }
+
+
 @router.post("/", response_model=ChoreRead)
 async def create_chore(
     chore: ChoreCreate,
@@ -91,6 +269,8 @@ async def create_chore(
         name=chore.name,
         description=chore.description,
         person_id=chore.person_id,
+        recurrence=chore.recurrence.value,
+        recurrence_day=chore.recurrence_day,
     )
     await session.commit()
     return result
@@ -115,7 +295,8 @@ async def update_chore(
         dict: Updated chore.
 
     Raises:
-        HTTPException: If chore not found.
+        HTTPException: If chore not found, or the recurrence day does not
+            fit the recurrence.
     """
     chore_repo = ChoreRepository(session)
     people_repo = PeopleRepository(session)
@@ -135,19 +316,37 @@ async def update_chore(
         chore.description = chore_update.description
     if chore_update.person_id is not None:
         chore.person_id = chore_update.person_id
-
-    result = await service.update_chore(chore)
+    if chore_update.recurrence is not None:
+        chore.recurrence = chore_update.recurrence.value
+        # A new recurrence type drops a day pinned for the old one
+        chore.recurrence_day = chore_update.recurrence_day
+    elif chore_update.recurrence_day is not None:
+        chore.recurrence_day = chore_update.recurrence_day
+
+    try:
+        result = await service.update_chore(chore)
+    except ValueError as exc:
+        await session.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(exc),
+        ) from exc
     await session.commit()
     return result
 
 
-@router.delete("/{chore_id}", status_code=status.HTTP_204_NO_CONTENT, response_model=None)
+@router.delete(
+    "/{chore_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    response_model=None,
+    dependencies=[Depends(require_step_up)],
+)
 async def delete_chore(
     chore_id: int,
     session: AsyncSession = Depends(get_session),
     admin: dict[str, Any] = Depends(get_admin_person),
 ) -> None:
-    """Delete a chore (admin only).
+    """Delete a chore (admin only, with a PIN step-up token).
 
     Args:
         chore_id: Chore ID.
@@ -194,18 +393,16 @@ async def complete_chore(
     chore_repo = ChoreRepository(session)
     people_repo = PeopleRepository(session)
     service = ChoreService(chore_repo, people_repo)
-    chore = await service.get_chore_by_id(chore_id)
 
-    if not chore:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Chore not found",
-        )
-
-    # Mark complete
+    # Mark complete and rotate in one statement
     result = await service.complete_chore(
         chore_id,
         current_person["person_id"],
     )
+    if not result:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Chore not found",
+        )
     await session.commit()
     return result
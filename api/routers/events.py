@@ -0,0 +1,159 @@
+"""Live event stream router."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from collections.abc import AsyncIterator
+from typing import Any
+
+from fastapi import APIRouter, Depends, Header, Request, WebSocket
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.websockets import WebSocketDisconnect
+
+from api.dependencies import get_session, get_stream_person
+from choreboss.config import get_config
+from choreboss.events import Event, Subscription, broker, parse_event_id
+from choreboss.repositories import get_data_version
+
+router = APIRouter()
+
+# Reconnect delay suggested to EventSource clients, in milliseconds
+RETRY_MS = 3000
+
+
+def format_sse(item: Event) -> str:
+    """Encode an event as a Server-Sent Events message.
+
+    Args:
+        item: Committed event.
+
+    Returns:
+        str: ``id``/``event``/``data`` block ending in a blank line.
+    """
+    data = json.dumps(item.data, separators=(",", ":"))
+    return f"id: {item.id}\nevent: {item.type}\ndata: {data}\n\n"
+
+
+async def _next_event(
+    subscription: Subscription,
+    timeout: float,
+) -> Event | None:
+    """Wait for the next event, or None once ``timeout`` passes."""
+    try:
+        return await asyncio.wait_for(subscription.queue.get(), timeout)
+    except TimeoutError:
+        return None
+
+
+async def _subscribe(
+    session: AsyncSession,
+    last_event_id: str | None,
+) -> Subscription:
+    """Subscribe a client, then release the session before streaming.
+
+    A resuming client may have last heard from a worker that is gone or
+    from another worker, so the current data version is read to decide
+    whether this worker's history can cover what it missed.
+    """
+    resume_from = parse_event_id(last_event_id)
+    version = None
+    if resume_from is not None:
+        version = await get_data_version(session)
+    await session.close()
+    return broker.subscribe(resume_from, version)
+
+
+async def _sse_stream(
+    request: Request,
+    subscription: Subscription,
+) -> AsyncIterator[str]:
+    """Yield SSE messages until the client leaves or is dropped."""
+    heartbeat = get_config().events_heartbeat_seconds
+    try:
+        yield f"retry: {RETRY_MS}\n\n"
+        if subscription.resync:
+            # No id, so the client keeps resuming from its last event
+            yield "event: resync\ndata: {}\n\n"
+        while not subscription.dropped:
+            item = await _next_event(subscription, heartbeat)
+            if item is not None:
+                yield format_sse(item)
+            elif await request.is_disconnected():
+                break
+            else:
+                yield ": keep-alive\n\n"
+    finally:
+        broker.unsubscribe(subscription)
+
+
+@router.get("")
+async def stream_events(
+    request: Request,
+    last_event_id: str | None = Header(None),
+    session: AsyncSession = Depends(get_session),
+    current_person: dict[str, Any] = Depends(get_stream_person),
+) -> StreamingResponse:
+    """Stream committed chore, person and rotation changes as SSE.
+
+    Reconnecting clients send ``Last-Event-ID`` and get the events they
+    missed replayed. A ``resync`` event means too many were missed; the
+    client should refetch, e.g. via ``/api/changes``. A ``sync`` event
+    announces writes made through another API worker. Comment lines are
+    sent as heartbeats while idle.
+
+    Args:
+        request: Incoming request.
+        last_event_id: ID of the last event the client received.
+        session: Database session, released before streaming.
+        current_person: Authenticated person.
+
+    Returns:
+        StreamingResponse: ``text/event-stream`` response.
+    """
+    subscription = await _subscribe(session, last_event_id)
+    return StreamingResponse(
+        _sse_stream(request, subscription),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.websocket("/ws")
+async def events_websocket(
+    websocket: WebSocket,
+    last_event_id: str | None = None,
+    session: AsyncSession = Depends(get_session),
+    current_person: dict[str, Any] = Depends(get_stream_person),
+) -> None:
+    """Send the same events as ``GET /api/events`` over a WebSocket.
+
+    Each message is a JSON object with ``id``, ``type`` and ``data``;
+    idle connections get ``{"type": "heartbeat"}`` messages.
+
+    Args:
+        websocket: WebSocket connection.
+        last_event_id: ID of the last event the client received.
+        session: Database session, released before streaming.
+        current_person: Authenticated person.
+    """
+    subscription = await _subscribe(session, last_event_id)
+    await websocket.accept()
+    heartbeat = get_config().events_heartbeat_seconds
+    try:
+        if subscription.resync:
+            await websocket.send_json({"type": "resync", "data": {}})
+        while not subscription.dropped:
+            item = await _next_event(subscription, heartbeat)
+            if item is None:
+                await websocket.send_json({"type": "heartbeat"})
+                continue
+            await websocket.send_json(
+                {"id": item.id, "type": item.type, "data": item.data}
+            )
+        await websocket.close(code=1013)  # Try again later
+    except WebSocketDisconnect:
+        pass
+    finally:
+        broker.unsubscribe(subscription)
@@ -6,17 +6,38 @@ from datetime import date
 from typing import Any
 from pydantic import BaseModel
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from api.dependencies import get_admin_person, get_current_person, get_session
-from api.schemas import PersonCreate, PersonRead, PersonUpdate
-from choreboss.repositories import PeopleRepository
-from choreboss.services import PeopleService
+from api.dependencies import (
+    get_admin_person,
+    get_current_person,
+    get_session,
+    require_step_up,
+    revoke_person_tokens,
+)
+from api.dependencies.etag import conditional_get
+from api.dependencies.expand import ExpandParam
+from api.dependencies.pagination import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    decode_cursor,
+    encode_cursor,
+)
+from api.schemas import (
+    ChoreCompletionPage,
+    PersonCreate,
+    PersonPage,
+    PersonRead,
+    PersonUpdate,
+)
+from choreboss.repositories import ChoreRepository, PeopleRepository
+from choreboss.services import ChoreService, PeopleService
 
 router = APIRouter()
 optional_bearer = HTTPBearer(auto_error=False)
+expand_person = ExpandParam(*PeopleRepository.EXPANDABLE)
 
 
 class SequenceItem(BaseModel):
@@ -24,37 +45,67 @@ class SequenceItem(BaseModel):
     sequence: int
 
 
-@router.get("/", response_model=list[PersonRead])
+@router.get("/", response_model=PersonPage)
 async def list_people(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    expand: frozenset[str] = Depends(expand_person),
     session: AsyncSession = Depends(get_session),
     current_person: dict[str, Any] = Depends(get_current_person),
-) -> list[Any]:
-    """List all people.
+    etag: str = Depends(conditional_get),
+) -> dict[str, Any]:
+    """List people in rotation order, one page at a time.
 
     Args:
+        limit: Page size.
+        cursor: ``next_cursor`` from the previous page.
+        expand: Relationships to embed (``chores``).
         session: Database session.
         current_person: Authenticated person.
+        etag: Entity tag; a matching ``If-None-Match`` gets a 304.
 
     Returns:
-        list: All people.
+        dict: People on this page and the cursor for the next one.
+
+    Raises:
+        HTTPException: If the cursor is invalid.
     """
+    after = decode_cursor(cursor, 1)
     people_repo = PeopleRepository(session)
     service = PeopleService(people_repo)
-    return await service.get_all_people()
+    try:
+        people, next_key = await service.list_people(
+            limit,
+            after=after,
+            expand=expand,
+        )
+    except (TypeError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        ) from None
+    return {
+        "people": people,
+        "next_cursor": encode_cursor(next_key) if next_key else None,
+    }
 
 
 @router.get("/{person_id}", response_model=PersonRead)
 async def get_person(
     person_id: int,
+    expand: frozenset[str] = Depends(expand_person),
     session: AsyncSession = Depends(get_session),
     current_person: dict[str, Any] = Depends(get_current_person),
+    etag: str = Depends(conditional_get),
 ) -> Any:
     """Get a specific person.
 
     Args:
         person_id: Person ID.
+        expand: Relationships to embed (``chores``).
         session: Database session.
         current_person: Authenticated person.
+        etag: Entity tag; a matching ``If-None-Match`` gets a 304.
 
     Returns:
         dict: Person data.
@@ -64,7 +115,7 @@ async def get_person(
     """
     people_repo = PeopleRepository(session)
     service = PeopleService(people_repo)
-    person = await service.get_person_by_id(person_id)
+    person = await service.get_person_by_id(person_id, expand)
 
     if not person:
         raise HTTPException(
@@ -75,6 +126,50 @@ async def get_person(
     return person
 
 
+@router.get("/{person_id}/history", response_model=ChoreCompletionPage)
+async def get_person_history(
+    person_id: int,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    session: AsyncSession = Depends(get_session),
+    current_person: dict[str, Any] = Depends(get_current_person),
+    etag: str = Depends(conditional_get),
+) -> dict[str, Any]:
+    """List a person's chore completions, newest first, page by page.
+
+    Args:
+        person_id: Person ID.
+        limit: Page size.
+        cursor: ``next_cursor`` from the previous page.
+        session: Database session.
+        current_person: Authenticated person.
+        etag: Entity tag; a matching ``If-None-Match`` gets a 304.
+
+    Returns:
+        dict: Completions on this page and the cursor for the next one.
+
+    Raises:
+        HTTPException: If the cursor is invalid.
+    """
+    before = decode_cursor(cursor, 2)
+    service = ChoreService(ChoreRepository(session), PeopleRepository(session))
+    try:
+        completions, next_key = await service.list_completions(
+            limit,
+            before=before,
+            person_id=person_id,
+        )
+    except (TypeError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        ) from None
+    return {
+        "completions": completions,
+        "next_cursor": encode_cursor(next_key) if next_key else None,
+    }
+
+
 @router.post("/", response_model=PersonRead)
 async def create_person(
     person: PersonCreate,
@@ -113,7 +208,7 @@ async def create_person(
 
         from api.dependencies import get_current_person
 
-        current_person = await get_current_person(credentials)
+        current_person = await get_current_person(credentials, session)
         if not current_person["is_admin"]:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
@@ -171,23 +266,30 @@ async def update_person(
         person.last_name = person_update.last_name
     if person_update.birthday is not None:
         person.birthday = person_update.birthday
+    was_admin = person.is_admin
     if person_update.is_admin is not None:
         person.is_admin = person_update.is_admin
-    if person_update.assign_chores is not None:
-        person.assign_chores = person_update.assign_chores
 
     result = await service.update_person(person)
+    if was_admin and not person.is_admin:
+        # Outstanding tokens still carry is_admin=True; invalidate them
+        await revoke_person_tokens(session, person_id)
     await session.commit()
     return result
 
 
-@router.delete("/{person_id}", status_code=status.HTTP_204_NO_CONTENT, response_model=None)
+@router.delete(
+    "/{person_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    response_model=None,
+    dependencies=[Depends(require_step_up)],
+)
 async def delete_person(
     person_id: int,
     session: AsyncSession = Depends(get_session),
     admin: dict[str, Any] = Depends(get_admin_person),
 ) -> None:
-    """Delete a person (admin only).
+    """Delete a person (admin only, with a PIN step-up token).
 
     Args:
         person_id: Person ID.
@@ -217,13 +319,15 @@ async def update_sequence(
     session: AsyncSession = Depends(get_session),
     admin: dict[str, Any] = Depends(get_admin_person),
 ) -> dict[str, Any]:
-    """Bulk update person sequence numbers (admin only)."""
+    """Move people to new rotation positions (admin only).
+
+    Moved people get new rotation ranks and every displayed sequence
+    number is renumbered to match, in the same transaction.
+    """
     people_repo = PeopleRepository(session)
     service = PeopleService(people_repo)
 
-    # Validate and apply
-    for item in items:
-        await service.update_sequence(item.id, item.sequence)
+    await service.reorder({item.id: item.sequence for item in items})
 
     await session.commit()
     return {"status": "success"}
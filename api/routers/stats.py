@@ -0,0 +1,54 @@
+"""Completion stats router."""
+
+from __future__ import annotations
+
+from datetime import date, datetime
+from typing import Any, Literal
+
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.dependencies import get_current_person, get_session
+from api.schemas import CompletionStats
+from choreboss.repositories import StatsRepository
+from choreboss.services import StatsService
+
+router = APIRouter()
+
+
+@router.get("", response_model=CompletionStats)
+async def get_stats(
+    period: Literal["day", "week"] = "week",
+    on: date | None = None,
+    session: AsyncSession = Depends(get_session),
+    current_person: dict[str, Any] = Depends(get_current_person),
+) -> dict[str, Any]:
+    """Get completions per person for a day or week.
+
+    Served from the rollup tables, so the cost does not grow with the
+    completion history. No ETag: with ``on`` omitted the period moves at
+    midnight without any write bumping the data version.
+
+    Args:
+        period: ``day`` or ``week`` (weeks start on Monday, UTC).
+        on: Any day in the period; defaults to today (UTC).
+        session: Database session.
+        current_person: Authenticated person.
+
+    Returns:
+        dict: Period bounds and per-person counts, most first.
+    """
+    service = StatsService(StatsRepository(session))
+    stats = await service.completions(
+        period,
+        on or datetime.utcnow().date(),
+    )
+    return {
+        "period": stats.period,
+        "start": stats.start,
+        "end": stats.end,
+        "people": [
+            {"person_id": person_id, "completions": completions}
+            for person_id, completions in stats.counts
+        ],
+    }
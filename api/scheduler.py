@@ -0,0 +1,128 @@
+"""Background job runner started from the API lifespan.
+
+Each job runs in its own task on a fixed interval. Jobs that write to
+the database are ``leader_only``: before each run the worker must hold
+the job's row in ``job_leases``, so a multi-worker deployment runs each
+of them once per interval. Jobs that maintain per-process state (caches,
+the event broker) run on every worker.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import socket
+import uuid
+from collections.abc import Awaitable, Callable
+from contextlib import suppress
+from dataclasses import dataclass
+
+from api.dependencies.db import get_session
+from choreboss.repositories import LeaseRepository
+
+logger = logging.getLogger("choreboss.scheduler")
+
+
+@dataclass
+class Job:
+    """A periodic background job.
+
+    ``lease_seconds`` defaults to two intervals, so the leader keeps the
+    lease by renewing it on every run, and another worker takes over
+    within two intervals once the leader is gone. A run that takes
+    longer than the lease may overlap with the next leader's.
+    """
+
+    name: str
+    interval: float
+    run: Callable[[], Awaitable[object]]
+    leader_only: bool = True
+    lease_seconds: float | None = None
+
+    @property
+    def lease_ttl(self) -> float:
+        """Seconds a lease taken for this job lasts."""
+        return self.lease_seconds or 2 * self.interval
+
+
+def worker_id() -> str:
+    """Build an ID for this process that is unique across hosts."""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+class Scheduler:
+    """Run jobs on their intervals until stopped."""
+
+    def __init__(self, jobs: list[Job], holder: str | None = None) -> None:
+        """Initialize a stopped scheduler.
+
+        Args:
+            jobs: Jobs to run.
+            holder: Lease holder ID; defaults to a fresh ``worker_id()``.
+        """
+        self.jobs = jobs
+        self.holder = holder or worker_id()
+        self._tasks: list[asyncio.Task] = []
+
+    async def _acquire(self, job: Job) -> bool:
+        """Take or renew the job's lease in its own transaction."""
+        async for session in get_session():
+            leases = LeaseRepository(session)
+            acquired = await leases.try_acquire(
+                job.name,
+                self.holder,
+                job.lease_ttl,
+            )
+            if acquired:
+                await session.commit()
+            return acquired
+        return False
+
+    async def run_once(self, job: Job) -> bool:
+        """Run a job now if this worker may.
+
+        Args:
+            job: Job to run.
+
+        Returns:
+            bool: True if the job ran, False if another worker leads it.
+        """
+        if job.leader_only and not await self._acquire(job):
+            return False
+        await job.run()
+        return True
+
+    async def _loop(self, job: Job) -> None:
+        """Run a job every interval, logging and surviving failures."""
+        while True:
+            try:
+                await self.run_once(job)
+            except Exception:
+                logger.exception("Background job %s failed", job.name)
+            await asyncio.sleep(job.interval)
+
+    def start(self) -> None:
+        """Start one task per job."""
+        self._tasks = [
+            asyncio.create_task(self._loop(job), name=f"job:{job.name}")
+            for job in self.jobs
+        ]
+
+    async def stop(self) -> None:
+        """Cancel every job, wait for them, and hand back held leases."""
+        for task in self._tasks:
+            task.cancel()
+        for task in self._tasks:
+            with suppress(asyncio.CancelledError):
+                await task
+        self._tasks = []
+        try:
+            async for session in get_session():
+                leases = LeaseRepository(session)
+                for job in self.jobs:
+                    if job.leader_only:
+                        await leases.release(job.name, self.holder)
+                await session.commit()
+        except Exception:
+            logger.exception("Releasing job leases failed")
@@ -2,23 +2,46 @@
 
 from __future__ import annotations
 
-from api.schemas.auth import TokenResponse
+from api.schemas.auth import StepUpRequest, StepUpResponse, TokenResponse
+from api.schemas.changes import ChangeSet
 from api.schemas.chore import (
+    ChoreCompletionPage,
+    ChoreCompletionRead,
     ChoreCreate,
+    ChorePage,
     ChoreRead,
     ChoreUpdate,
     RecurrenceType,
 )
-from api.schemas.person import PersonCreate, PersonLogin, PersonRead, PersonUpdate
+from api.schemas.person import (
+    PersonCreate,
+    PersonLogin,
+    PersonPage,
+    PersonRead,
+    PersonUpdate,
+)
+from api.schemas.stats import CompletionStats, PersonCompletions
+from api.schemas.summary import ChoreSummary, PersonSummary
 
 __all__ = [
+    "StepUpRequest",
+    "StepUpResponse",
     "TokenResponse",
+    "ChangeSet",
+    "ChoreCompletionPage",
+    "ChoreCompletionRead",
     "ChoreCreate",
+    "ChorePage",
     "ChoreRead",
     "ChoreUpdate",
     "RecurrenceType",
     "PersonCreate",
     "PersonLogin",
+    "PersonPage",
     "PersonRead",
     "PersonUpdate",
+    "CompletionStats",
+    "PersonCompletions",
+    "ChoreSummary",
+    "PersonSummary",
 ]
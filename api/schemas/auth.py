@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class TokenResponse(BaseModel):
@@ -12,3 +12,21 @@ class TokenResponse(BaseModel):
     token_type: str = "bearer"
     person_id: int
     is_admin: bool
+
+
+class StepUpRequest(BaseModel):
+    """PIN confirmation for a short-lived elevated token."""
+
+    pin: str = Field(..., min_length=4, max_length=4)
+
+
+class StepUpResponse(BaseModel):
+    """Elevated step-up token, plus an access token if the role changed."""
+
+    step_up_token: str
+    expires_in: int
+    scope: str
+    access_token: str | None = None
+    token_type: str = "bearer"
+    person_id: int
+    is_admin: bool
@@ -0,0 +1,23 @@
+"""Pydantic schemas for delta sync."""
+
+from __future__ import annotations
+
+from pydantic import BaseModel
+
+from api.schemas.chore import ChoreRead
+from api.schemas.person import PersonRead
+
+
+class ChangeSet(BaseModel):
+    """Chores and people changed since a cursor, plus deletions.
+
+    When ``full`` is true the lists are a complete snapshot and the client
+    should replace its state instead of merging.
+    """
+
+    full: bool
+    chores: list[ChoreRead]
+    people: list[PersonRead]
+    deleted_chores: list[int]
+    deleted_people: list[int]
+    cursor: str
@@ -5,7 +5,10 @@ from __future__ import annotations
 from datetime import datetime
 from enum import Enum
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
+
+from api.schemas.summary import PersonSummary
+from choreboss.recurrence import validate_rule
 
 
 class RecurrenceType(str, Enum):
@@ -26,6 +29,12 @@ class ChoreBase(BaseModel):
     recurrence: RecurrenceType = RecurrenceType.NONE
     recurrence_day: int | None = None  # Day of week (0-6) or month (1-31)
 
+    @model_validator(mode="after")
+    def check_recurrence_day(self):
+        """Reject a recurrence day that does not fit the recurrence."""
+        validate_rule(self.recurrence.value, self.recurrence_day)
+        return self
+
 
 class ChoreCreate(ChoreBase):
     """Schema for creating a chore."""
@@ -49,10 +58,42 @@ class ChoreRead(ChoreBase):
     id: int
     last_completed_date: datetime | None = None
     last_completed_id: int | None = None
+    next_due_at: datetime | None = None
     created_at: datetime
     updated_at: datetime
+    # Only filled in with ?expand=assignee / ?expand=last_completer
+    assignee: PersonSummary | None = None
+    last_completer: PersonSummary | None = None
 
     class Config:
         """Pydantic config."""
 
         from_attributes = True
+
+
+class ChorePage(BaseModel):
+    """One page of a chore listing."""
+
+    chores: list[ChoreRead]
+    next_cursor: str | None = None
+
+
+class ChoreCompletionRead(BaseModel):
+    """Schema for one entry of the completion history."""
+
+    id: int
+    chore_id: int
+    person_id: int
+    completed_at: datetime
+
+    class Config:
+        """Pydantic config."""
+
+        from_attributes = True
+
+
+class ChoreCompletionPage(BaseModel):
+    """One page of completion history, newest first."""
+
+    completions: list[ChoreCompletionRead]
+    next_cursor: str | None = None
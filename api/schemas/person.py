@@ -6,6 +6,8 @@ from datetime import date, datetime
 
 from pydantic import BaseModel, Field
 
+from api.schemas.summary import ChoreSummary
+
 
 class PersonBase(BaseModel):
     """Base person schema with common fields."""
@@ -40,6 +42,8 @@ class PersonRead(PersonBase):
     sequence_num: int
     created_at: datetime
     updated_at: datetime
+    # Only filled in with ?expand=chores
+    assigned_chores: list[ChoreSummary] | None = None
 
     class Config:
         """Pydantic config."""
@@ -47,6 +51,13 @@ class PersonRead(PersonBase):
         from_attributes = True
 
 
+class PersonPage(BaseModel):
+    """One page of a people listing."""
+
+    people: list[PersonRead]
+    next_cursor: str | None = None
+
+
 class PersonLogin(BaseModel):
     """Schema for login with login_name and PIN."""
 
@@ -0,0 +1,26 @@
+"""Pydantic schemas for completion stats."""
+
+from __future__ import annotations
+
+from datetime import date
+
+from pydantic import BaseModel
+
+
+class PersonCompletions(BaseModel):
+    """One person's completion count in a stats period."""
+
+    person_id: int
+    completions: int
+
+
+class CompletionStats(BaseModel):
+    """Completions per person over a day or week, most first.
+
+    People with no completions in the period are left out.
+    """
+
+    period: str
+    start: date
+    end: date
+    people: list[PersonCompletions]
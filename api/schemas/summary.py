@@ -0,0 +1,34 @@
+"""Compact schemas embedded in other resources via ``?expand=``."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import BaseModel
+
+
+class PersonSummary(BaseModel):
+    """Person fields embedded in an expanded chore."""
+
+    id: int
+    first_name: str
+    last_name: str
+    login_name: str
+
+    class Config:
+        """Pydantic config."""
+
+        from_attributes = True
+
+
+class ChoreSummary(BaseModel):
+    """Chore fields embedded in an expanded person."""
+
+    id: int
+    name: str
+    last_completed_date: datetime | None = None
+
+    class Config:
+        """Pydantic config."""
+
+        from_attributes = True
@@ -0,0 +1,204 @@
+"""Maintenance jobs run by the background scheduler.
+
+``build_jobs`` lists what the API lifespan schedules. One-off jobs can
+also be run from the command line::
+
+    python -m api.tasks rebuild-rollups
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+from datetime import datetime, timedelta
+
+from api.dependencies.auth import claims_cache
+from api.dependencies.db import get_session
+from api.scheduler import Job
+from choreboss.config import Settings, get_config
+from choreboss.events import broker
+from choreboss.repositories import (
+    ChoreRepository,
+    PeopleRepository,
+    StatsRepository,
+    TokenRevocationRepository,
+    get_data_version,
+    list_cache,
+)
+from choreboss.services import ChoreService, PeopleService, StatsService
+
+logger = logging.getLogger("choreboss.tasks")
+
+
+async def rebalance_rotation_ranks() -> bool:
+    """Respread rotation ranks once moves have used up their gaps.
+
+    Returns:
+        bool: True if the rotation was rewritten.
+    """
+    config = get_config()
+    async for session in get_session():
+        service = PeopleService(PeopleRepository(session))
+        rewritten = await service.rebalance_ranks(
+            config.rank_rebalance_min_gap
+        )
+        await session.commit()
+        if rewritten:
+            logger.info("Rebalanced rotation ranks")
+        return rewritten
+    return False
+
+
+async def announce_external_writes() -> bool:
+    """Publish a ``sync`` event for writes committed by other workers.
+
+    Each worker's broker only sees its own commits, so this compares how
+    far the data version moved with how many of those commits were this
+    worker's.
+
+    Returns:
+        bool: True if a ``sync`` event was published.
+    """
+    async for session in get_session():
+        version = await get_data_version(session)
+        if not broker.note_version(version):
+            return False
+        broker.publish(version, [("sync", {"version": version})])
+        return True
+    return False
+
+
+async def roll_over_missed_chores() -> int:
+    """Move missed recurring chores to their latest occurrence.
+
+    Returns:
+        int: Number of chores rolled over.
+    """
+    async for session in get_session():
+        service = ChoreService(
+            ChoreRepository(session),
+            PeopleRepository(session),
+        )
+        rolled = await service.roll_over_missed(datetime.utcnow())
+        await session.commit()
+        return rolled
+    return 0
+
+
+async def send_due_reminders() -> int:
+    """Publish ``chore.due`` once for each chore that has fallen due.
+
+    Returns:
+        int: Number of reminders sent.
+    """
+    lookback = timedelta(hours=get_config().due_reminder_lookback_hours)
+    async for session in get_session():
+        service = ChoreService(
+            ChoreRepository(session),
+            PeopleRepository(session),
+        )
+        sent = await service.send_due_reminders(datetime.utcnow(), lookback)
+        await session.commit()
+        return sent
+    return 0
+
+
+async def compact_caches() -> int:
+    """Drop expired entries from this worker's in-memory caches.
+
+    Returns:
+        int: Number of entries dropped.
+    """
+    return list_cache.compact() + claims_cache.compact()
+
+
+async def delete_expired_revocations() -> int:
+    """Delete token revocations that outlived the tokens they revoke.
+
+    Returns:
+        int: Number of rows deleted.
+    """
+    async for session in get_session():
+        deleted = await TokenRevocationRepository(session).delete_expired()
+        await session.commit()
+        return deleted
+    return 0
+
+
+def build_jobs(config: Settings) -> list[Job]:
+    """List the jobs the API lifespan schedules.
+
+    Args:
+        config: Application settings.
+
+    Returns:
+        list: Jobs; database writers run on the lease holder only.
+    """
+    return [
+        Job(
+            "chore-rollover",
+            config.chore_rollover_interval_seconds,
+            roll_over_missed_chores,
+        ),
+        Job(
+            "due-reminders",
+            config.due_reminder_interval_seconds,
+            send_due_reminders,
+        ),
+        Job(
+            "rank-rebalance",
+            config.rank_rebalance_interval_seconds,
+            rebalance_rotation_ranks,
+        ),
+        Job(
+            "revocation-cleanup",
+            config.revocation_cleanup_interval_seconds,
+            delete_expired_revocations,
+        ),
+        Job(
+            "cache-compaction",
+            config.cache_compaction_interval_seconds,
+            compact_caches,
+            leader_only=False,
+        ),
+        Job(
+            "event-version-watch",
+            config.events_version_poll_seconds,
+            announce_external_writes,
+            leader_only=False,
+        ),
+    ]
+
+
+async def rebuild_completion_rollups() -> tuple[int, int]:
+    """Recompute the daily and weekly rollups from completion history.
+
+    Returns:
+        tuple: Number of daily and weekly rows written.
+    """
+    async for session in get_session():
+        counts = await StatsService(StatsRepository(session)).rebuild()
+        await session.commit()
+        return counts
+    return 0, 0
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run one maintenance job from the command line.
+
+    Args:
+        argv: Command line arguments, defaulting to ``sys.argv``.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m api.tasks",
+        description="Run a ChoreBoss maintenance job once.",
+    )
+    parser.add_argument("job", choices=["rebuild-rollups"])
+    parser.parse_args(argv)
+    daily, weekly = asyncio.run(rebuild_completion_rollups())
+    print(f"Rebuilt {daily} daily and {weekly} weekly rollup rows")
+
+
+if __name__ == "__main__":
+    main()
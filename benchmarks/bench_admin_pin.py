@@ -0,0 +1,96 @@
+"""Benchmark admin-PIN authorization against the number of admins.
+
+Compares the original linear scan (bcrypt-verify every admin) with
+``PeopleRepository.is_admin``, which resolves a single candidate through
+the PIN fingerprint or the acting person's ID.
+
+Uses a throwaway PIN_PEPPER unless one is configured.
+
+Usage:
+    python -m benchmarks.bench_admin_pin
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from datetime import date
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from choreboss.config import get_config
+from choreboss.models import Base
+from choreboss.models.people import People
+from choreboss.repositories import PeopleRepository
+
+ADMIN_COUNTS = (1, 2, 4, 8)
+ROUNDS = 3
+
+
+async def _linear_scan(session: AsyncSession, pin: str) -> bool:
+    """Reproduce the pre-fingerprint admin check."""
+    result = await session.execute(
+        select(People).where(People.is_admin.is_(True))
+    )
+    for person in result.scalars():
+        if await person.verify_pin(pin):
+            return True
+    return False
+
+
+async def _seed(session: AsyncSession, count: int) -> str:
+    """Create ``count`` admins and return the PIN of the last one."""
+    for i in range(count):
+        person = People(
+            first_name="Admin",
+            last_name="Bench",
+            login_name=f"admin{i:03d}",
+            birthday=date(1990, 1, 1),
+            pin=f"{1000 + i}",
+            is_admin=True,
+            sequence_num=i + 1,
+        )
+        await person.set_pin(f"{1000 + i}")
+        session.add(person)
+    await session.commit()
+    return f"{1000 + count - 1}"
+
+
+async def _time(func, *args) -> float:
+    """Return the mean wall time of ``func(*args)`` in milliseconds."""
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        assert await func(*args)
+    return (time.perf_counter() - start) / ROUNDS * 1000
+
+
+async def main() -> None:
+    """Run the benchmark and print a table of timings."""
+    config = get_config()
+    config.pin_pepper = config.pin_pepper or "benchmark-pin-pepper"
+    print(f"{'admins':>6} {'scan ms':>10} {'fingerprint ms':>15}")
+    for count in ADMIN_COUNTS:
+        engine = create_async_engine(
+            "sqlite+aiosqlite:///:memory:",
+            poolclass=StaticPool,
+        )
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        factory = sessionmaker(
+            engine, class_=AsyncSession, expire_on_commit=False
+        )
+        async with factory() as session:
+            # The worst case for the scan is the last admin's PIN
+            pin = await _seed(session, count)
+            repo = PeopleRepository(session)
+            scan_ms = await _time(_linear_scan, session, pin)
+            indexed_ms = await _time(repo.is_admin, pin)
+        await engine.dispose()
+        print(f"{count:>6} {scan_ms:>10.1f} {indexed_ms:>15.1f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
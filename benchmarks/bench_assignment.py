@@ -0,0 +1,171 @@
+"""Benchmark fairness and throughput of the chore assignment policies.
+
+Seeds 20 people holding 2,000 chores with a skewed starting split (the
+first person holds the most), then completes randomly chosen chores,
+each by its assignee and in its own transaction, as the API does. Run
+once per policy on identical data:
+
+- ``rotation`` hands the chore to the next person by rotation rank, in
+  the single ``UPDATE`` of ``ChoreRepository.complete_and_rotate``.
+- ``least_loaded`` hands it to whoever holds the fewest chores, from a
+  ``LoadHeap`` caught up from the change log before each completion.
+
+Fairness is the spread of open-chore counts per person at the end
+(max - min, and standard deviation). Throughput is the median wall time
+of one completion including its commit. The heap operations are also
+timed on their own.
+
+Usage:
+    python -m benchmarks.bench_assignment
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import statistics
+import time
+from datetime import date, datetime
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from choreboss.load_heap import LoadHeap
+from choreboss.models import Base
+from choreboss.models.chore import Chore
+from choreboss.models.people import People
+from choreboss.repositories import ChoreRepository, PeopleRepository
+from choreboss.services import (
+    ChoreService,
+    LeastLoadedPolicy,
+    RotationPolicy,
+)
+
+PEOPLE = 20
+CHORES = 2_000
+COMPLETIONS = 2_000
+HEAP_OPS = 100_000
+NOW = datetime(2026, 6, 1)
+
+
+async def _seed(session: AsyncSession) -> None:
+    """Insert people and chores, weighted toward the first people."""
+    rng = random.Random(7)
+    await session.execute(
+        insert(People),
+        [
+            {
+                "first_name": "Bench",
+                "last_name": "Person",
+                "login_name": f"person{i:03d}",
+                "birthday": date(1990, 1, 1),
+                "pin": "x",
+                "is_admin": False,
+                "sequence_num": i + 1,
+                "rotation_rank": i + 1,
+                "created_at": NOW,
+                "updated_at": NOW,
+            }
+            for i in range(PEOPLE)
+        ],
+    )
+    weights = [PEOPLE - i for i in range(PEOPLE)]
+    await session.execute(
+        insert(Chore),
+        [
+            {
+                "name": f"Bench chore {i:05d}",
+                "description": "Benchmark chore",
+                "person_id": rng.choices(range(PEOPLE), weights)[0] + 1,
+                "created_at": NOW,
+                "updated_at": NOW,
+            }
+            for i in range(CHORES)
+        ],
+    )
+    await session.commit()
+
+
+async def _run(
+    policy,
+    completions: int,
+) -> tuple[list[float], list[int]]:
+    """Complete chores under a policy on a fresh database.
+
+    Returns:
+        tuple: Per-completion wall times in seconds, and every person's
+            open-chore count at the end.
+    """
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        poolclass=StaticPool,
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    rng = random.Random(11)
+    samples = []
+    async with factory() as session:
+        await _seed(session)
+        chore_repo = ChoreRepository(session)
+        service = ChoreService(
+            chore_repo,
+            PeopleRepository(session),
+            assignment_policy=policy,
+        )
+        for _ in range(completions):
+            chore_id = rng.randrange(CHORES) + 1
+            chore = await chore_repo.get_chore_by_id(chore_id)
+            start = time.perf_counter()
+            await service.complete_chore(chore_id, chore.person_id)
+            await session.commit()
+            samples.append(time.perf_counter() - start)
+            session.expunge_all()
+        loads = dict.fromkeys(range(1, PEOPLE + 1), 0)
+        for _, person_id in await chore_repo.get_assignments():
+            loads[person_id] += 1
+    await engine.dispose()
+    return samples, list(loads.values())
+
+
+def _time_heap() -> float:
+    """Median microseconds for one reassignment plus a peek."""
+    rng = random.Random(3)
+    heap = LoadHeap(
+        [(i, i) for i in range(PEOPLE)],
+        [(i, rng.randrange(PEOPLE)) for i in range(CHORES)],
+    )
+    start = time.perf_counter()
+    for _ in range(HEAP_OPS):
+        heap.assign(rng.randrange(CHORES), heap.peek())
+    return (time.perf_counter() - start) / HEAP_OPS * 1_000_000
+
+
+async def main() -> None:
+    """Run the benchmark and print a table per policy."""
+    print(
+        f"{'policy':>13} {'spread':>7} {'stdev':>7}"
+        f" {'median ms':>10} {'per sec':>8}"
+    )
+    for name, policy, completions in (
+        ("start", RotationPolicy(), 0),
+        ("rotation", RotationPolicy(), COMPLETIONS),
+        ("least_loaded", LeastLoadedPolicy(LoadHeap()), COMPLETIONS),
+    ):
+        samples, loads = await _run(policy, completions)
+        if samples:
+            median = statistics.median(samples)
+            timing = f"{median * 1000:>10.3f} {1 / median:>8.0f}"
+        else:
+            timing = f"{'-':>10} {'-':>8}"
+        print(
+            f"{name:>13} {max(loads) - min(loads):>7}"
+            f" {statistics.pstdev(loads):>7.1f} {timing}"
+        )
+    print(f"heap reassign + peek: {_time_heap():.2f} us")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,135 @@
+"""Benchmark the cost of recording history on the completion path.
+
+Times ``ChoreRepository.complete_and_rotate`` plus commit, the way the
+complete endpoint runs it, with and without the trigger that appends to
+``chore_completions``. It also times a deep history page, to show the composite indexes
+keep it flat as the history grows.
+
+Usage:
+    python -m benchmarks.bench_completion_history
+"""
+
+from __future__ import annotations
+
+import asyncio
+import statistics
+import time
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import insert, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from choreboss.models import Base
+from choreboss.models.chore import Chore
+from choreboss.models.chore_completion import ChoreCompletion
+from choreboss.models.people import People
+from choreboss.repositories import ChoreRepository
+
+PEOPLE = 10
+CHORES = 50
+COMPLETIONS = 2_000
+HISTORY_ROWS = (10_000, 100_000)
+
+
+async def _seed(session: AsyncSession, history: int) -> None:
+    """Insert people, assigned chores and ``history`` past completions."""
+    now = datetime.utcnow()
+    await session.execute(
+        insert(People),
+        [
+            {
+                "first_name": "Bench",
+                "last_name": "Person",
+                "login_name": f"person{i:03d}",
+                "birthday": date(1990, 1, 1),
+                "pin": "x",
+                "is_admin": False,
+                "sequence_num": i + 1,
+                "rotation_rank": i + 1,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for i in range(PEOPLE)
+        ],
+    )
+    await session.execute(
+        insert(Chore),
+        [
+            {
+                "name": f"Bench chore {i:04d}",
+                "description": "Benchmark chore",
+                "person_id": i % PEOPLE + 1,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for i in range(CHORES)
+        ],
+    )
+    if history:
+        await session.execute(
+            insert(ChoreCompletion),
+            [
+                {
+                    "chore_id": i % CHORES + 1,
+                    "person_id": i % PEOPLE + 1,
+                    "completed_at": now - timedelta(minutes=i),
+                }
+                for i in range(history)
+            ],
+        )
+    await session.commit()
+
+
+async def _run(history: int, record: bool) -> tuple[list[float], float]:
+    """Return per-completion latencies and a deep history page time, in ms."""
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        poolclass=StaticPool,
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        if not record:
+            await conn.execute(text("DROP TRIGGER chores_record_completion"))
+    factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with factory() as session:
+        await _seed(session, history)
+        repo = ChoreRepository(session)
+
+        latencies = []
+        for i in range(COMPLETIONS):
+            start = time.perf_counter()
+            await repo.complete_and_rotate(i % CHORES + 1, i % PEOPLE + 1)
+            await session.commit()
+            latencies.append((time.perf_counter() - start) * 1000)
+
+        # Page from the middle of one chore's history
+        middle = (datetime.utcnow() - timedelta(minutes=history // 2), 0)
+        start = time.perf_counter()
+        await repo.list_completions(50, before=middle, chore_id=1)
+        page_ms = (time.perf_counter() - start) * 1000
+    await engine.dispose()
+    return latencies, page_ms
+
+
+async def main() -> None:
+    """Run the benchmark and print a table of timings."""
+    print(
+        f"{'history':>8} {'path':>10} {'p50 ms':>7} {'p95 ms':>7}"
+        f" {'page ms':>8}"
+    )
+    for history in HISTORY_ROWS:
+        for record in (False, True):
+            latencies, page_ms = await _run(history, record)
+            p50 = statistics.median(latencies)
+            p95 = statistics.quantiles(latencies, n=20)[-1]
+            path = "history" if record else "no-history"
+            print(
+                f"{history:>8} {path:>10} {p50:>7.3f} {p95:>7.3f}"
+                f" {page_ms:>8.3f}"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
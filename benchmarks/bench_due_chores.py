@@ -0,0 +1,157 @@
+"""Benchmark the overdue listing against 100k chores.
+
+Compares the old client-side approach (load every chore, then filter and
+sort in Python) with ``ChoreRepository.list_due``, which reads one page
+from ``ix_chores_next_due`` or ``ix_chores_person_next_due``. The
+indexed path is timed twice: the raw SQL on the connection, and the full
+repository call including ORM object loading.
+
+Usage:
+    python -m benchmarks.bench_due_chores
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import statistics
+import time
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import insert, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from choreboss.models import Base
+from choreboss.models.chore import Chore
+from choreboss.models.people import People
+from choreboss.repositories import ChoreRepository
+
+CHORES = 100_000
+PEOPLE = 20
+PAGE = 50
+RUNS = 200
+NOW = datetime(2026, 6, 1)
+
+
+async def _seed(session: AsyncSession) -> None:
+    """Insert people and chores due over a year around ``NOW``."""
+    rng = random.Random(7)
+    await session.execute(
+        insert(People),
+        [
+            {
+                "first_name": "Bench",
+                "last_name": "Person",
+                "login_name": f"person{i:03d}",
+                "birthday": date(1990, 1, 1),
+                "pin": "x",
+                "is_admin": False,
+                "sequence_num": i + 1,
+                "rotation_rank": i + 1,
+                "created_at": NOW,
+                "updated_at": NOW,
+            }
+            for i in range(PEOPLE)
+        ],
+    )
+    await session.execute(
+        insert(Chore),
+        [
+            {
+                "name": f"Bench chore {i:06d}",
+                "description": "Benchmark chore",
+                "person_id": rng.randrange(PEOPLE) + 1,
+                "recurrence": "daily",
+                "next_due_at": NOW
+                + timedelta(hours=rng.randrange(-4380, 4380)),
+                "created_at": NOW,
+                "updated_at": NOW,
+            }
+            for i in range(CHORES)
+        ],
+    )
+    await session.commit()
+
+
+def _median_ms(samples: list[float]) -> float:
+    """Median of samples in seconds, as milliseconds."""
+    return statistics.median(samples) * 1000
+
+
+async def _time(coro_factory, runs: int = RUNS) -> float:
+    """Median wall time of ``runs`` awaits of ``coro_factory()``."""
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        await coro_factory()
+        samples.append(time.perf_counter() - start)
+    return _median_ms(samples)
+
+
+async def main() -> None:
+    """Run the benchmark and print a table of median timings."""
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        poolclass=StaticPool,
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with factory() as session:
+        await _seed(session)
+        repo = ChoreRepository(session)
+        conn = await session.connection()
+
+        async def client_side():
+            result = await session.execute(select(Chore))
+            chores = [c for c in result.scalars() if c.next_due_at < NOW]
+            chores.sort(key=lambda c: (c.next_due_at, c.id))
+            session.expunge_all()
+            return chores[:PAGE]
+
+        # A cursor halfway through the overdue slice
+        halfway = (NOW - timedelta(days=90), 0)
+        middle = await repo.list_due(1, NOW, after=halfway)
+        deep = (middle[0].next_due_at, middle[0].id)
+        order = (Chore.next_due_at, Chore.id)
+        cases = {
+            "first page": (None, None),
+            "deep page": (deep, None),
+            "assignee": (None, 3),
+            "assignee deep": (deep, 3),
+        }
+
+        print(f"{'query':>14} {'sql ms':>8} {'repo ms':>8}")
+        legacy_ms = await _time(client_side, runs=3)
+        print(f"{'load all':>14} {'-':>8} {legacy_ms:>8.3f}")
+        for label, (after, person_id) in cases.items():
+            stmt = select(Chore.__table__).where(Chore.next_due_at < NOW)
+            if person_id is not None:
+                stmt = stmt.where(Chore.person_id == person_id)
+            if after is not None:
+                stmt = stmt.where(tuple_(*order) > tuple_(*after))
+            stmt = stmt.order_by(*order).limit(PAGE)
+
+            async def raw(stmt=stmt):
+                return (await conn.execute(stmt)).all()
+
+            async def via_repo(after=after, person_id=person_id):
+                chores = await repo.list_due(
+                    PAGE,
+                    NOW,
+                    after=after,
+                    person_id=person_id,
+                )
+                session.expunge_all()
+                return chores
+
+            sql_ms = await _time(raw)
+            repo_ms = await _time(via_repo)
+            print(f"{label:>14} {sql_ms:>8.3f} {repo_ms:>8.3f}")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,134 @@
+"""Benchmark reordering and post-delete compaction of the rotation.
+
+Compares the original per-person path (one SELECT and flush per person)
+with the set-based ``PeopleRepository.resequence`` and
+``close_sequence_gap`` updates.
+
+Usage:
+    python -m benchmarks.bench_resequence
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from datetime import date, datetime
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import selectinload, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from choreboss.models import Base
+from choreboss.models.people import People
+from choreboss.repositories import PeopleRepository
+
+PEOPLE_COUNTS = (1_000, 10_000)
+
+
+async def _seed(session: AsyncSession, count: int) -> None:
+    """Insert ``count`` people in rotation order."""
+    now = datetime.utcnow()
+    await session.execute(
+        insert(People),
+        [
+            {
+                "first_name": "Bench",
+                "last_name": "Person",
+                "login_name": f"person{i:05d}",
+                "birthday": date(1990, 1, 1),
+                "pin": "x",
+                "is_admin": False,
+                "sequence_num": i + 1,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for i in range(count)
+        ],
+    )
+    await session.commit()
+
+
+async def _legacy_reorder(
+    repo: PeopleRepository,
+    positions: dict[int, int],
+) -> None:
+    """Reproduce the per-item reorder used by the sequence endpoint."""
+    await repo.park_sequences(list(positions))
+    for person_id, sequence in positions.items():
+        await repo.update_sequence(person_id, sequence)
+
+
+async def _legacy_delete(repo: PeopleRepository, person_id: int) -> None:
+    """Reproduce the load-everything delete-and-shift loop."""
+    person = await repo.get_person_by_id(person_id)
+    deleted_seq = person.sequence_num
+    await repo.delete_person(person_id)
+    result = await repo.session.execute(
+        select(People)
+        .order_by(People.sequence_num)
+        .options(selectinload(People.chores))
+    )
+    for other in result.scalars():
+        if other.sequence_num > deleted_seq:
+            other.sequence_num -= 1
+            await repo.update_person(other)
+
+
+async def _bulk_delete(repo: PeopleRepository, person_id: int) -> None:
+    """Delete a person and compact with the set-based update."""
+    deleted_seq = await repo.get_sequence_num(person_id)
+    await repo.delete_person(person_id)
+    await repo.close_sequence_gap(deleted_seq)
+
+
+async def _run(count: int, legacy: bool) -> tuple[float, float]:
+    """Time a full reversal and a head-of-rotation delete in milliseconds."""
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        poolclass=StaticPool,
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with factory() as session:
+        await _seed(session, count)
+        repo = PeopleRepository(session)
+        positions = {pid: count + 1 - pid for pid in range(1, count + 1)}
+
+        start = time.perf_counter()
+        if legacy:
+            await _legacy_reorder(repo, positions)
+        else:
+            await repo.resequence(positions)
+        await session.commit()
+        reorder_ms = (time.perf_counter() - start) * 1000
+
+        # After the reversal, person ``count`` heads the rotation
+        start = time.perf_counter()
+        if legacy:
+            await _legacy_delete(repo, count)
+        else:
+            await _bulk_delete(repo, count)
+        await session.commit()
+        delete_ms = (time.perf_counter() - start) * 1000
+    await engine.dispose()
+    return reorder_ms, delete_ms
+
+
+async def main() -> None:
+    """Run the benchmark and print a table of timings."""
+    print(
+        f"{'people':>7} {'path':>7} {'reorder ms':>11} {'delete ms':>10}"
+    )
+    for count in PEOPLE_COUNTS:
+        for legacy in (True, False):
+            reorder_ms, delete_ms = await _run(count, legacy)
+            path = "legacy" if legacy else "bulk"
+            print(
+                f"{count:>7} {path:>7} {reorder_ms:>11.1f} {delete_ms:>10.1f}"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
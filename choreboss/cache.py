@@ -0,0 +1,139 @@
+"""Bounded, versioned cache for read-mostly query results."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass
+class CacheStats:
+    """Cache effectiveness counters."""
+
+    hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class VersionedCache:
+    """LRU cache whose entries are only valid for one data version.
+
+    Every lookup carries the data version the caller just read. Seeing a
+    newer version than the cached entries were stored at drops them all
+    at once, so a write anywhere makes every cached result stale and
+    no per-key invalidation is needed. Entries also expire after
+    ``ttl_seconds`` as a backstop.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_entries: Maximum number of results to keep.
+            ttl_seconds: Seconds a result stays valid at most.
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = (
+            OrderedDict()
+        )
+        self._version: int | None = None
+        self._stats = CacheStats()
+        self._lock = threading.Lock()
+
+    def _observe(self, version: int) -> None:
+        """Drop every entry once a newer data version is seen."""
+        if self._version is None or version > self._version:
+            if self._entries:
+                self._entries.clear()
+                self._stats.invalidations += 1
+            self._version = version
+
+    def get(self, key: Hashable, version: int) -> Any | None:
+        """Return the cached result for a key at a data version.
+
+        Args:
+            key: Query identity, including its parameters.
+            version: Current data version.
+
+        Returns:
+            Cached result, or None on a miss.
+        """
+        with self._lock:
+            self._observe(version)
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= time.monotonic():
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self._stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats.hits += 1
+            return entry[1]
+
+    def put(self, key: Hashable, version: int, value: Any) -> None:
+        """Store a result loaded at a data version.
+
+        Args:
+            key: Query identity, including its parameters.
+            version: Data version read before the result was loaded.
+            value: Result to cache; must not be None.
+        """
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._observe(version)
+            if version < self._version:
+                # Loaded before a write another request already saw
+                return
+            expires_at = time.monotonic() + self.ttl_seconds
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats.evictions += 1
+
+    def compact(self) -> int:
+        """Drop expired entries instead of waiting for a lookup to hit them.
+
+        Returns:
+            int: Number of entries dropped.
+        """
+        now = time.monotonic()
+        with self._lock:
+            expired = [
+                key
+                for key, (expires_at, _) in self._entries.items()
+                if expires_at <= now
+            ]
+            for key in expired:
+                del self._entries[key]
+            return len(expired)
+
+    def stats(self) -> CacheStats:
+        """Return a snapshot of the counters."""
+        with self._lock:
+            return CacheStats(**vars(self._stats))
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._version = None
+            self._stats = CacheStats()
+
+    def __len__(self) -> int:
+        """Return the number of cached entries."""
+        return len(self._entries)
@@ -11,9 +11,46 @@ class Settings(BaseSettings):
     environment: str = "development"
     debug: bool = True
     database_url: str = "postgresql+asyncpg://localhost/choreboss"
+    db_pool_size: int = 10
+    db_max_overflow: int = 5
+    db_pool_timeout: float = 10.0
+    db_pool_recycle: int = 1800
+    db_pool_pre_ping: bool = True
+    db_statement_cache_size: int = 100  # asyncpg prepared statements
+    db_echo: bool = False
+    sql_log_statements: bool = False
+    sql_log_min_duration_ms: float = 0.0
     secret_key: str = "your-secret-key-change-in-production"
+    pin_pepper: str = ""  # Required; the API refuses to start without it
     jwt_algorithm: str = "HS256"
     jwt_expiration_hours: int = 168  # 7 days
+    step_up_ttl_seconds: int = 300
+    jwt_claims_cache_size: int = 1024
+    token_revocation_sync_seconds: float = 5.0
+    token_revocation_sync_overlap_seconds: float = 60.0
+    login_throttle_free_attempts: int = 5
+    login_throttle_client_free_attempts: int = 20
+    login_throttle_base_delay_seconds: float = 1.0
+    login_throttle_max_delay_seconds: float = 900.0
+    login_throttle_window_seconds: float = 900.0
+    login_throttle_sqlite_path: str = ""  # Empty keeps state in-process
+    password_hash_workers: int = 2
+    password_hash_queue_depth: int = 32
+    assignment_policy: str = "rotation"  # Or "least_loaded"
+    rank_rebalance_interval_seconds: float = 300.0
+    rank_rebalance_min_gap: int = 1024
+    list_cache_max_entries: int = 256
+    list_cache_ttl_seconds: float = 60.0
+    events_queue_size: int = 100
+    events_history_size: int = 1000
+    events_heartbeat_seconds: float = 15.0
+    events_version_poll_seconds: float = 5.0
+    scheduler_enabled: bool = True
+    chore_rollover_interval_seconds: float = 300.0
+    due_reminder_interval_seconds: float = 60.0
+    due_reminder_lookback_hours: float = 24.0
+    revocation_cleanup_interval_seconds: float = 3600.0
+    cache_compaction_interval_seconds: float = 300.0
     host: str = "0.0.0.0"
     port: int = 8055
 
@@ -0,0 +1,119 @@
+"""In-memory min-heap of chores ordered by when they are next due."""
+
+from __future__ import annotations
+
+import heapq
+from collections.abc import Iterable
+from datetime import datetime
+
+
+class DueQueue:
+    """Chore IDs keyed by ``next_due_at``, soonest first.
+
+    ``push``, ``discard`` and ``pop`` are O(log n) and ``peek`` is O(1)
+    amortized. Rescheduling or removing a chore marks its old heap entry
+    stale instead of searching for it; stale entries are skipped when
+    they reach the top, and the heap is rebuilt once they outnumber the
+    live ones.
+    """
+
+    def __init__(self, entries: Iterable[tuple[int, datetime]] = ()) -> None:
+        """Build a queue in O(n) from ``(chore_id, due_at)`` pairs.
+
+        Args:
+            entries: Initial chores and their due times.
+        """
+        self._live: dict[int, list] = {}
+        self._heap: list[list] = []
+        # Data version the contents were loaded at, if loaded from the DB
+        self.version: int | None = None
+        self.load(entries)
+
+    def __len__(self) -> int:
+        """Number of scheduled chores."""
+        return len(self._live)
+
+    def load(self, entries: Iterable[tuple[int, datetime]]) -> None:
+        """Replace the queue contents in O(n).
+
+        Args:
+            entries: Chores and their due times.
+        """
+        self._live = {
+            chore_id: [due_at, chore_id, True]
+            for chore_id, due_at in entries
+        }
+        self._heap = list(self._live.values())
+        heapq.heapify(self._heap)
+
+    def push(self, chore_id: int, due_at: datetime | None) -> None:
+        """Schedule a chore, replacing its previous due time.
+
+        Args:
+            chore_id: Chore ID.
+            due_at: When it is next due; None unschedules it.
+        """
+        self.discard(chore_id)
+        if due_at is None:
+            return
+        entry = [due_at, chore_id, True]
+        self._live[chore_id] = entry
+        heapq.heappush(self._heap, entry)
+
+    def discard(self, chore_id: int) -> None:
+        """Unschedule a chore if it is queued.
+
+        Args:
+            chore_id: Chore ID.
+        """
+        entry = self._live.pop(chore_id, None)
+        if entry is None:
+            return
+        entry[2] = False
+        if len(self._heap) > 2 * len(self._live) + 16:
+            self._heap = [item for item in self._heap if item[2]]
+            heapq.heapify(self._heap)
+
+    def _prune(self) -> None:
+        """Drop stale entries from the top of the heap."""
+        while self._heap and not self._heap[0][2]:
+            heapq.heappop(self._heap)
+
+    def peek(self) -> tuple[datetime, int] | None:
+        """Get the chore due soonest without removing it.
+
+        Returns:
+            tuple: ``(due_at, chore_id)``, or None if nothing is queued.
+        """
+        self._prune()
+        if not self._heap:
+            return None
+        due_at, chore_id, _ = self._heap[0]
+        return due_at, chore_id
+
+    def pop(self) -> tuple[datetime, int] | None:
+        """Remove and return the chore due soonest.
+
+        Returns:
+            tuple: ``(due_at, chore_id)``, or None if nothing is queued.
+        """
+        self._prune()
+        if not self._heap:
+            return None
+        due_at, chore_id, _ = heapq.heappop(self._heap)
+        del self._live[chore_id]
+        return due_at, chore_id
+
+    def pop_due(self, now: datetime) -> list[tuple[datetime, int]]:
+        """Remove and return every chore due at or before ``now``.
+
+        Args:
+            now: Cut-off time.
+
+        Returns:
+            list: ``(due_at, chore_id)`` pairs, soonest first.
+        """
+        due = []
+        while (head := self.peek()) is not None and head[0] <= now:
+            due.append(self.pop())
+        return due
@@ -0,0 +1,290 @@
+"""In-process pub/sub of committed chore and rotation changes.
+
+Services call ``publish_after_commit`` while they write. The events wait
+in the session until its transaction commits, so subscribers never hear
+about a write that rolled back. Each event's ID is the data version of
+its commit plus its position within that commit, which orders events
+the same way on every worker and lets clients resume after a
+reconnect.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from choreboss.config import get_config
+from choreboss.repositories.data_version import COMMITTED_VERSION
+
+_PENDING = "choreboss.pending_events"
+
+EventKey = tuple[int, int]
+
+
+@dataclass(frozen=True)
+class Event:
+    """A change that has been committed."""
+
+    version: int
+    index: int
+    type: str
+    data: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def key(self) -> EventKey:
+        """Sort key: data version, then position within the commit."""
+        return (self.version, self.index)
+
+    @property
+    def id(self) -> str:
+        """Event ID as sent to clients."""
+        return f"{self.version}-{self.index}"
+
+
+def parse_event_id(value: str | None) -> EventKey | None:
+    """Parse an event ID sent back by a client.
+
+    Args:
+        value: ``Last-Event-ID`` value, or None.
+
+    Returns:
+        tuple: Event key, or None if absent or malformed.
+    """
+    if not value:
+        return None
+    version, _, index = value.partition("-")
+    try:
+        return (int(version), int(index or 0))
+    except ValueError:
+        return None
+
+
+class Subscription:
+    """One client's bounded queue of events."""
+
+    def __init__(self, queue_size: int) -> None:
+        """Initialize an empty subscription.
+
+        Args:
+            queue_size: Events the client may fall behind by before it is
+                dropped.
+        """
+        self.queue: asyncio.Queue[Event] = asyncio.Queue(maxsize=queue_size)
+        self.dropped = False
+        self.resync = False
+
+    def offer(self, item: Event) -> bool:
+        """Queue an event without waiting.
+
+        Args:
+            item: Event to deliver.
+
+        Returns:
+            bool: False if the queue was full.
+        """
+        try:
+            self.queue.put_nowait(item)
+        except asyncio.QueueFull:
+            return False
+        return True
+
+
+class EventBroker:
+    """Fan committed events out to subscribers.
+
+    A subscriber that lets its queue fill up is dropped rather than
+    slowing everyone else down; its stream ends and the client resumes
+    from its last event ID. The most recent ``history_size`` events are
+    kept for those resumes. Call every method from the event loop thread.
+
+    The broker also remembers which data versions this worker committed,
+    so ``note_version`` can tell a commit made through another worker
+    from its own.
+    """
+
+    def __init__(self, queue_size: int, history_size: int) -> None:
+        """Initialize the broker.
+
+        Args:
+            queue_size: Per-subscriber queue bound.
+            history_size: Events kept for resuming clients.
+        """
+        self.queue_size = queue_size
+        self._history: deque[Event] = deque(maxlen=history_size)
+        # Every event after this key is still in the history
+        self._floor: EventKey | None = None
+        self._subscribers: set[Subscription] = set()
+        self._own_versions: set[int] = set()
+        self._polled_version: int | None = None
+        self.last_version: int | None = None
+        self.dropped = 0
+
+    def _advance(self, version: int) -> None:
+        """Record the newest data version this broker knows of."""
+        if self._floor is None:
+            self._floor = (version, 0)
+        if self.last_version is None or version > self.last_version:
+            self.last_version = version
+
+    def subscribe(
+        self,
+        last_event_id: EventKey | None = None,
+        current_version: int | None = None,
+    ) -> Subscription:
+        """Register a subscriber, replaying events it missed.
+
+        If the history cannot prove it holds every event after
+        ``last_event_id`` (they were evicted, or came before this worker
+        started, e.g. after a restart or when reconnecting to another
+        worker), the subscription is flagged ``resync`` so the client can
+        fetch the changes it missed instead.
+
+        Args:
+            last_event_id: Key of the last event the client received.
+            current_version: Current data version, if the caller read it.
+
+        Returns:
+            Subscription: Queue of events for the client.
+        """
+        subscription = Subscription(self.queue_size)
+        if last_event_id is not None:
+            if self._floor is not None:
+                subscription.resync = last_event_id < self._floor
+            else:
+                known = max(
+                    version
+                    for version in (self.last_version, current_version, 0)
+                    if version is not None
+                )
+                subscription.resync = last_event_id[0] < known
+            for item in self._history:
+                if item.key > last_event_id and not subscription.offer(item):
+                    subscription.resync = True
+                    break
+        self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Stop delivering events to a subscriber.
+
+        Args:
+            subscription: Subscription from ``subscribe``.
+        """
+        self._subscribers.discard(subscription)
+
+    def publish(
+        self,
+        version: int,
+        events: list[tuple[str, dict[str, Any]]],
+    ) -> None:
+        """Deliver the events of one commit to every subscriber.
+
+        Args:
+            version: Data version of the commit.
+            events: ``(type, data)`` pairs in the order they happened.
+        """
+        self._advance(version)
+        # A sync event can share a version with this worker's own commit
+        start = 0
+        if self._history and self._history[-1].version == version:
+            start = self._history[-1].index + 1
+        for index, (event_type, data) in enumerate(events, start):
+            item = Event(version, index, event_type, data)
+            if len(self._history) == self._history.maxlen:
+                self._floor = self._history[0].key
+            self._history.append(item)
+            for subscription in list(self._subscribers):
+                if not subscription.offer(item):
+                    subscription.dropped = True
+                    self._subscribers.discard(subscription)
+                    self.dropped += 1
+
+    def record_commit(self, version: int) -> None:
+        """Note a data version committed by this worker.
+
+        Args:
+            version: Data version of the commit.
+        """
+        self._advance(version)
+        self._own_versions.add(version)
+
+    def note_version(self, version: int) -> bool:
+        """Check the shared data version for other workers' commits.
+
+        Versions go up by one per commit, so if the version moved further
+        than this worker's own commits since the last check, someone else
+        committed. The first check only sets the baseline.
+
+        Args:
+            version: Current data version.
+
+        Returns:
+            bool: True if another worker committed since the last check.
+        """
+        previous = self._polled_version
+        own = {v for v in self._own_versions if v <= version}
+        self._own_versions -= own
+        self._advance(version)
+        if previous is not None and version <= previous:
+            return False
+        self._polled_version = version
+        if previous is None:
+            return False
+        return version - previous > sum(1 for v in own if v > previous)
+
+    def clear(self) -> None:
+        """Forget history, subscribers and counters."""
+        self._history.clear()
+        self._floor = None
+        self._subscribers.clear()
+        self._own_versions.clear()
+        self._polled_version = None
+        self.last_version = None
+        self.dropped = 0
+
+    def __len__(self) -> int:
+        """Return the number of connected subscribers."""
+        return len(self._subscribers)
+
+
+_config = get_config()
+broker = EventBroker(_config.events_queue_size, _config.events_history_size)
+
+
+def publish_after_commit(
+    session: Any,
+    event_type: str,
+    **data: Any,
+) -> None:
+    """Queue an event to publish once the session's transaction commits.
+
+    Args:
+        session: Session (sync or async) doing the write.
+        event_type: Event name, e.g. ``chore.completed``.
+        **data: JSON-serializable event payload.
+    """
+    session.info.setdefault(_PENDING, []).append((event_type, data))
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_committed(session: Session) -> None:
+    """Publish the events of a transaction that just committed."""
+    version = session.info.pop(COMMITTED_VERSION, None)
+    pending = session.info.pop(_PENDING, None)
+    if version is None:
+        return
+    broker.record_commit(version)
+    if pending:
+        broker.publish(version, pending)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back(session: Session) -> None:
+    """Forget the events of a transaction that did not commit."""
+    session.info.pop(_PENDING, None)
+    session.info.pop(COMMITTED_VERSION, None)
@@ -0,0 +1,196 @@
+"""Off-event-loop bcrypt hashing and verification."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
+
+import bcrypt
+
+from choreboss.config import get_config
+
+logger = logging.getLogger(__name__)
+
+
+class PasswordHasherOverloaded(Exception):
+    """Raised when the hashing queue is full and a request is shed."""
+
+
+def _hash(pin: bytes) -> bytes:
+    """Hash a PIN in a worker process."""
+    return bcrypt.hashpw(pin, bcrypt.gensalt())
+
+
+def _verify(pin: bytes, hashed: bytes) -> bool:
+    """Verify a PIN in a worker process."""
+    return bcrypt.checkpw(pin, hashed)
+
+
+@dataclass
+class OperationStats:
+    """Timing counters for one kind of hashing operation."""
+
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+
+    def record(self, elapsed_ms: float) -> None:
+        """Record one completed operation.
+
+        Args:
+            elapsed_ms: Wall time including queue wait, in milliseconds.
+        """
+        self.count += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+
+    @property
+    def mean_ms(self) -> float:
+        """Mean wall time per operation in milliseconds."""
+        return self.total_ms / self.count if self.count else 0.0
+
+
+@dataclass
+class HasherStats:
+    """Snapshot of password hasher metrics."""
+
+    hash: OperationStats = field(default_factory=OperationStats)
+    verify: OperationStats = field(default_factory=OperationStats)
+    rejected: int = 0
+    in_flight: int = 0
+
+
+class PasswordHasher:
+    """Runs bcrypt in a bounded process pool so the event loop never blocks.
+
+    At most ``max_workers`` operations run at once and at most
+    ``queue_depth`` more wait for a worker; anything beyond that raises
+    ``PasswordHasherOverloaded`` immediately instead of queueing.
+    """
+
+    def __init__(self, max_workers: int, queue_depth: int) -> None:
+        """Initialize the hasher.
+
+        Args:
+            max_workers: Number of worker processes.
+            queue_depth: Operations allowed to wait for a free worker.
+        """
+        self.max_workers = max_workers
+        self.queue_depth = queue_depth
+        self._executor: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+        self._stats = HasherStats()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Get or create the worker pool."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers
+                )
+            return self._executor
+
+    async def _run(self, stats: OperationStats, func, *args):
+        """Submit ``func`` to the pool, enforcing the queue bound."""
+        with self._lock:
+            limit = self.max_workers + self.queue_depth
+            if self._stats.in_flight >= limit:
+                self._stats.rejected += 1
+                raise PasswordHasherOverloaded(
+                    "Password hashing queue is full"
+                )
+            self._stats.in_flight += 1
+
+        start = time.perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._get_executor(), func, *args
+            )
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            with self._lock:
+                self._stats.in_flight -= 1
+                stats.record(elapsed_ms)
+            logger.debug("%s took %.1f ms", func.__name__, elapsed_ms)
+
+    async def hash_pin(self, pin: str) -> str:
+        """Hash a PIN with bcrypt.
+
+        Args:
+            pin: Plain text PIN.
+
+        Returns:
+            str: bcrypt hash.
+
+        Raises:
+            PasswordHasherOverloaded: If the queue is full.
+        """
+        hashed = await self._run(
+            self._stats.hash, _hash, pin.encode("utf-8")
+        )
+        return hashed.decode("utf-8")
+
+    async def verify_pin(self, pin: str, hashed: str) -> bool:
+        """Verify a PIN against a bcrypt hash.
+
+        Args:
+            pin: Plain text PIN.
+            hashed: Stored bcrypt hash.
+
+        Returns:
+            bool: True if PIN matches.
+
+        Raises:
+            PasswordHasherOverloaded: If the queue is full.
+        """
+        return await self._run(
+            self._stats.verify,
+            _verify,
+            pin.encode("utf-8"),
+            hashed.encode("utf-8"),
+        )
+
+    def stats(self) -> HasherStats:
+        """Return a copy of the current metrics.
+
+        Returns:
+            HasherStats: Metrics snapshot.
+        """
+        with self._lock:
+            return HasherStats(
+                hash=replace(self._stats.hash),
+                verify=replace(self._stats.verify),
+                rejected=self._stats.rejected,
+                in_flight=self._stats.in_flight,
+            )
+
+    def shutdown(self) -> None:
+        """Stop the worker pool."""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True, cancel_futures=True)
+                self._executor = None
+
+
+_hasher: PasswordHasher | None = None
+
+
+def get_password_hasher() -> PasswordHasher:
+    """Get the process-wide password hasher singleton.
+
+    Returns:
+        PasswordHasher: Shared hasher configured from settings.
+    """
+    global _hasher
+    if _hasher is None:
+        config = get_config()
+        _hasher = PasswordHasher(
+            max_workers=config.password_hash_workers,
+            queue_depth=config.password_hash_queue_depth,
+        )
+    return _hasher
@@ -0,0 +1,174 @@
+"""In-memory min-heap of people ordered by how many chores they hold."""
+
+from __future__ import annotations
+
+import heapq
+from collections.abc import Iterable
+
+
+class LoadHeap:
+    """People keyed by open-chore count, least loaded first.
+
+    Ties go to the lower ``rotation_rank``. The heap also remembers each
+    chore's assignee, so reassigning, adding or removing a chore moves
+    two loads by one in O(log n). As in ``DueQueue``, a changed load
+    marks the old heap entry stale instead of searching for it.
+    """
+
+    def __init__(
+        self,
+        people: Iterable[tuple[int, int]] = (),
+        chores: Iterable[tuple[int, int | None]] = (),
+    ) -> None:
+        """Build a heap in O(n) from people and chore assignments.
+
+        Args:
+            people: ``(person_id, rotation_rank)`` pairs.
+            chores: ``(chore_id, person_id)`` pairs; None is unassigned.
+        """
+        self._live: dict[int, list] = {}
+        self._heap: list[list] = []
+        self._loads: dict[int, int] = {}
+        self._assignees: dict[int, int] = {}
+        # Data version the contents were loaded at, if loaded from the DB
+        self.version: int | None = None
+        self.load(people, chores)
+
+    def __len__(self) -> int:
+        """Number of people in the heap."""
+        return len(self._live)
+
+    def load(
+        self,
+        people: Iterable[tuple[int, int]],
+        chores: Iterable[tuple[int, int | None]],
+    ) -> None:
+        """Replace the heap contents in O(n).
+
+        Args:
+            people: ``(person_id, rotation_rank)`` pairs.
+            chores: ``(chore_id, person_id)`` pairs; None is unassigned.
+        """
+        self._assignees = {
+            chore_id: person_id
+            for chore_id, person_id in chores
+            if person_id is not None
+        }
+        self._loads = {}
+        for person_id in self._assignees.values():
+            self._loads[person_id] = self._loads.get(person_id, 0) + 1
+        self._live = {
+            person_id: [self._loads.get(person_id, 0), rank, person_id, True]
+            for person_id, rank in people
+        }
+        self._heap = list(self._live.values())
+        heapq.heapify(self._heap)
+
+    def load_of(self, person_id: int) -> int:
+        """Get how many chores a person holds.
+
+        Args:
+            person_id: Person ID.
+
+        Returns:
+            int: Number of chores assigned to them.
+        """
+        return self._loads.get(person_id, 0)
+
+    def _replace(self, person_id: int, entry: list | None) -> None:
+        """Swap a person's heap entry, leaving the old one stale."""
+        old = self._live.pop(person_id, None)
+        if old is not None:
+            old[3] = False
+        if entry is not None:
+            self._live[person_id] = entry
+            heapq.heappush(self._heap, entry)
+        if len(self._heap) > 2 * len(self._live) + 16:
+            self._heap = [item for item in self._heap if item[3]]
+            heapq.heapify(self._heap)
+
+    def _add_load(self, person_id: int, delta: int) -> None:
+        """Move a person's load and their place in the heap."""
+        load = self._loads.get(person_id, 0) + delta
+        if load:
+            self._loads[person_id] = load
+        else:
+            self._loads.pop(person_id, None)
+        entry = self._live.get(person_id)
+        if entry is not None:
+            self._replace(person_id, [load, entry[1], person_id, True])
+
+    def set_person(self, person_id: int, rank: int) -> None:
+        """Add a person, or move them to a new rotation rank.
+
+        Args:
+            person_id: Person ID.
+            rank: Their rotation rank, used to break ties.
+        """
+        entry = self._live.get(person_id)
+        if entry is not None and entry[1] == rank:
+            return
+        load = self.load_of(person_id)
+        self._replace(person_id, [load, rank, person_id, True])
+
+    def discard_person(self, person_id: int) -> None:
+        """Stop offering a person chores.
+
+        Chores still assigned to them keep counting until reassigned.
+
+        Args:
+            person_id: Person ID.
+        """
+        self._replace(person_id, None)
+
+    def assign(self, chore_id: int, person_id: int | None) -> None:
+        """Record a chore's assignee, replacing its previous one.
+
+        Args:
+            chore_id: Chore ID.
+            person_id: New assignee; None leaves the chore unassigned.
+        """
+        previous = self._assignees.get(chore_id)
+        if previous == person_id:
+            return
+        if previous is not None:
+            self._add_load(previous, -1)
+        if person_id is None:
+            del self._assignees[chore_id]
+            return
+        self._assignees[chore_id] = person_id
+        self._add_load(person_id, 1)
+
+    def discard_chore(self, chore_id: int) -> None:
+        """Forget a deleted chore.
+
+        Args:
+            chore_id: Chore ID.
+        """
+        self.assign(chore_id, None)
+
+    def _prune(self) -> None:
+        """Drop stale entries from the top of the heap."""
+        while self._heap and not self._heap[0][3]:
+            heapq.heappop(self._heap)
+
+    def peek(self, exclude: int | None = None) -> int | None:
+        """Get the least loaded person without changing the heap.
+
+        Args:
+            exclude: Person to skip, e.g. the chore's current assignee.
+
+        Returns:
+            int: Person ID, or None if nobody else is in the heap.
+        """
+        self._prune()
+        if not self._heap:
+            return None
+        if self._heap[0][2] != exclude:
+            return self._heap[0][2]
+        # Set the excluded person aside to see who is next
+        top = heapq.heappop(self._heap)
+        self._prune()
+        person_id = self._heap[0][2] if self._heap else None
+        heapq.heappush(self._heap, top)
+        return person_id
@@ -4,10 +4,20 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    inspect,
+)
 from sqlalchemy.orm import relationship, validates
 
 from choreboss.models import Base
+from choreboss.recurrence import RECURRENCES
 
 
 class Chore(Base):
@@ -19,7 +29,21 @@ class Chore(Base):
     description = Column(String(500), nullable=False)
     person_id = Column(Integer, ForeignKey("people.id"), nullable=True)
     last_completed_date = Column(DateTime, nullable=True, default=None)
-    last_completed_id = Column(Integer, ForeignKey("people.id"), nullable=True)
+    last_completed_id = Column(
+        Integer,
+        ForeignKey("people.id"),
+        nullable=True,
+        index=True,
+    )
+    # Rule columns; see choreboss.recurrence
+    recurrence = Column(String(16), nullable=False, default="none")
+    recurrence_day = Column(Integer, nullable=True)
+    # Precomputed from the rule on create, edit and completion
+    next_due_at = Column(DateTime, nullable=True)
+    # next_due_at the last due reminder was sent for
+    reminded_due_at = Column(DateTime, nullable=True)
+    # Data version that last changed the row; NULL until its commit
+    change_version = Column(BigInteger, nullable=True, index=True)
     created_at = Column(
         DateTime,
         nullable=False,
@@ -44,6 +68,28 @@ class Chore(Base):
         primaryjoin="Chore.last_completed_id==People.id",
     )
 
+    __table_args__ = (
+        # Keyset listing order per filter; the first also covers the FK
+        Index("ix_chores_person_id_id", "person_id", "id"),
+        Index("ix_chores_completed", "last_completed_date", "id"),
+        Index("ix_chores_next_due", "next_due_at", "id"),
+        Index("ix_chores_person_next_due", "person_id", "next_due_at", "id"),
+    )
+
+    @property
+    def assignee(self):
+        """Assigned person if that relationship was loaded, else None."""
+        if "person" in inspect(self).unloaded:
+            return None
+        return self.person
+
+    @property
+    def last_completer(self):
+        """Last completing person if that relationship was loaded."""
+        if "last_completed_person" in inspect(self).unloaded:
+            return None
+        return self.last_completed_person
+
     @validates("id")
     def validate_id(self, key, value):
         """Validate ID field."""
@@ -93,3 +139,26 @@ class Chore(Base):
         if value is not None and not isinstance(value, int):
             raise AttributeError(f"{key} must be an integer")
         return value
+
+    @validates("recurrence")
+    def validate_recurrence(self, key, value):
+        """Validate recurrence field."""
+        if value not in RECURRENCES:
+            raise AttributeError(
+                f"{key} must be one of {', '.join(RECURRENCES)}"
+            )
+        return value
+
+    @validates("recurrence_day")
+    def validate_recurrence_day(self, key, value):
+        """Validate recurrence_day field."""
+        if value is not None and not isinstance(value, int):
+            raise AttributeError(f"{key} must be an integer")
+        return value
+
+    @validates("next_due_at", "reminded_due_at")
+    def validate_due_times(self, key, value):
+        """Validate next_due_at and reminded_due_at fields."""
+        if value is not None and not isinstance(value, datetime):
+            raise AttributeError(f"{key} must be a datetime object")
+        return value
@@ -0,0 +1,44 @@
+"""Chore completion history model."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Index, Integer
+
+# Importing triggers registers the completion triggers with the metadata
+from choreboss.models import Base, triggers  # noqa: F401
+
+
+class ChoreCompletion(Base):
+    """One completion of a chore, appended and never rewritten.
+
+    ``chore_id`` and ``person_id`` carry no foreign keys, like
+    ``RevokedToken.person_id``, so the history outlives deleted chores
+    and people.
+    """
+
+    __tablename__ = "chore_completions"
+    id = Column(Integer, primary_key=True)
+    chore_id = Column(Integer, nullable=False)
+    person_id = Column(Integer, nullable=False)
+    completed_at = Column(
+        DateTime,
+        nullable=False,
+        default=datetime.utcnow,
+    )
+
+    __table_args__ = (
+        # Newest-first history per chore and per person; SQLite appends
+        # the rowid, which breaks completed_at ties for the keyset order
+        Index(
+            "ix_chore_completions_chore_id_completed_at",
+            "chore_id",
+            "completed_at",
+        ),
+        Index(
+            "ix_chore_completions_person_id_completed_at",
+            "person_id",
+            "completed_at",
+        ),
+    )
@@ -0,0 +1,29 @@
+"""Per-person completion rollup models."""
+
+from __future__ import annotations
+
+from sqlalchemy import Column, Date, Integer
+
+from choreboss.models import Base
+
+
+class DailyCompletions(Base):
+    """Chores a person completed on one UTC day.
+
+    Keyed by ``(day, person_id)`` so a day's leaderboard is a primary key
+    range scan, and the completion path upserts a single row.
+    """
+
+    __tablename__ = "daily_completions"
+    day = Column(Date, primary_key=True)
+    person_id = Column(Integer, primary_key=True)
+    completions = Column(Integer, nullable=False, default=0)
+
+
+class WeeklyCompletions(Base):
+    """Chores a person completed in one week, starting on a UTC Monday."""
+
+    __tablename__ = "weekly_completions"
+    week_start = Column(Date, primary_key=True)
+    person_id = Column(Integer, primary_key=True)
+    completions = Column(Integer, nullable=False, default=0)
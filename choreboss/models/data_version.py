@@ -0,0 +1,19 @@
+"""Household data version model."""
+
+from __future__ import annotations
+
+from sqlalchemy import BigInteger, Column, Integer
+
+from choreboss.models import Base
+
+
+class DataVersion(Base):
+    """Single-row counter bumped by every transaction that writes data.
+
+    Readers compare it with the version their cached results were loaded
+    at, which keeps per-worker caches correct when another worker writes.
+    """
+
+    __tablename__ = "data_version"
+    id = Column(Integer, primary_key=True)
+    version = Column(BigInteger, nullable=False, default=0)
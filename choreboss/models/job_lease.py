@@ -0,0 +1,21 @@
+"""Background job lease model."""
+
+from __future__ import annotations
+
+from sqlalchemy import Column, DateTime, String
+
+from choreboss.models import Base
+
+
+class JobLease(Base):
+    """Which worker may run a background job, and until when.
+
+    One row per job name. A worker runs the job only while it holds an
+    unexpired lease, and renews it on every run; once the holder stops
+    renewing, any worker can take the lease over.
+    """
+
+    __tablename__ = "job_leases"
+    name = Column(String(64), primary_key=True)
+    holder = Column(String(128), nullable=False)
+    expires_at = Column(DateTime, nullable=False)
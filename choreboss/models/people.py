@@ -2,14 +2,34 @@
 
 from __future__ import annotations
 
-import bcrypt
 import re
 from datetime import date, datetime
 
-from sqlalchemy import Boolean, Column, Date, DateTime, Integer, String
+from sqlalchemy import (
+    BigInteger,
+    Boolean,
+    Column,
+    Date,
+    DateTime,
+    Index,
+    Integer,
+    String,
+    UniqueConstraint,
+    inspect,
+)
 from sqlalchemy.orm import relationship, validates
 
+from choreboss.hashing import get_password_hasher
 from choreboss.models import Base
+from choreboss.security import pin_fingerprint
+
+# Spacing between neighbouring rotation ranks after a rebalance
+RANK_GAP = 1 << 20
+
+
+def _default_rank(context) -> int:
+    """Rank rows inserted without one by their sequence number."""
+    return context.get_current_parameters()["sequence_num"] * RANK_GAP
 
 
 class People(Base):
@@ -22,8 +42,13 @@ class People(Base):
     login_name = Column(String(50), unique=True, nullable=False)
     birthday = Column(Date, nullable=False)
     pin = Column(String(255), nullable=False)
+    pin_fingerprint = Column(String(64), nullable=True, index=True)
     is_admin = Column(Boolean, default=False)
     sequence_num = Column(Integer, nullable=False)
+    # Sparse rotation order: moves take a rank between two neighbours
+    rotation_rank = Column(BigInteger, nullable=False, default=_default_rank)
+    # Data version that last changed the row; NULL until its commit
+    change_version = Column(BigInteger, nullable=True, index=True)
     created_at = Column(
         DateTime,
         nullable=False,
@@ -43,6 +68,18 @@ class People(Base):
         viewonly=False,
     )
 
+    __table_args__ = (
+        UniqueConstraint("sequence_num", name="uq_people_sequence_num"),
+        UniqueConstraint("rotation_rank", name="uq_people_rotation_rank"),
+        # Partial index: only admins are indexed, matching admins_exist()
+        Index(
+            "ix_people_admins",
+            "id",
+            postgresql_where=is_admin.is_(True),
+            sqlite_where=is_admin.is_(True),
+        ),
+    )
+
     @validates("first_name")
     def validate_first_name(self, key, value):
         """Validate first_name field."""
@@ -113,22 +150,38 @@ class People(Base):
             raise AttributeError(f"{key} must be an integer")
         return value
 
-    def set_pin(self, pin: str) -> None:
-        """Hash and set PIN.
+    @property
+    def assigned_chores(self):
+        """Assigned chores if that relationship was loaded, else None."""
+        if "chores" in inspect(self).unloaded:
+            return None
+        return self.chores
+
+    async def set_pin(self, pin: str) -> None:
+        """Hash and set PIN along with its lookup fingerprint.
+
+        The hash runs in the shared password hasher's worker pool, so it
+        is subject to the same overload bound as the API's hashing.
 
         Args:
             pin: Plain text PIN to hash.
+
+        Raises:
+            PasswordHasherOverloaded: If the hashing queue is full.
         """
-        hashed = bcrypt.hashpw(pin.encode("utf-8"), bcrypt.gensalt())
-        self.pin = hashed.decode("utf-8")
+        self.pin = await get_password_hasher().hash_pin(pin)
+        self.pin_fingerprint = pin_fingerprint(pin)
 
-    def verify_pin(self, pin: str) -> bool:
-        """Verify PIN against hash.
+    async def verify_pin(self, pin: str) -> bool:
+        """Verify PIN against hash in the shared password hasher.
 
         Args:
             pin: Plain text PIN to verify.
 
         Returns:
             bool: True if PIN matches.
+
+        Raises:
+            PasswordHasherOverloaded: If the hashing queue is full.
         """
-        return bcrypt.checkpw(pin.encode("utf-8"), self.pin.encode("utf-8"))
+        return await get_password_hasher().verify_pin(pin, self.pin)
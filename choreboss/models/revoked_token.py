@@ -0,0 +1,33 @@
+"""Revoked token model."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Integer, String
+
+from choreboss.models import Base
+
+
+class RevokedToken(Base):
+    """A revoked access token, or every token a person held before a time.
+
+    Rows with ``jti`` set revoke a single token (logout). Rows with
+    ``person_id`` and ``revoked_before`` set revoke every token issued to
+    that person up to that instant (PIN change, role demotion). Workers
+    sync by ``created_at``, re-reading an overlap window, since a row
+    with a lower ``id`` can commit after one with a higher ``id``.
+    """
+
+    __tablename__ = "revoked_tokens"
+    id = Column(Integer, primary_key=True)
+    jti = Column(String(32), nullable=True, index=True)
+    person_id = Column(Integer, nullable=True)
+    revoked_before = Column(DateTime, nullable=True)
+    expires_at = Column(DateTime, nullable=False, index=True)
+    created_at = Column(
+        DateTime,
+        nullable=False,
+        default=datetime.utcnow,
+        index=True,
+    )
@@ -0,0 +1,29 @@
+"""Deletion tombstone model."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import BigInteger, Column, DateTime, Integer, String
+
+from choreboss.models import Base
+
+
+class Tombstone(Base):
+    """Record of a deleted chore or person for delta sync clients.
+
+    ``entity`` is ``"chore"`` or ``"person"``. ``change_version`` is the
+    data version of the deleting transaction, stamped at commit like the
+    rows of the live tables.
+    """
+
+    __tablename__ = "tombstones"
+    id = Column(Integer, primary_key=True)
+    entity = Column(String(16), nullable=False)
+    entity_id = Column(Integer, nullable=False)
+    change_version = Column(BigInteger, nullable=True, index=True)
+    created_at = Column(
+        DateTime,
+        nullable=False,
+        default=datetime.utcnow,
+    )
@@ -0,0 +1,110 @@
+"""Triggers recording a completion in the statement that completes it.
+
+Setting a new ``chores.last_completed_date`` appends the completion to
+``chore_completions``, and each history row adds one to the completer's
+``daily_completions`` and ``weekly_completions`` rows (weeks start on
+Monday, as in ``stats_repository.week_start``). Completing a chore is
+then a single ``UPDATE`` from the application's side.
+
+Migration ``b3d9f6e2a871`` creates the same triggers on existing
+databases; ``Base.metadata.create_all`` creates them on new ones.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import DDL, event
+
+from choreboss.models import Base
+
+SQLITE = (
+    """
+    CREATE TRIGGER IF NOT EXISTS chores_record_completion
+    AFTER UPDATE OF last_completed_date ON chores
+    FOR EACH ROW
+    WHEN NEW.last_completed_date IS NOT NULL
+        AND NEW.last_completed_id IS NOT NULL
+        AND NEW.last_completed_date IS NOT OLD.last_completed_date
+    BEGIN
+        INSERT INTO chore_completions (chore_id, person_id, completed_at)
+        VALUES (NEW.id, NEW.last_completed_id, NEW.last_completed_date);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS chore_completions_roll_up
+    AFTER INSERT ON chore_completions
+    FOR EACH ROW
+    BEGIN
+        INSERT INTO daily_completions (day, person_id, completions)
+        VALUES (date(NEW.completed_at), NEW.person_id, 1)
+        ON CONFLICT (day, person_id)
+        DO UPDATE SET completions = completions + 1;
+        INSERT INTO weekly_completions (week_start, person_id, completions)
+        VALUES (
+            date(NEW.completed_at, '-6 days', 'weekday 1'),
+            NEW.person_id,
+            1
+        )
+        ON CONFLICT (week_start, person_id)
+        DO UPDATE SET completions = completions + 1;
+    END
+    """,
+)
+
+POSTGRESQL = (
+    """
+    CREATE OR REPLACE FUNCTION record_chore_completion() RETURNS trigger
+    AS $$
+    BEGIN
+        INSERT INTO chore_completions (chore_id, person_id, completed_at)
+        VALUES (NEW.id, NEW.last_completed_id, NEW.last_completed_date);
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE OR REPLACE TRIGGER chores_record_completion
+    AFTER UPDATE OF last_completed_date ON chores
+    FOR EACH ROW
+    WHEN (
+        NEW.last_completed_date IS NOT NULL
+        AND NEW.last_completed_id IS NOT NULL
+        AND NEW.last_completed_date IS DISTINCT FROM OLD.last_completed_date
+    )
+    EXECUTE FUNCTION record_chore_completion()
+    """,
+    """
+    CREATE OR REPLACE FUNCTION roll_up_chore_completion() RETURNS trigger
+    AS $$
+    BEGIN
+        INSERT INTO daily_completions (day, person_id, completions)
+        VALUES (NEW.completed_at::date, NEW.person_id, 1)
+        ON CONFLICT (day, person_id)
+        DO UPDATE SET completions = daily_completions.completions + 1;
+        INSERT INTO weekly_completions (week_start, person_id, completions)
+        VALUES (
+            date_trunc('week', NEW.completed_at)::date,
+            NEW.person_id,
+            1
+        )
+        ON CONFLICT (week_start, person_id)
+        DO UPDATE SET completions = weekly_completions.completions + 1;
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE OR REPLACE TRIGGER chore_completions_roll_up
+    AFTER INSERT ON chore_completions
+    FOR EACH ROW
+    EXECUTE FUNCTION roll_up_chore_completion()
+    """,
+)
+
+# Created after every table exists; each statement is safe to repeat
+for _dialect, _statements in (("sqlite", SQLITE), ("postgresql", POSTGRESQL)):
+    for _statement in _statements:
+        event.listen(
+            Base.metadata,
+            "after_create",
+            DDL(_statement).execute_if(dialect=_dialect),
+        )
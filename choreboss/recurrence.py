@@ -0,0 +1,177 @@
+"""Chore recurrence rules.
+
+A rule is a ``recurrence`` type plus an optional ``recurrence_day``:
+
+* ``none``: a one-off chore with no schedule.
+* ``daily``: due every day.
+* ``weekly``: due on weekday ``recurrence_day`` (0 is Monday), or seven
+  days after the last completion when no day is set.
+* ``monthly``: due on day ``recurrence_day`` of the month, moved back to
+  the last day in shorter months, or one month after the last completion
+  when no day is set.
+
+Chores are due at the start of the UTC day. Rules are only evaluated
+when a chore is created, edited or completed; the result is stored in
+``Chore.next_due_at`` so due queries are plain index range scans.
+"""
+
+from __future__ import annotations
+
+import calendar
+from datetime import date, datetime, time, timedelta
+
+RECURRENCES = ("none", "daily", "weekly", "monthly")
+_DAY_RANGES = {"weekly": range(0, 7), "monthly": range(1, 32)}
+
+
+def validate_rule(recurrence: str, recurrence_day: int | None) -> None:
+    """Check that a recurrence day fits its recurrence type.
+
+    Args:
+        recurrence: One of ``RECURRENCES``.
+        recurrence_day: Weekday (0-6) for weekly, day of month (1-31)
+            for monthly, None otherwise.
+
+    Raises:
+        ValueError: If the type is unknown or the day is out of range.
+    """
+    if recurrence not in RECURRENCES:
+        raise ValueError(f"Unknown recurrence: {recurrence}")
+    if recurrence_day is None:
+        return
+    days = _DAY_RANGES.get(recurrence)
+    if days is None:
+        raise ValueError(f"recurrence_day does not apply to {recurrence}")
+    if recurrence_day not in days:
+        raise ValueError(
+            f"recurrence_day for {recurrence} must be between "
+            f"{days.start} and {days.stop - 1}"
+        )
+
+
+def _day_in_month(year: int, month: int, day: int) -> date:
+    """Build a date, clamping ``day`` to the length of the month."""
+    return date(year, month, min(day, calendar.monthrange(year, month)[1]))
+
+
+def _add_month(day: date, monthday: int) -> date:
+    """Get day ``monthday`` of the month after ``day``'s month."""
+    year, month = divmod(day.year * 12 + day.month, 12)
+    return _day_in_month(year, month + 1, monthday)
+
+
+def next_due_at(
+    recurrence: str,
+    recurrence_day: int | None,
+    last_completed: datetime | None,
+    created: datetime,
+) -> datetime | None:
+    """Compute when a chore is next due.
+
+    A chore that was never completed is due on the first matching day on
+    or after the day it was created. After a completion, it is due on the
+    first matching day after the completion day.
+
+    Args:
+        recurrence: One of ``RECURRENCES``.
+        recurrence_day: Day the rule is pinned to, if any.
+        last_completed: Time of the last completion, if any.
+        created: Time the chore was created.
+
+    Returns:
+        datetime: Start of the UTC day the chore is due, or None for
+            one-off chores.
+
+    Raises:
+        ValueError: If the rule is invalid.
+    """
+    validate_rule(recurrence, recurrence_day)
+    if recurrence == "none":
+        return None
+    if last_completed is None:
+        start = created.date()
+        due = start
+        if recurrence == "weekly" and recurrence_day is not None:
+            due = start + timedelta(days=(recurrence_day - start.weekday()) % 7)
+        elif recurrence == "monthly" and recurrence_day is not None:
+            due = _day_in_month(start.year, start.month, recurrence_day)
+            if due < start:
+                due = _add_month(start, recurrence_day)
+        return datetime.combine(due, time.min)
+
+    done = last_completed.date()
+    if recurrence == "daily":
+        due = done + timedelta(days=1)
+    elif recurrence == "weekly":
+        if recurrence_day is None:
+            due = done + timedelta(days=7)
+        else:
+            due = done + timedelta(
+                days=(recurrence_day - done.weekday() - 1) % 7 + 1
+            )
+    elif recurrence_day is None:
+        due = _add_month(done, done.day)
+    else:
+        due = _day_in_month(done.year, done.month, recurrence_day)
+        if due <= done:
+            due = _add_month(done, recurrence_day)
+    return datetime.combine(due, time.min)
+
+
+def completion_schedule(
+    completed: datetime,
+) -> dict[str, tuple[datetime, dict[int, datetime]]]:
+    """Compute when each possible rule is next due after a completion.
+
+    A completion only depends on the completion day and the rule, so this
+    lets one ``UPDATE`` reschedule a chore without reading its rule first.
+
+    Args:
+        completed: Time of the completion.
+
+    Returns:
+        dict: For each recurring type, the due time when no day is pinned
+            and the due time for each day it can be pinned to.
+    """
+    return {
+        recurrence: (
+            next_due_at(recurrence, None, completed, completed),
+            {
+                day: next_due_at(recurrence, day, completed, completed)
+                for day in _DAY_RANGES.get(recurrence, ())
+            },
+        )
+        for recurrence in RECURRENCES
+        if recurrence != "none"
+    }
+
+
+def latest_due_at(
+    recurrence: str,
+    recurrence_day: int | None,
+    due_at: datetime,
+    now: datetime,
+) -> datetime:
+    """Roll a missed due time forward to the latest occurrence by now.
+
+    Missed occurrences of a recurring chore do not stack up: a daily
+    chore left undone for three days is due today, not three days ago.
+
+    Args:
+        recurrence: One of ``RECURRENCES``.
+        recurrence_day: Day the rule is pinned to, if any.
+        due_at: Current ``next_due_at``.
+        now: Current time.
+
+    Returns:
+        datetime: The latest occurrence at or before ``now``, or
+            ``due_at`` unchanged if no later one has passed.
+
+    Raises:
+        ValueError: If the rule is invalid.
+    """
+    while True:
+        following = next_due_at(recurrence, recurrence_day, due_at, due_at)
+        if following is None or following > now:
+            return due_at
+        due_at = following
@@ -2,7 +2,33 @@
 
 from __future__ import annotations
 
+from choreboss.repositories.change_repository import ChangeRepository
 from choreboss.repositories.chore_repository import ChoreRepository
-from choreboss.repositories.people_repository import PeopleRepository
+from choreboss.repositories.data_version import (
+    get_data_version,
+    list_cache,
+)
+from choreboss.repositories.lease_repository import LeaseRepository
+from choreboss.repositories.people_repository import (
+    AuthPrincipal,
+    PeopleRepository,
+)
+from choreboss.repositories.rows import ChoreRow, PersonRow
+from choreboss.repositories.stats_repository import StatsRepository
+from choreboss.repositories.token_revocation_repository import (
+    TokenRevocationRepository,
+)
 
-__all__ = ["ChoreRepository", "PeopleRepository"]
+__all__ = [
+    "AuthPrincipal",
+    "ChangeRepository",
+    "ChoreRepository",
+    "ChoreRow",
+    "LeaseRepository",
+    "PeopleRepository",
+    "PersonRow",
+    "StatsRepository",
+    "TokenRevocationRepository",
+    "get_data_version",
+    "list_cache",
+]
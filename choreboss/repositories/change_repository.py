@@ -0,0 +1,48 @@
+"""Async repository for the delta sync change log."""
+
+from __future__ import annotations
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from choreboss.models.tombstone import Tombstone
+from choreboss.repositories.data_version import get_data_version
+
+
+class ChangeRepository:
+    """Repository for data versions and deletion tombstones."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initialize repository with async session.
+
+        Args:
+            session: AsyncSession for database access.
+        """
+        self.session = session
+
+    async def get_current_version(self) -> int:
+        """Get the version of the latest committed write.
+
+        Returns:
+            int: Household data version.
+        """
+        return await get_data_version(self.session)
+
+    async def get_deletions_since(self, version: int) -> dict[str, list[int]]:
+        """Get IDs deleted by commits after a data version.
+
+        Args:
+            version: Data version the caller is already current with.
+
+        Returns:
+            dict: Deleted IDs keyed by entity (``chore``, ``person``).
+        """
+        result = await self.session.execute(
+            select(Tombstone.entity, Tombstone.entity_id)
+            .where(Tombstone.change_version > version)
+            .order_by(Tombstone.change_version, Tombstone.id)
+        )
+        deleted: dict[str, list[int]] = {"chore": [], "person": []}
+        for entity, entity_id in result:
+            deleted.setdefault(entity, []).append(entity_id)
+        return deleted
@@ -2,18 +2,75 @@
 
 from __future__ import annotations
 
+from collections.abc import Collection
 from datetime import datetime
 
-from sqlalchemy import select
+from sqlalchemy import (
+    and_,
+    case,
+    func,
+    or_,
+    select,
+    tuple_,
+    update,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import aliased, selectinload
 
+from choreboss.due_queue import DueQueue
 from choreboss.models.chore import Chore
+from choreboss.models.chore_completion import ChoreCompletion
+from choreboss.models.people import People
+from choreboss.models.tombstone import Tombstone
+from choreboss.recurrence import completion_schedule, next_due_at
+from choreboss.repositories.change_repository import ChangeRepository
+from choreboss.repositories.data_version import (
+    get_data_version,
+    has_pending_writes,
+    read_through,
+)
+from choreboss.repositories.rows import ChoreRow
+
+# Chores awaiting a due reminder, caught up from the change log
+due_queue = DueQueue()
+
+# Scheduled, and not yet reminded for the current due time
+_AWAITING_REMINDER = and_(
+    Chore.next_due_at.is_not(None),
+    or_(
+        Chore.reminded_due_at.is_(None),
+        Chore.reminded_due_at != Chore.next_due_at,
+    ),
+)
+
+
+def _next_due_after(completed_at: datetime):
+    """Build a CASE rescheduling a chore from its own recurrence rule.
+
+    Every rule's next due time is computed up front, so the ``UPDATE``
+    recording the completion can pick the chore's without reading it.
+    """
+    whens = []
+    for recurrence, (unpinned, pinned) in completion_schedule(
+        completed_at
+    ).items():
+        if pinned:
+            due = case(pinned, value=Chore.recurrence_day, else_=unpinned)
+        else:
+            due = unpinned
+        whens.append((Chore.recurrence == recurrence, due))
+    return case(*whens, else_=None)
 
 
 class ChoreRepository:
     """Repository for Chore model database operations."""
 
+    # ``expand`` names and the relationships they load
+    EXPANDABLE = {
+        "assignee": Chore.person,
+        "last_completer": Chore.last_completed_person,
+    }
+
     def __init__(self, session: AsyncSession) -> None:
         """Initialize repository with async session.
 
@@ -27,6 +84,8 @@ class ChoreRepository:
         name: str,
         description: str,
         person_id: int | None = None,
+        recurrence: str = "none",
+        recurrence_day: int | None = None,
     ) -> Chore:
         """Add a new chore to the database.
 
@@ -34,6 +93,8 @@ class ChoreRepository:
             name: Name of the chore.
             description: Description of the chore.
             person_id: Optional person ID to assign chore to.
+            recurrence: Recurrence type (see ``choreboss.recurrence``).
+            recurrence_day: Day the recurrence is pinned to, if any.
 
         Returns:
             Chore: Created chore object.
@@ -42,6 +103,8 @@ class ChoreRepository:
             name=name,
             description=description,
             person_id=person_id,
+            recurrence=recurrence,
+            recurrence_day=recurrence_day,
         )
         self.session.add(chore)
         await self.session.flush()
@@ -52,7 +115,11 @@ class ChoreRepository:
         chore_id: int,
         person_id: int,
     ) -> Chore | None:
-        """Mark a chore as completed.
+        """Mark a chore as completed and reschedule it.
+
+        The database appends the completion to the history and the
+        rollups when the flush sets ``last_completed_date``; see
+        ``choreboss.models.triggers``.
 
         Args:
             chore_id: ID of chore to complete.
@@ -63,11 +130,116 @@ class ChoreRepository:
         """
         chore = await self.get_chore_by_id(chore_id)
         if chore:
+            completed_at = datetime.utcnow()
             chore.last_completed_id = person_id
-            chore.last_completed_date = datetime.utcnow()
+            chore.last_completed_date = completed_at
+            chore.next_due_at = next_due_at(
+                chore.recurrence or "none",
+                chore.recurrence_day,
+                completed_at,
+                chore.created_at or completed_at,
+            )
             await self.session.flush()
         return chore
 
+    async def complete_and_rotate(
+        self,
+        chore_id: int,
+        person_id: int,
+    ) -> Chore | None:
+        """Mark a chore complete and hand it to the next person in one go.
+
+        A single ``UPDATE ... RETURNING`` records the completion, picks
+        the assignee's successor by ``rotation_rank`` in a subquery,
+        wrapping to the first person at the end of the rotation, and
+        reschedules the chore from its recurrence rule. Unassigned chores
+        stay unassigned. Triggers on the same statement append the
+        completion to the history and the rollups (see
+        ``choreboss.models.triggers``), so with the transaction's data
+        version bump a completion costs two statements.
+
+        Args:
+            chore_id: ID of chore to complete.
+            person_id: ID of person completing chore.
+
+        Returns:
+            Chore: Updated chore object or None if not found.
+        """
+        current = aliased(People)
+        successor = aliased(People)
+        first = aliased(People)
+        # Correlated explicitly: the enclosing SELECT has no chores FROM
+        current_rank = (
+            select(current.rotation_rank)
+            .where(current.id == Chore.person_id)
+            .correlate(Chore)
+            .scalar_subquery()
+        )
+        next_id = (
+            select(successor.id)
+            .where(successor.rotation_rank > current_rank)
+            .order_by(successor.rotation_rank)
+            .limit(1)
+            .scalar_subquery()
+        )
+        first_id = (
+            select(first.id)
+            .order_by(first.rotation_rank)
+            .limit(1)
+            .scalar_subquery()
+        )
+        completed_at = datetime.utcnow()
+        stmt = (
+            update(Chore)
+            .where(Chore.id == chore_id)
+            .values(
+                last_completed_id=person_id,
+                last_completed_date=completed_at,
+                person_id=case(
+                    (Chore.person_id.is_(None), None),
+                    else_=func.coalesce(next_id, first_id),
+                ),
+                next_due_at=_next_due_after(completed_at),
+            )
+            .returning(Chore)
+            .execution_options(populate_existing=True)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def list_completions(
+        self,
+        limit: int,
+        before: tuple | None = None,
+        chore_id: int | None = None,
+        person_id: int | None = None,
+    ) -> list[ChoreCompletion]:
+        """Retrieve one page of completion history, newest first.
+
+        Ordered by ``(completed_at, id)`` descending. Filtered by chore or
+        person, each page is a range scan of the matching composite index.
+
+        Args:
+            limit: Maximum number of completions to return.
+            before: Sort key of the last completion on the previous page.
+            chore_id: Only completions of this chore.
+            person_id: Only completions by this person.
+
+        Returns:
+            list: ChoreCompletion objects.
+        """
+        stmt = select(ChoreCompletion)
+        if chore_id is not None:
+            stmt = stmt.where(ChoreCompletion.chore_id == chore_id)
+        if person_id is not None:
+            stmt = stmt.where(ChoreCompletion.person_id == person_id)
+        order = (ChoreCompletion.completed_at, ChoreCompletion.id)
+        if before is not None:
+            stmt = stmt.where(tuple_(*order) < tuple_(*before))
+        stmt = stmt.order_by(*(column.desc() for column in order))
+        result = await self.session.execute(stmt.limit(limit))
+        return list(result.scalars())
+
     async def delete_chore(self, chore_id: int) -> None:
         """Delete a chore from the database.
 
@@ -77,31 +249,284 @@ class ChoreRepository:
         chore = await self.get_chore_by_id(chore_id)
         if chore:
             await self.session.delete(chore)
+            self.session.add(Tombstone(entity="chore", entity_id=chore_id))
             await self.session.flush()
 
-    async def get_all_chores(self) -> list[Chore]:
+    def _loaders(self, expand: Collection[str]) -> list:
+        """Build loader options for the requested relationships."""
+        return [selectinload(self.EXPANDABLE[name]) for name in expand]
+
+    async def get_all_chores(
+        self,
+        expand: Collection[str] = (),
+    ) -> list[ChoreRow]:
         """Retrieve all chores from the database.
 
+        Args:
+            expand: Names from ``EXPANDABLE`` to load with the chores.
+
         Returns:
-            list: All Chore objects.
+            list: All chores, as frozen rows.
         """
-        stmt = select(Chore).options(
-            selectinload(Chore.person),
+        stmt = select(Chore).options(*self._loaders(expand))
+
+        async def load() -> list[ChoreRow]:
+            result = await self.session.execute(stmt)
+            return [ChoreRow.of(chore) for chore in result.scalars().unique()]
+
+        key = ("chores", "all", frozenset(expand))
+        return await read_through(self.session, key, load)
+
+    async def list_chores(
+        self,
+        limit: int,
+        after: tuple | None = None,
+        person_id: int | None = None,
+        unassigned: bool = False,
+        completed_since: datetime | None = None,
+        expand: Collection[str] = (),
+    ) -> list[ChoreRow]:
+        """Retrieve one page of chores in a stable keyset order.
+
+        Chores are ordered by ``id``, or by ``(last_completed_date, id)``
+        when filtering on completion time, so each page is an index range
+        scan no matter how deep it is.
+
+        Args:
+            limit: Maximum number of chores to return.
+            after: Sort key of the last chore on the previous page.
+            person_id: Only chores assigned to this person.
+            unassigned: Only chores with no assignee.
+            completed_since: Only chores completed at or after this time.
+            expand: Names from ``EXPANDABLE`` to load with the chores.
+
+        Returns:
+            list: Chores, as frozen rows.
+        """
+        stmt = select(Chore).options(*self._loaders(expand))
+        if person_id is not None:
+            stmt = stmt.where(Chore.person_id == person_id)
+        elif unassigned:
+            stmt = stmt.where(Chore.person_id.is_(None))
+        if completed_since is not None:
+            stmt = stmt.where(Chore.last_completed_date >= completed_since)
+            order = (Chore.last_completed_date, Chore.id)
+        else:
+            order = (Chore.id,)
+        if after is not None:
+            stmt = stmt.where(tuple_(*order) > tuple_(*after))
+        stmt = stmt.order_by(*order).limit(limit)
+
+        async def load() -> list[ChoreRow]:
+            result = await self.session.execute(stmt)
+            return [ChoreRow.of(chore) for chore in result.scalars()]
+
+        key = (
+            "chores",
+            "page",
+            limit,
+            None if after is None else tuple(after),
+            person_id,
+            unassigned,
+            completed_since,
+            frozenset(expand),
+        )
+        return await read_through(self.session, key, load)
+
+    async def list_due(
+        self,
+        limit: int,
+        before: datetime,
+        after: tuple | None = None,
+        person_id: int | None = None,
+        unassigned: bool = False,
+        expand: Collection[str] = (),
+    ) -> list[Chore]:
+        """Retrieve one page of chores due before a time, most overdue first.
+
+        Ordered by ``(next_due_at, id)``, so each page is a range scan of
+        ``ix_chores_next_due``, or of ``ix_chores_person_next_due`` when
+        filtering by assignee. Not cached, since ``before`` is usually the
+        current time.
+
+        Args:
+            limit: Maximum number of chores to return.
+            before: Only chores due strictly before this time.
+            after: Sort key of the last chore on the previous page.
+            person_id: Only chores assigned to this person.
+            unassigned: Only chores with no assignee.
+            expand: Names from ``EXPANDABLE`` to load with the chores.
+
+        Returns:
+            list: Chore objects.
+        """
+        stmt = (
+            select(Chore)
+            .options(*self._loaders(expand))
+            .where(Chore.next_due_at < before)
+        )
+        if person_id is not None:
+            stmt = stmt.where(Chore.person_id == person_id)
+        elif unassigned:
+            stmt = stmt.where(Chore.person_id.is_(None))
+        order = (Chore.next_due_at, Chore.id)
+        if after is not None:
+            stmt = stmt.where(tuple_(*order) > tuple_(*after))
+        result = await self.session.execute(
+            stmt.order_by(*order).limit(limit)
+        )
+        return list(result.scalars())
+
+    async def get_missed(self, before: datetime) -> list[Chore]:
+        """Retrieve recurring chores that were due before a time.
+
+        Args:
+            before: Only chores due strictly before this time.
+
+        Returns:
+            list: Chore objects, most overdue first.
+        """
+        result = await self.session.execute(
+            select(Chore)
+            .where(Chore.next_due_at < before, Chore.recurrence != "none")
+            .order_by(Chore.next_due_at, Chore.id)
+        )
+        return list(result.scalars())
+
+    async def get_unreminded_due(
+        self,
+        since: datetime,
+        before: datetime,
+    ) -> list[Chore]:
+        """Retrieve chores that fell due in a window without a reminder.
+
+        Args:
+            since: Only chores due at or after this time.
+            before: Only chores due at or before this time.
+
+        Returns:
+            list: Chore objects, soonest due first.
+        """
+        result = await self.session.execute(
+            select(Chore)
+            .where(
+                Chore.next_due_at >= since,
+                Chore.next_due_at <= before,
+                _AWAITING_REMINDER,
+            )
+            .order_by(Chore.next_due_at, Chore.id)
+        )
+        return list(result.scalars())
+
+    async def get_changed_since(self, version: int) -> list[Chore]:
+        """Retrieve chores changed by commits after a data version.
+
+        Args:
+            version: Data version the caller is already current with.
+
+        Returns:
+            list: Changed Chore objects, oldest change first.
+        """
+        stmt = (
+            select(Chore)
+            .where(Chore.change_version > version)
+            .order_by(Chore.change_version, Chore.id)
         )
         result = await self.session.execute(stmt)
-        return result.scalars().unique().all()
+        return list(result.scalars())
+
+    async def get_assignments(
+        self,
+        since: int | None = None,
+    ) -> list[tuple[int, int | None]]:
+        """Retrieve every chore's assignee.
+
+        Args:
+            since: Only chores changed by commits after this data version.
+
+        Returns:
+            list: ``(chore_id, person_id)`` pairs; None is unassigned.
+        """
+        stmt = select(Chore.id, Chore.person_id)
+        if since is not None:
+            stmt = stmt.where(Chore.change_version > since)
+        result = await self.session.execute(stmt.order_by(Chore.id))
+        return [(chore_id, person_id) for chore_id, person_id in result]
 
-    async def get_chore_by_id(self, chore_id: int) -> Chore | None:
+    async def get_schedule(
+        self,
+        since: int | None = None,
+    ) -> list[tuple[int, datetime | None]]:
+        """Retrieve the due times of chores awaiting a due reminder.
+
+        Args:
+            since: Only chores changed by commits after this data version.
+                Changed chores that no longer await a reminder are then
+                included with a None due time.
+
+        Returns:
+            list: ``(chore_id, next_due_at)`` pairs, soonest first when
+                ``since`` is None.
+        """
+        if since is None:
+            stmt = (
+                select(Chore.id, Chore.next_due_at)
+                .where(_AWAITING_REMINDER)
+                .order_by(Chore.next_due_at, Chore.id)
+            )
+        else:
+            stmt = select(
+                Chore.id,
+                case((_AWAITING_REMINDER, Chore.next_due_at), else_=None),
+            ).where(Chore.change_version > since)
+        result = await self.session.execute(stmt)
+        return [(chore_id, due_at) for chore_id, due_at in result]
+
+    async def get_due_queue(self) -> DueQueue:
+        """Get the min-heap of chores awaiting a reminder, current for now.
+
+        Rather than reloading after every commit, the shared queue
+        replays the chores and tombstones stamped since the version it is
+        current with, each in O(log n), as ``LeastLoadedPolicy`` does for
+        its heap. A session with uncommitted writes gets a private queue
+        that includes them.
+
+        Returns:
+            DueQueue: Chores awaiting a reminder, soonest first.
+        """
+        version = await get_data_version(self.session)
+        if has_pending_writes(self.session):
+            return DueQueue(await self.get_schedule())
+        since = due_queue.version
+        if since is None or since > version:
+            due_queue.load(await self.get_schedule())
+        elif since < version:
+            # Deletions first, in case a new chore reused a deleted ID
+            changes = ChangeRepository(self.session)
+            deleted = await changes.get_deletions_since(since)
+            for chore_id in deleted["chore"]:
+                due_queue.discard(chore_id)
+            for chore_id, due_at in await self.get_schedule(since):
+                due_queue.push(chore_id, due_at)
+        due_queue.version = version
+        return due_queue
+
+    async def get_chore_by_id(
+        self,
+        chore_id: int,
+        expand: Collection[str] = (),
+    ) -> Chore | None:
         """Retrieve a chore by its ID.
 
         Args:
             chore_id: ID of chore to retrieve.
+            expand: Names from ``EXPANDABLE`` to load with the chore.
 
         Returns:
             Chore: Chore object or None if not found.
         """
         stmt = select(Chore).where(Chore.id == chore_id).options(
-            selectinload(Chore.person),
+            *self._loaders(expand),
         )
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
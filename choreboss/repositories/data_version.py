@@ -0,0 +1,203 @@
+"""Household data version tracking and the list query cache.
+
+The first write a transaction makes to chores, people or tombstones
+bumps ``data_version`` with ``UPDATE ... RETURNING``, and every row the
+transaction writes is stamped with the new ``change_version`` in the
+same statement that writes it. The bump and the stamps commit or roll
+back together with the write. The bump holds the ``data_version`` row
+lock until commit, which makes stamped versions follow commit order, so
+``change_version > since`` never skips a row that committed late.
+
+List queries go through ``read_through``, which serves a cached result
+only while the version it was loaded at is still current. Cached results
+are shared by every session, so they hold frozen rows (see
+``choreboss.repositories.rows``), never ORM instances.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable, Hashable
+
+from sqlalchemy import event, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from choreboss.cache import VersionedCache
+from choreboss.config import get_config
+from choreboss.models.chore import Chore
+from choreboss.models.data_version import DataVersion
+from choreboss.models.people import People
+from choreboss.models.tombstone import Tombstone
+
+# Tables stamped with the change version, by name
+TRACKED_TABLES = {
+    model.__tablename__: model.__table__
+    for model in (Chore, People, Tombstone)
+}
+_CHANGED = "choreboss.changed_tables"
+# Tables with rows inserted by statement, stamped just before commit
+_UNSTAMPED = "choreboss.unstamped_tables"
+# Version the current transaction bumped to, once it has written
+_VERSION = "choreboss.transaction_version"
+# Version the committing transaction bumped to, for after_commit hooks
+COMMITTED_VERSION = "choreboss.committed_version"
+_ROW_ID = 1
+
+_config = get_config()
+list_cache = VersionedCache(
+    _config.list_cache_max_entries,
+    _config.list_cache_ttl_seconds,
+)
+
+
+def _mark(session: Session, table_name: str) -> None:
+    """Record that the current transaction wrote to a table."""
+    session.info.setdefault(_CHANGED, set()).add(table_name)
+
+
+def _transaction_version(session: Session) -> int:
+    """Bump the data version on a transaction's first write.
+
+    Later calls in the same transaction return the same version.
+    """
+    version = session.info.get(_VERSION)
+    if version is not None:
+        return version
+    # Core statements on the connection skip the ORM hooks below
+    conn = session.connection()
+    version = conn.execute(
+        update(DataVersion)
+        .where(DataVersion.id == _ROW_ID)
+        .values(version=DataVersion.version + 1)
+        .returning(DataVersion.version)
+    ).scalar_one_or_none()
+    if version is None:
+        conn.execute(insert(DataVersion).values(id=_ROW_ID, version=1))
+        version = 1
+    session.info[_VERSION] = version
+    return version
+
+
+@event.listens_for(Session, "before_flush")
+def _mark_flushed_writes(session: Session, flush_context, instances) -> None:
+    """Mark flushed writes and stamp new and updated rows."""
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        name = getattr(obj, "__tablename__", None)
+        if name not in TRACKED_TABLES:
+            continue
+        if obj in session.dirty and not session.is_modified(obj):
+            continue
+        if obj not in session.deleted:
+            obj.change_version = _transaction_version(session)
+        _mark(session, name)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _mark_statement_writes(orm_execute_state) -> None:
+    """Mark bulk writes and stamp the rows an UPDATE changes."""
+    state = orm_execute_state
+    if not (state.is_insert or state.is_update or state.is_delete):
+        return
+    table = getattr(state.statement, "table", None)
+    name = getattr(table, "name", None)
+    if name not in TRACKED_TABLES:
+        return
+    if state.is_update:
+        state.statement = state.statement.values(
+            {table.c.change_version: _transaction_version(state.session)}
+        )
+    elif state.is_insert:
+        state.session.info.setdefault(_UNSTAMPED, set()).add(name)
+    _mark(state.session, name)
+
+
+@event.listens_for(Session, "before_commit")
+def _bump_on_commit(session: Session) -> None:
+    """Publish the transaction's version and stamp bulk-inserted rows."""
+    session.flush()
+    tables = session.info.pop(_CHANGED, None)
+    unstamped = session.info.pop(_UNSTAMPED, None)
+    if not tables:
+        return
+    version = _transaction_version(session)
+    session.info[COMMITTED_VERSION] = version
+    conn = session.connection()
+    for name in sorted(unstamped or ()):
+        table = TRACKED_TABLES[name]
+        conn.execute(
+            update(table)
+            .where(table.c.change_version.is_(None))
+            .values(change_version=version)
+        )
+
+
+@event.listens_for(Session, "after_commit")
+def _forget_committed_version(session: Session) -> None:
+    """Let the next transaction bump its own version."""
+    session.info.pop(_VERSION, None)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_rolled_back_writes(session: Session) -> None:
+    """Clear the write marks of a transaction that did not commit."""
+    session.info.pop(_CHANGED, None)
+    session.info.pop(_UNSTAMPED, None)
+    session.info.pop(_VERSION, None)
+
+
+def has_pending_writes(session: AsyncSession) -> bool:
+    """Check whether the session's transaction wrote uncommitted data.
+
+    Args:
+        session: Database session.
+
+    Returns:
+        bool: True if tracked rows were written since the last commit.
+    """
+    return bool(session.info.get(_CHANGED))
+
+
+async def get_data_version(session: AsyncSession) -> int:
+    """Read the current household data version.
+
+    Args:
+        session: Database session.
+
+    Returns:
+        int: Data version, 0 before the first write.
+    """
+    result = await session.execute(
+        select(DataVersion.version).where(DataVersion.id == _ROW_ID)
+    )
+    return result.scalar_one_or_none() or 0
+
+
+async def read_through[T](
+    session: AsyncSession,
+    key: Hashable,
+    load: Callable[[], Awaitable[list[T]]],
+) -> list[T]:
+    """Return a list query result from the cache, loading it on a miss.
+
+    A session with uncommitted writes always loads, since its own changes
+    are not part of any committed version.
+
+    Args:
+        session: Database session.
+        key: Query identity, including its parameters.
+        load: Coroutine function running the query. It must return
+            immutable values, such as frozen rows, since a cached
+            result is handed to every later caller.
+
+    Returns:
+        list: Query result.
+    """
+    version = await get_data_version(session)
+    if has_pending_writes(session):
+        return await load()
+    cached = list_cache.get(key, version)
+    if cached is not None:
+        return list(cached)
+    rows = await load()
+    list_cache.put(key, version, tuple(rows))
+    return list(rows)
@@ -0,0 +1,88 @@
+"""Async repository for background job leases."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+from sqlalchemy import insert, or_, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from choreboss.models.job_lease import JobLease
+
+
+class LeaseRepository:
+    """Repository electing one worker per background job.
+
+    Leases go through their own short transactions: acquire, commit,
+    then run the job in a separate session.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initialize repository with async session.
+
+        Args:
+            session: AsyncSession for database access.
+        """
+        self.session = session
+
+    async def try_acquire(
+        self,
+        name: str,
+        holder: str,
+        ttl_seconds: float,
+    ) -> bool:
+        """Take or renew a job lease unless another worker holds it.
+
+        A conditional UPDATE renews the caller's own lease or takes over
+        an expired one. If no row exists yet, the INSERT races other
+        workers on the primary key and only one succeeds. On PostgreSQL
+        a concurrent takeover re-checks the WHERE clause after the row
+        lock, so only one of two racing UPDATEs matches.
+
+        Args:
+            name: Job name.
+            holder: Unique ID of the calling worker.
+            ttl_seconds: How long the lease lasts without renewal.
+
+        Returns:
+            bool: True if the caller now holds the lease. On False the
+                session has been rolled back.
+        """
+        now = datetime.utcnow()
+        expires_at = now + timedelta(seconds=ttl_seconds)
+        result = await self.session.execute(
+            update(JobLease)
+            .where(
+                JobLease.name == name,
+                or_(JobLease.holder == holder, JobLease.expires_at <= now),
+            )
+            .values(holder=holder, expires_at=expires_at)
+        )
+        if result.rowcount:
+            return True
+        try:
+            await self.session.execute(
+                insert(JobLease).values(
+                    name=name,
+                    holder=holder,
+                    expires_at=expires_at,
+                )
+            )
+        except IntegrityError:
+            await self.session.rollback()
+            return False
+        return True
+
+    async def release(self, name: str, holder: str) -> None:
+        """Give up a lease early so another worker can take it at once.
+
+        Args:
+            name: Job name.
+            holder: Unique ID of the calling worker.
+        """
+        await self.session.execute(
+            update(JobLease)
+            .where(JobLease.name == name, JobLease.holder == holder)
+            .values(expires_at=datetime.utcnow())
+        )
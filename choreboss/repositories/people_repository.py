@@ -2,26 +2,54 @@
 
 from __future__ import annotations
 
-from typing import Optional
+from collections.abc import Collection
+from dataclasses import dataclass
 
-from sqlalchemy import func, select, update
+from sqlalchemy import case, delete, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from choreboss.hashing import (
+    PasswordHasher,
+    get_password_hasher,
+)
 from choreboss.models.chore import Chore
-from choreboss.models.people import People
+from choreboss.models.people import RANK_GAP, People
+from choreboss.models.tombstone import Tombstone
+from choreboss.repositories.data_version import read_through
+from choreboss.repositories.rows import PersonRow
+from choreboss.security import pin_fingerprint
+
+
+@dataclass(frozen=True, slots=True)
+class AuthPrincipal:
+    """Columns needed to authenticate a person, without ORM hydration."""
+
+    id: int
+    pin: str
+    is_admin: bool
+    pin_fingerprint: str | None
 
 
 class PeopleRepository:
     """Repository for People model database operations."""
 
-    def __init__(self, session: AsyncSession) -> None:
+    # ``expand`` names and the relationships they load
+    EXPANDABLE = {"chores": People.chores}
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        hasher: PasswordHasher | None = None,
+    ) -> None:
         """Initialize repository with async session.
 
         Args:
             session: AsyncSession for database access.
+            hasher: Password hasher (defaults to the shared instance).
         """
         self.session = session
+        self.hasher = hasher or get_password_hasher()
 
     async def add_person(
         self,
@@ -52,11 +80,12 @@ class PeopleRepository:
             last_name=last_name,
             login_name=resolved_login_name,
             birthday=birthday,
-            pin=pin,
+            pin=await self.hasher.hash_pin(pin),
+            pin_fingerprint=pin_fingerprint(pin),
             is_admin=is_admin,
             sequence_num=next_seq,
+            rotation_rank=await self.get_next_rank(),
         )
-        person.set_pin(pin)
         self.session.add(person)
         await self.session.flush()
         return person
@@ -85,22 +114,89 @@ class PeopleRepository:
             )
             .values(person_id=None, last_completed_id=None)
         )
-        person = await self.get_person_by_id(person_id)
-        if person:
-            await self.session.delete(person)
+        # Bulk delete: the chores were unassigned above, so there is no
+        # need to load them for the ORM to nullify
+        result = await self.session.execute(
+            delete(People).where(People.id == person_id)
+        )
+        if result.rowcount:
+            self.session.add(Tombstone(entity="person", entity_id=person_id))
             await self.session.flush()
 
-    async def get_all_people(self) -> list[People]:
+    def _loaders(self, expand: Collection[str]) -> list:
+        """Build loader options for the requested relationships."""
+        return [selectinload(self.EXPANDABLE[name]) for name in expand]
+
+    async def get_all_people(
+        self,
+        expand: Collection[str] = (),
+    ) -> list[PersonRow]:
         """Get all people from the database.
 
+        Args:
+            expand: Names from ``EXPANDABLE`` to load with the people.
+
         Returns:
-            list: All People objects ordered by sequence_num.
+            list: All people in rotation order, as frozen rows.
         """
-        stmt = select(People).order_by(People.sequence_num).options(
-            selectinload(People.chores),
+        stmt = select(People).order_by(People.rotation_rank).options(
+            *self._loaders(expand),
+        )
+
+        async def load() -> list[PersonRow]:
+            result = await self.session.execute(stmt)
+            return [
+                PersonRow.of(person) for person in result.scalars().unique()
+            ]
+
+        key = ("people", "all", frozenset(expand))
+        return await read_through(self.session, key, load)
+
+    async def list_people(
+        self,
+        limit: int,
+        after_rank: int | None = None,
+        expand: Collection[str] = (),
+    ) -> list[PersonRow]:
+        """Retrieve one page of people in rotation order.
+
+        Args:
+            limit: Maximum number of people to return.
+            after_rank: Rotation rank of the last person on the previous
+                page.
+            expand: Names from ``EXPANDABLE`` to load with the people.
+
+        Returns:
+            list: People, as frozen rows.
+        """
+        stmt = select(People).options(*self._loaders(expand))
+        if after_rank is not None:
+            stmt = stmt.where(People.rotation_rank > after_rank)
+        stmt = stmt.order_by(People.rotation_rank).limit(limit)
+
+        async def load() -> list[PersonRow]:
+            result = await self.session.execute(stmt)
+            return [PersonRow.of(person) for person in result.scalars()]
+
+        key = ("people", "page", limit, after_rank, frozenset(expand))
+        return await read_through(self.session, key, load)
+
+    async def get_changed_since(self, version: int) -> list[People]:
+        """Get people changed by commits after a data version.
+
+        Args:
+            version: Data version the caller is already current with.
+
+        Returns:
+            list: Changed People objects, oldest change first.
+        """
+        stmt = (
+            select(People)
+            .where(People.change_version > version)
+            .order_by(People.change_version, People.id)
         )
         result = await self.session.execute(stmt)
-        return result.scalars().unique().all()
+        return list(result.scalars())
 
     async def get_next_person_by_person_id(
         self,
@@ -118,11 +214,11 @@ class PeopleRepository:
         if not current:
             return None
 
-        # Get next person by sequence
+        # Get next person by rotation rank
         stmt = (
             select(People)
-            .where(People.sequence_num > current.sequence_num)
-            .order_by(People.sequence_num)
+            .where(People.rotation_rank > current.rotation_rank)
+            .order_by(People.rotation_rank)
             .limit(1)
         )
         result = await self.session.execute(stmt)
@@ -130,7 +226,7 @@ class PeopleRepository:
 
         # If no one after, wrap to first
         if not next_person:
-            stmt = select(People).order_by(People.sequence_num).limit(1)
+            stmt = select(People).order_by(People.rotation_rank).limit(1)
             result = await self.session.execute(stmt)
             next_person = result.scalar_one_or_none()
 
@@ -147,64 +243,236 @@ class PeopleRepository:
         max_seq = result.scalar()
         return 1 if max_seq is None else max_seq + 1
 
+    async def get_next_rank(self) -> int:
+        """Get a rotation rank after everyone currently in the rotation.
+
+        Returns:
+            int: Next rotation rank.
+        """
+        stmt = select(func.max(People.rotation_rank))
+        result = await self.session.execute(stmt)
+        max_rank = result.scalar()
+        return RANK_GAP if max_rank is None else max_rank + RANK_GAP
+
+    async def get_rank_order(
+        self,
+        since: int | None = None,
+    ) -> list[tuple[int, int]]:
+        """Get every person's ID and rotation rank, in rotation order.
+
+        Args:
+            since: Only people changed by commits after this data version.
+
+        Returns:
+            list: ``(person_id, rotation_rank)`` tuples.
+        """
+        stmt = select(People.id, People.rotation_rank)
+        if since is not None:
+            stmt = stmt.where(People.change_version > since)
+        result = await self.session.execute(
+            stmt.order_by(People.rotation_rank)
+        )
+        return [tuple(row) for row in result.all()]
+
+    async def get_auth_principal_by_id(
+        self,
+        person_id: int,
+    ) -> AuthPrincipal | None:
+        """Get the authentication columns for a person by ID.
+
+        Args:
+            person_id: ID of person to retrieve.
+
+        Returns:
+            AuthPrincipal: Projection or None if not found.
+        """
+        return await self._get_auth_principal(People.id == person_id)
+
+    async def get_auth_principal_by_login_name(
+        self,
+        login_name: str,
+    ) -> AuthPrincipal | None:
+        """Get the authentication columns for a person by login name.
+
+        Args:
+            login_name: Login name to look up (case-insensitive).
+
+        Returns:
+            AuthPrincipal: Projection or None if not found.
+        """
+        return await self._get_auth_principal(
+            People.login_name == login_name.lower()
+        )
+
+    async def _get_auth_principal(self, criterion) -> AuthPrincipal | None:
+        """Select the authentication columns for one person."""
+        stmt = select(
+            People.id,
+            People.pin,
+            People.is_admin,
+            People.pin_fingerprint,
+        ).where(criterion)
+        row = (await self.session.execute(stmt)).one_or_none()
+        if row is None:
+            return None
+        return AuthPrincipal(
+            id=row.id,
+            pin=row.pin,
+            is_admin=bool(row.is_admin),
+            pin_fingerprint=row.pin_fingerprint,
+        )
+
     async def get_person_by_login_name(self, login_name: str) -> People | None:
         """Get a person by their login name."""
-        stmt = select(People).where(People.login_name == login_name.lower()).options(
-            selectinload(People.chores),
-        )
+        stmt = select(People).where(People.login_name == login_name.lower())
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
-    async def get_person_by_id(self, person_id: int) -> People | None:
+    async def get_person_by_id(
+        self,
+        person_id: int,
+        expand: Collection[str] = (),
+    ) -> People | None:
         """Get a person by their ID.
 
         Args:
             person_id: ID of person to retrieve.
+            expand: Names from ``EXPANDABLE`` to load with the person.
 
         Returns:
             People: Person object or None if not found.
         """
         stmt = select(People).where(People.id == person_id).options(
-            selectinload(People.chores),
+            *self._loaders(expand),
         )
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
-    async def get_person_by_pin(self, pin: str) -> Optional[People]:
+    async def get_person_by_pin(self, pin: str) -> People | None:
         """Get a person by their PIN.
 
+        Candidates are resolved through the indexed ``pin_fingerprint``
+        column, so a match costs one query and one bcrypt verify. Rows
+        created before fingerprints existed are checked as a fallback and
+        backfilled when they match.
+
         Args:
             pin: PIN to look up.
 
         Returns:
             People: Person object or None if not found.
         """
-        stmt = select(People)
+        stmt = select(People).where(
+            People.pin_fingerprint == pin_fingerprint(pin)
+        )
         result = await self.session.execute(stmt)
-        people = result.scalars().all()
+        for person in result.scalars().all():
+            if await self.hasher.verify_pin(pin, person.pin):
+                return person
 
-        for person in people:
-            if person.verify_pin(pin):
+        stmt = select(People).where(People.pin_fingerprint.is_(None))
+        result = await self.session.execute(stmt)
+        for person in result.scalars().all():
+            if await self.hasher.verify_pin(pin, person.pin):
+                await self.backfill_pin_fingerprint(person, pin)
                 return person
         return None
 
-    async def is_admin(self, pin: str) -> bool:
-        """Check if a person with given PIN is an admin.
+    async def backfill_pin_fingerprint(self, person: People, pin: str) -> None:
+        """Store the PIN fingerprint for a person that predates it.
+
+        Call this only after ``pin`` has been verified against the person's
+        bcrypt hash; it is a no-op when the fingerprint is already set.
+
+        Args:
+            person: Person whose PIN was just verified.
+            pin: Verified plain text PIN.
+        """
+        if person.pin_fingerprint is None:
+            person.pin_fingerprint = pin_fingerprint(pin)
+            await self.session.flush()
+
+    async def backfill_pin_fingerprint_by_id(
+        self,
+        person_id: int,
+        pin: str,
+    ) -> None:
+        """Store a missing PIN fingerprint without loading the person.
+
+        Call this only after ``pin`` has been verified for the person.
+
+        Args:
+            person_id: ID of the person whose PIN was just verified.
+            pin: Verified plain text PIN.
+        """
+        await self.session.execute(
+            update(People)
+            .where(People.id == person_id, People.pin_fingerprint.is_(None))
+            .values(pin_fingerprint=pin_fingerprint(pin))
+        )
+
+    async def get_admin_by_pin(
+        self,
+        pin: str,
+        person_id: int | None = None,
+    ) -> People | None:
+        """Resolve the admin authorizing an action with a PIN.
+
+        When the caller already knows who is acting (e.g. from the session
+        or token), only that person's hash is verified. Otherwise the
+        candidate is found through the indexed PIN fingerprint, so the cost
+        is a single bcrypt verify regardless of how many admins exist.
 
         Args:
             pin: PIN to check.
+            person_id: Optional ID of the acting person.
 
         Returns:
-            bool: True if person is admin, False otherwise.
+            People: Matching admin or None.
         """
-        stmt = select(People).where(People.is_admin.is_(True))
+        if person_id is not None:
+            stmt = select(People).where(
+                People.id == person_id,
+                People.is_admin.is_(True),
+            )
+            result = await self.session.execute(stmt)
+            person = result.scalar_one_or_none()
+            if person and await self.hasher.verify_pin(pin, person.pin):
+                await self.backfill_pin_fingerprint(person, pin)
+                return person
+            return None
+
+        stmt = select(People).where(
+            People.is_admin.is_(True),
+            People.pin_fingerprint == pin_fingerprint(pin),
+        )
         result = await self.session.execute(stmt)
-        admins = result.scalars().all()
+        for person in result.scalars().all():
+            if await self.hasher.verify_pin(pin, person.pin):
+                return person
 
-        for person in admins:
-            if person.verify_pin(pin):
-                return True
-        return False
+        stmt = select(People).where(
+            People.is_admin.is_(True),
+            People.pin_fingerprint.is_(None),
+        )
+        result = await self.session.execute(stmt)
+        for person in result.scalars().all():
+            if await self.hasher.verify_pin(pin, person.pin):
+                await self.backfill_pin_fingerprint(person, pin)
+                return person
+        return None
+
+    async def is_admin(self, pin: str, person_id: int | None = None) -> bool:
+        """Check if a person with given PIN is an admin.
+
+        Args:
+            pin: PIN to check.
+            person_id: Optional ID of the acting person.
+
+        Returns:
+            bool: True if person is admin, False otherwise.
+        """
+        return await self.get_admin_by_pin(pin, person_id) is not None
 
     async def update_person(self, person: People) -> People:
         """Update a person's data.
@@ -218,6 +486,197 @@ class PeopleRepository:
         await self.session.flush()
         return person
 
+    async def park_sequences(self, person_ids: list[int]) -> None:
+        """Move people to temporary negative positions.
+
+        ``sequence_num`` and ``rotation_rank`` are unique, so a reorder that
+        swaps positions must first move the affected rows out of the way.
+        Each row is parked at ``-id``, which cannot collide with any real
+        position.
+
+        Args:
+            person_ids: IDs of people about to be resequenced.
+        """
+        if not person_ids:
+            return
+        await self.session.execute(
+            update(People)
+            .where(People.id.in_(person_ids))
+            .values(sequence_num=-People.id, rotation_rank=-People.id)
+            .execution_options(synchronize_session="fetch")
+        )
+
+    async def resequence(
+        self,
+        positions: dict[int, int],
+        batch_size: int = 500,
+    ) -> None:
+        """Apply a whole reorder with set-based updates.
+
+        Each person gets the given sequence number and a rotation rank
+        ``RANK_GAP`` apart from its neighbours, so this doubles as the rank
+        rebalance. The affected rows are parked first, then moved by
+        ``UPDATE ... SET ... = CASE id ... END`` in batches of
+        ``batch_size`` people, which keeps the statement under the
+        database's bound-parameter limit. Call within a transaction.
+
+        Args:
+            positions: New sequence number keyed by person ID.
+            batch_size: People per UPDATE statement.
+        """
+        if not positions:
+            return
+        person_ids = list(positions)
+        await self.park_sequences(person_ids)
+        for start in range(0, len(person_ids), batch_size):
+            batch = person_ids[start:start + batch_size]
+            await self.session.execute(
+                update(People)
+                .where(People.id.in_(batch))
+                .values(
+                    sequence_num=case(
+                        {pid: positions[pid] for pid in batch},
+                        value=People.id,
+                    ),
+                    rotation_rank=case(
+                        {pid: positions[pid] * RANK_GAP for pid in batch},
+                        value=People.id,
+                    ),
+                )
+                .execution_options(synchronize_session="fetch")
+            )
+
+    async def set_ranks(self, ranks: dict[int, int]) -> None:
+        """Give people new rotation ranks.
+
+        A single move is one UPDATE of one row. When several people move
+        at once their old ranks may sit where another's new rank lands, so
+        the rows are parked first.
+
+        Args:
+            ranks: New rotation rank keyed by person ID.
+        """
+        if not ranks:
+            return
+        if len(ranks) > 1:
+            await self.session.execute(
+                update(People)
+                .where(People.id.in_(list(ranks)))
+                .values(rotation_rank=-People.id)
+                .execution_options(synchronize_session="fetch")
+            )
+        await self.session.execute(
+            update(People)
+            .where(People.id.in_(list(ranks)))
+            .values(rotation_rank=case(ranks, value=People.id))
+            .execution_options(synchronize_session="fetch")
+        )
+
+    async def renumber_sequences(self) -> None:
+        """Renumber ``sequence_num`` to follow the rotation ranks.
+
+        Positions come from ``ROW_NUMBER()`` over the ranks, so this is two
+        set-based statements whatever the size of the rotation. Rows that
+        move are first written as negated positions and then flipped back,
+        as in ``close_sequence_gap``, so the unique constraint holds after
+        each row. Rows already in place are not written.
+        """
+        ordered = select(
+            People.id,
+            func.row_number()
+            .over(order_by=People.rotation_rank)
+            .label("position"),
+        ).subquery()
+        await self.session.execute(
+            update(People)
+            .where(
+                People.id == ordered.c.id,
+                People.sequence_num != ordered.c.position,
+            )
+            .values(sequence_num=-ordered.c.position)
+            .execution_options(synchronize_session="fetch")
+        )
+        await self.session.execute(
+            update(People)
+            .where(People.sequence_num < 0)
+            .values(sequence_num=-People.sequence_num)
+            .execution_options(synchronize_session="fetch")
+        )
+
+    async def rebalance_ranks(self, min_gap: int) -> bool:
+        """Respread rotation ranks once neighbours get too close.
+
+        Also renumbers ``sequence_num`` if it has drifted from the
+        rotation. Nothing is written while ranks are at least ``min_gap``
+        apart and sequence numbers are already in order.
+
+        Args:
+            min_gap: Smallest acceptable gap between neighbouring ranks.
+
+        Returns:
+            bool: True if the rotation was rewritten.
+        """
+        result = await self.session.execute(
+            select(
+                People.id,
+                People.rotation_rank,
+                People.sequence_num,
+            ).order_by(People.rotation_rank)
+        )
+        rows = result.all()
+        squeezed = any(
+            later.rotation_rank - earlier.rotation_rank < min_gap
+            for earlier, later in zip(rows, rows[1:], strict=False)
+        )
+        renumber = any(
+            row.sequence_num != position
+            for position, row in enumerate(rows, 1)
+        )
+        if not (squeezed or renumber):
+            return False
+        await self.resequence(
+            {row.id: position for position, row in enumerate(rows, 1)}
+        )
+        return True
+
+    async def close_sequence_gap(self, removed_sequence: int) -> None:
+        """Shift everyone after a removed position down by one.
+
+        Two bulk statements: the shifted rows are first written as negated
+        targets, which are unique because the originals were, and then
+        flipped back. Shifting in place would trip the unique constraint
+        on databases that check it row by row.
+
+        Args:
+            removed_sequence: Sequence number that was vacated.
+        """
+        await self.session.execute(
+            update(People)
+            .where(People.sequence_num > removed_sequence)
+            .values(sequence_num=1 - People.sequence_num)
+            .execution_options(synchronize_session="fetch")
+        )
+        await self.session.execute(
+            update(People)
+            .where(People.sequence_num < 0)
+            .values(sequence_num=-People.sequence_num)
+            .execution_options(synchronize_session="fetch")
+        )
+
+    async def get_sequence_num(self, person_id: int) -> int | None:
+        """Get a person's sequence number without loading the row.
+
+        Args:
+            person_id: ID of person.
+
+        Returns:
+            int: Sequence number, or None if the person does not exist.
+        """
+        result = await self.session.execute(
+            select(People.sequence_num).where(People.id == person_id)
+        )
+        return result.scalar_one_or_none()
+
     async def update_sequence(
         self,
         person_id: int,
@@ -0,0 +1,125 @@
+"""Immutable snapshots of chores and people for cached list results.
+
+The list cache is shared by every session in the worker, so it must not
+hold ORM instances: those belong to the session that loaded them, and a
+caller changing one would change every cached copy. List queries return
+these frozen rows instead. They carry the same attribute names as the
+models, so the API schemas read them the same way.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, datetime
+
+from choreboss.models.chore import Chore
+from choreboss.models.people import People
+
+
+@dataclass(frozen=True, slots=True)
+class PersonRow:
+    """A person's columns, without the PIN hash or fingerprint."""
+
+    id: int
+    first_name: str
+    last_name: str
+    login_name: str
+    birthday: date
+    is_admin: bool
+    sequence_num: int
+    rotation_rank: int
+    change_version: int | None
+    created_at: datetime
+    updated_at: datetime
+    # Only filled in when the relationship was loaded (``expand=chores``)
+    assigned_chores: tuple[ChoreRow, ...] | None = None
+
+    @classmethod
+    def of(cls, person: People, nested: bool = False) -> PersonRow:
+        """Snapshot a loaded person.
+
+        Args:
+            person: Person loaded in the current session.
+            nested: Leave out relationships, for rows embedded in another.
+
+        Returns:
+            PersonRow: Frozen copy of the person.
+        """
+        chores = None if nested else person.assigned_chores
+        return cls(
+            id=person.id,
+            first_name=person.first_name,
+            last_name=person.last_name,
+            login_name=person.login_name,
+            birthday=person.birthday,
+            is_admin=person.is_admin,
+            sequence_num=person.sequence_num,
+            rotation_rank=person.rotation_rank,
+            change_version=person.change_version,
+            created_at=person.created_at,
+            updated_at=person.updated_at,
+            assigned_chores=(
+                None
+                if chores is None
+                else tuple(ChoreRow.of(chore, nested=True) for chore in chores)
+            ),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class ChoreRow:
+    """A chore's columns."""
+
+    id: int
+    name: str
+    description: str
+    person_id: int | None
+    last_completed_date: datetime | None
+    last_completed_id: int | None
+    recurrence: str
+    recurrence_day: int | None
+    next_due_at: datetime | None
+    reminded_due_at: datetime | None
+    change_version: int | None
+    created_at: datetime
+    updated_at: datetime
+    # Only filled in when the relationship was loaded (``expand=...``)
+    assignee: PersonRow | None = None
+    last_completer: PersonRow | None = None
+
+    @classmethod
+    def of(cls, chore: Chore, nested: bool = False) -> ChoreRow:
+        """Snapshot a loaded chore.
+
+        Args:
+            chore: Chore loaded in the current session.
+            nested: Leave out relationships, for rows embedded in another.
+
+        Returns:
+            ChoreRow: Frozen copy of the chore.
+        """
+        assignee = None if nested else chore.assignee
+        last_completer = None if nested else chore.last_completer
+        return cls(
+            id=chore.id,
+            name=chore.name,
+            description=chore.description,
+            person_id=chore.person_id,
+            last_completed_date=chore.last_completed_date,
+            last_completed_id=chore.last_completed_id,
+            recurrence=chore.recurrence,
+            recurrence_day=chore.recurrence_day,
+            next_due_at=chore.next_due_at,
+            reminded_due_at=chore.reminded_due_at,
+            change_version=chore.change_version,
+            created_at=chore.created_at,
+            updated_at=chore.updated_at,
+            assignee=(
+                None if assignee is None
+                else PersonRow.of(assignee, nested=True)
+            ),
+            last_completer=(
+                None if last_completer is None
+                else PersonRow.of(last_completer, nested=True)
+            ),
+        )
@@ -0,0 +1,126 @@
+"""Async repository for per-person completion rollups.
+
+Each completion is counted by a trigger on ``chore_completions`` (see
+``choreboss.models.triggers``); this repository reads the rollups and
+rebuilds them from the history.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from datetime import date, timedelta
+
+from sqlalchemy import Date, delete, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from choreboss.models.chore_completion import ChoreCompletion
+from choreboss.models.completion_rollup import (
+    DailyCompletions,
+    WeeklyCompletions,
+)
+
+
+def week_start(day: date) -> date:
+    """Get the Monday starting the week that contains a day.
+
+    Args:
+        day: Any day.
+
+    Returns:
+        date: Monday of the same week.
+    """
+    return day - timedelta(days=day.weekday())
+
+
+class StatsRepository:
+    """Repository for the daily and weekly completion rollups."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initialize repository with async session.
+
+        Args:
+            session: AsyncSession for database access.
+        """
+        self.session = session
+
+    async def get_daily(self, day: date) -> list[DailyCompletions]:
+        """Get every person's completion count for a day.
+
+        Args:
+            day: UTC day.
+
+        Returns:
+            list: Rollup rows, most completions first.
+        """
+        result = await self.session.execute(
+            select(DailyCompletions)
+            .where(DailyCompletions.day == day)
+            .order_by(
+                DailyCompletions.completions.desc(),
+                DailyCompletions.person_id,
+            )
+        )
+        return list(result.scalars())
+
+    async def get_weekly(self, start: date) -> list[WeeklyCompletions]:
+        """Get every person's completion count for a week.
+
+        Args:
+            start: Monday the week starts on.
+
+        Returns:
+            list: Rollup rows, most completions first.
+        """
+        result = await self.session.execute(
+            select(WeeklyCompletions)
+            .where(WeeklyCompletions.week_start == start)
+            .order_by(
+                WeeklyCompletions.completions.desc(),
+                WeeklyCompletions.person_id,
+            )
+        )
+        return list(result.scalars())
+
+    async def rebuild(self) -> tuple[int, int]:
+        """Recompute both rollups from the completion history.
+
+        The history is grouped by person and day in the database; weeks
+        are summed from those day rows. Completions committed by other
+        transactions while this one runs may be missed, so run it while
+        the household is quiet.
+
+        Returns:
+            tuple: Number of daily and weekly rows written.
+        """
+        day = func.date(ChoreCompletion.completed_at, type_=Date)
+        result = await self.session.execute(
+            select(ChoreCompletion.person_id, day, func.count())
+            .group_by(ChoreCompletion.person_id, day)
+        )
+        daily = [
+            {"person_id": person_id, "day": completed_on, "completions": n}
+            for person_id, completed_on, n in result
+        ]
+        weekly: Counter[tuple[int, date]] = Counter()
+        for row in daily:
+            weekly[row["person_id"], week_start(row["day"])] += (
+                row["completions"]
+            )
+
+        await self.session.execute(delete(DailyCompletions))
+        await self.session.execute(delete(WeeklyCompletions))
+        if daily:
+            await self.session.execute(insert(DailyCompletions), daily)
+        if weekly:
+            await self.session.execute(
+                insert(WeeklyCompletions),
+                [
+                    {
+                        "person_id": person_id,
+                        "week_start": start,
+                        "completions": n,
+                    }
+                    for (person_id, start), n in weekly.items()
+                ],
+            )
+        return len(daily), len(weekly)
@@ -0,0 +1,102 @@
+"""Async repository for persisted token revocations."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from choreboss.models.revoked_token import RevokedToken
+
+
+class TokenRevocationRepository:
+    """Repository for RevokedToken database operations."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initialize repository with async session.
+
+        Args:
+            session: AsyncSession for database access.
+        """
+        self.session = session
+
+    async def revoke_token(
+        self,
+        jti: str,
+        expires_at: datetime,
+    ) -> RevokedToken:
+        """Revoke a single token.
+
+        Args:
+            jti: Token identifier claim.
+            expires_at: When the token would have expired anyway.
+
+        Returns:
+            RevokedToken: Created revocation row.
+        """
+        revocation = RevokedToken(jti=jti, expires_at=expires_at)
+        self.session.add(revocation)
+        await self.session.flush()
+        return revocation
+
+    async def revoke_person(
+        self,
+        person_id: int,
+        revoked_before: datetime,
+        expires_at: datetime,
+    ) -> RevokedToken:
+        """Revoke every token issued to a person up to a point in time.
+
+        Args:
+            person_id: Person whose tokens are revoked.
+            revoked_before: Tokens issued at or before this are invalid.
+            expires_at: When the newest affected token expires.
+
+        Returns:
+            RevokedToken: Created revocation row.
+        """
+        revocation = RevokedToken(
+            person_id=person_id,
+            revoked_before=revoked_before,
+            expires_at=expires_at,
+        )
+        self.session.add(revocation)
+        await self.session.flush()
+        return revocation
+
+    async def get_revocations_since(
+        self,
+        created_since: datetime | None = None,
+    ) -> list[RevokedToken]:
+        """Get unexpired revocations recorded at or after a point in time.
+
+        Args:
+            created_since: Earliest ``created_at`` to return, or None for
+                every unexpired revocation.
+
+        Returns:
+            list: RevokedToken rows ordered by creation.
+        """
+        stmt = select(RevokedToken).where(
+            RevokedToken.expires_at > datetime.utcnow()
+        )
+        if created_since is not None:
+            stmt = stmt.where(RevokedToken.created_at >= created_since)
+        result = await self.session.execute(
+            stmt.order_by(RevokedToken.created_at, RevokedToken.id)
+        )
+        return result.scalars().all()
+
+    async def delete_expired(self) -> int:
+        """Delete revocations for tokens that have expired anyway.
+
+        Returns:
+            int: Number of rows deleted.
+        """
+        result = await self.session.execute(
+            delete(RevokedToken).where(
+                RevokedToken.expires_at <= datetime.utcnow()
+            )
+        )
+        return result.rowcount
@@ -0,0 +1,49 @@
+"""Security helpers shared by models and repositories."""
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+
+from choreboss.config import get_config
+
+
+def get_pin_pepper() -> str:
+    """Get the HMAC key for PIN fingerprints.
+
+    The pepper is its own setting, never derived from ``SECRET_KEY``, so
+    rotating the JWT key does not silently change every fingerprint.
+
+    Returns:
+        str: Configured ``PIN_PEPPER``.
+
+    Raises:
+        RuntimeError: If ``PIN_PEPPER`` is not set.
+    """
+    pepper = get_config().pin_pepper
+    if not pepper:
+        raise RuntimeError("PIN_PEPPER must be set")
+    return pepper
+
+
+def pin_fingerprint(pin: str) -> str:
+    """Compute the keyed lookup fingerprint for a PIN.
+
+    The fingerprint is an HMAC-SHA256 of the PIN under a server-side
+    pepper, so it can be stored in an indexed column and compared with an
+    equality query without exposing the PIN to offline guessing.
+
+    Args:
+        pin: Plain text PIN.
+
+    Returns:
+        str: Hex-encoded HMAC digest.
+
+    Raises:
+        RuntimeError: If ``PIN_PEPPER`` is not set.
+    """
+    return hmac.new(
+        get_pin_pepper().encode("utf-8"),
+        pin.encode("utf-8"),
+        hashlib.sha256,
+    ).hexdigest()
@@ -2,7 +2,24 @@
 
 from __future__ import annotations
 
+from choreboss.services.assignment_policy import (
+    LeastLoadedPolicy,
+    RotationPolicy,
+    get_assignment_policy,
+)
 from choreboss.services.chore_service import ChoreService
 from choreboss.services.people_service import PeopleService
+from choreboss.services.stats_service import CompletionStats, StatsService
+from choreboss.services.sync_service import ChangeSet, SyncService
 
-__all__ = ["ChoreService", "PeopleService"]
+__all__ = [
+    "ChangeSet",
+    "ChoreService",
+    "CompletionStats",
+    "LeastLoadedPolicy",
+    "PeopleService",
+    "RotationPolicy",
+    "StatsService",
+    "SyncService",
+    "get_assignment_policy",
+]
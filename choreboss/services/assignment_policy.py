@@ -0,0 +1,169 @@
+"""Policies choosing who a chore goes to once it is completed."""
+
+from __future__ import annotations
+
+from choreboss.config import get_config
+from choreboss.load_heap import LoadHeap
+from choreboss.models.chore import Chore
+from choreboss.repositories.change_repository import ChangeRepository
+from choreboss.repositories.chore_repository import ChoreRepository
+from choreboss.repositories.data_version import has_pending_writes
+from choreboss.repositories.people_repository import PeopleRepository
+
+# Shared loads, caught up from the change log whenever the version moves
+load_heap = LoadHeap()
+
+
+class RotationPolicy:
+    """Hand a completed chore to the next person by rotation rank."""
+
+    name = "rotation"
+
+    async def complete(
+        self,
+        chore_repository: ChoreRepository,
+        people_repository: PeopleRepository,
+        chore_id: int,
+        person_id: int,
+    ) -> Chore | None:
+        """Complete a chore and rotate it in a single statement.
+
+        Args:
+            chore_repository: Repository for chore data access.
+            people_repository: Repository for people data access.
+            chore_id: ID of chore to complete.
+            person_id: ID of person completing it.
+
+        Returns:
+            Chore: Updated chore object, or None if not found.
+        """
+        return await chore_repository.complete_and_rotate(chore_id, person_id)
+
+
+class LeastLoadedPolicy:
+    """Hand a completed chore to whoever holds the fewest chores.
+
+    Loads come from a ``LoadHeap``. Rather than reloading it after every
+    commit, the heap replays the chores, people and tombstones stamped
+    since the version it is current with, each in O(log n).
+    """
+
+    name = "least_loaded"
+
+    def __init__(self, heap: LoadHeap | None = None) -> None:
+        """Initialize the policy.
+
+        Args:
+            heap: Heap to keep current; defaults to the shared one.
+        """
+        self.heap = load_heap if heap is None else heap
+
+    async def get_heap(
+        self,
+        chore_repository: ChoreRepository,
+        people_repository: PeopleRepository,
+    ) -> LoadHeap:
+        """Get the load heap, current for this session.
+
+        The version is read before the changes, so a commit landing in
+        between is replayed now and again next time; replaying a change
+        is harmless. A session with uncommitted writes gets a private
+        heap that includes them.
+
+        Args:
+            chore_repository: Repository for chore data access.
+            people_repository: Repository for people data access.
+
+        Returns:
+            LoadHeap: People by open-chore count.
+        """
+        session = chore_repository.session
+        change_repository = ChangeRepository(session)
+        version = await change_repository.get_current_version()
+        if has_pending_writes(session):
+            return LoadHeap(
+                await people_repository.get_rank_order(),
+                await chore_repository.get_assignments(),
+            )
+        heap = self.heap
+        since = heap.version
+        if since is None or since > version:
+            heap.load(
+                await people_repository.get_rank_order(),
+                await chore_repository.get_assignments(),
+            )
+        elif since < version:
+            for person_id, rank in await people_repository.get_rank_order(
+                since
+            ):
+                heap.set_person(person_id, rank)
+            for chore_id, person_id in await chore_repository.get_assignments(
+                since
+            ):
+                heap.assign(chore_id, person_id)
+            deleted = await change_repository.get_deletions_since(since)
+            for chore_id in deleted["chore"]:
+                heap.discard_chore(chore_id)
+            for person_id in deleted["person"]:
+                heap.discard_person(person_id)
+        heap.version = version
+        return heap
+
+    async def complete(
+        self,
+        chore_repository: ChoreRepository,
+        people_repository: PeopleRepository,
+        chore_id: int,
+        person_id: int,
+    ) -> Chore | None:
+        """Complete a chore and reassign it to the least loaded person.
+
+        The chore never goes back to its current assignee unless nobody
+        else is in the rotation. Unassigned chores stay unassigned.
+
+        Args:
+            chore_repository: Repository for chore data access.
+            people_repository: Repository for people data access.
+            chore_id: ID of chore to complete.
+            person_id: ID of person completing it.
+
+        Returns:
+            Chore: Updated chore object, or None if not found.
+        """
+        heap = await self.get_heap(chore_repository, people_repository)
+        chore = await chore_repository.complete_chore(chore_id, person_id)
+        if chore is None or chore.person_id is None:
+            return chore
+        successor = heap.peek(exclude=chore.person_id)
+        if successor is not None:
+            chore.person_id = successor
+            await chore_repository.update_chore(chore)
+        return chore
+
+
+AssignmentPolicy = RotationPolicy | LeastLoadedPolicy
+
+POLICIES: dict[str, type[AssignmentPolicy]] = {
+    RotationPolicy.name: RotationPolicy,
+    LeastLoadedPolicy.name: LeastLoadedPolicy,
+}
+
+_policy: AssignmentPolicy | None = None
+
+
+def get_assignment_policy() -> AssignmentPolicy:
+    """Get the configured assignment policy singleton.
+
+    Returns:
+        AssignmentPolicy: Policy named by ``ASSIGNMENT_POLICY``.
+
+    Raises:
+        ValueError: If the configured policy is unknown.
+    """
+    global _policy
+    if _policy is None:
+        name = get_config().assignment_policy
+        if name not in POLICIES:
+            raise ValueError(f"Unknown assignment policy: {name}")
+        _policy = POLICIES[name]()
+    return _policy
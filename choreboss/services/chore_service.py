@@ -2,8 +2,24 @@
 
 from __future__ import annotations
 
+from collections.abc import Collection
+from datetime import datetime, timedelta
+
+from choreboss.events import publish_after_commit
+from choreboss.models.chore import Chore
+from choreboss.models.chore_completion import ChoreCompletion
+from choreboss.recurrence import (
+    latest_due_at,
+    next_due_at,
+    validate_rule,
+)
 from choreboss.repositories.chore_repository import ChoreRepository
 from choreboss.repositories.people_repository import PeopleRepository
+from choreboss.repositories.rows import ChoreRow
+from choreboss.services.assignment_policy import (
+    AssignmentPolicy,
+    get_assignment_policy,
+)
 
 
 class ChoreService:
@@ -13,21 +29,49 @@ class ChoreService:
         self,
         chore_repository: ChoreRepository,
         people_repository: PeopleRepository,
+        assignment_policy: AssignmentPolicy | None = None,
     ) -> None:
         """Initialize chore service.
 
         Args:
             chore_repository: Repository for chore data access.
             people_repository: Repository for people data access.
+            assignment_policy: Who completed chores go to next; defaults
+                to the configured policy.
         """
         self.chore_repository = chore_repository
         self.people_repository = people_repository
+        self.assignment_policy = (
+            assignment_policy or get_assignment_policy()
+        )
+
+    def _publish(self, event_type: str, **data) -> None:
+        """Announce a change once the current transaction commits."""
+        publish_after_commit(self.chore_repository.session, event_type, **data)
+
+    @staticmethod
+    def _reschedule(chore: Chore) -> None:
+        """Recompute ``next_due_at`` from the chore's recurrence rule.
+
+        Raises:
+            ValueError: If the rule is invalid.
+        """
+        due_at = next_due_at(
+            chore.recurrence or "none",
+            chore.recurrence_day,
+            chore.last_completed_date,
+            chore.created_at or datetime.utcnow(),
+        )
+        if due_at != chore.next_due_at:
+            chore.next_due_at = due_at
 
     async def add_chore(
         self,
         name: str,
         description: str,
         person_id: int | None = None,
+        recurrence: str = "none",
+        recurrence_day: int | None = None,
     ):
         """Add a new chore.
 
@@ -35,15 +79,26 @@ class ChoreService:
             name: Name of the chore.
             description: Description of the chore.
             person_id: Optional ID of person to assign to.
+            recurrence: Recurrence type (see ``choreboss.recurrence``).
+            recurrence_day: Day the recurrence is pinned to, if any.
 
         Returns:
             Chore: Created chore object.
+
+        Raises:
+            ValueError: If the recurrence rule is invalid.
         """
-        return await self.chore_repository.add_chore(
+        validate_rule(recurrence, recurrence_day)
+        chore = await self.chore_repository.add_chore(
             name=name,
             description=description,
             person_id=person_id,
+            recurrence=recurrence,
+            recurrence_day=recurrence_day,
         )
+        self._reschedule(chore)
+        self._publish("chore.created", chore_id=chore.id)
+        return chore
 
     async def complete_chore(
         self,
@@ -52,25 +107,32 @@ class ChoreService:
     ):
         """Mark a chore as complete and auto-assign next person.
 
+        The assignment policy picks the next person; see
+        ``choreboss.services.assignment_policy``. The repository
+        reschedules the chore from its recurrence rule in the completing
+        statement, and the database appends the completion to the history
+        and the completer's daily and weekly rollups.
+
         Args:
             chore_id: ID of chore to complete.
             person_id: ID of person completing it.
 
         Returns:
-            Chore: Updated chore object.
+            Chore: Updated chore object, or None if not found.
         """
-        # Mark complete
-        chore = await self.chore_repository.complete_chore(chore_id, person_id)
-
-        if chore and chore.person_id:
-            # Auto-assign next person in rotation
-            next_person = await self.people_repository.get_next_person_by_person_id(
-                chore.person_id
+        chore = await self.assignment_policy.complete(
+            self.chore_repository,
+            self.people_repository,
+            chore_id,
+            person_id,
+        )
+        if chore is not None:
+            self._publish(
+                "chore.completed",
+                chore_id=chore.id,
+                completed_by=person_id,
+                person_id=chore.person_id,
             )
-            if next_person:
-                chore.person_id = next_person.id
-                await self.chore_repository.update_chore(chore)
-
         return chore
 
     async def delete_chore(self, chore_id: int) -> None:
@@ -80,33 +142,255 @@ class ChoreService:
             chore_id: ID of chore to delete.
         """
         await self.chore_repository.delete_chore(chore_id)
+        self._publish("chore.deleted", chore_id=chore_id)
 
-    async def get_all_chores(self):
+    async def get_all_chores(
+        self,
+        expand: Collection[str] = (),
+    ) -> list[ChoreRow]:
         """Retrieve all chores.
 
+        Args:
+            expand: Relationships to load (see
+                ``ChoreRepository.EXPANDABLE``).
+
+        Returns:
+            list: All chores, as frozen rows.
+        """
+        return await self.chore_repository.get_all_chores(expand)
+
+    async def list_chores(
+        self,
+        limit: int,
+        after: list | None = None,
+        person_id: int | None = None,
+        unassigned: bool = False,
+        completed_since: datetime | None = None,
+        expand: Collection[str] = (),
+    ) -> tuple[list[ChoreRow], list | None]:
+        """Retrieve one page of chores and the key to resume after it.
+
+        Args:
+            limit: Page size.
+            after: Key returned with the previous page.
+            person_id: Only chores assigned to this person.
+            unassigned: Only chores with no assignee.
+            completed_since: Only chores completed at or after this time.
+            expand: Relationships to load (see
+                ``ChoreRepository.EXPANDABLE``).
+
+        Returns:
+            tuple: Chores on this page, and the JSON-serializable key of
+                the next page or None if this is the last one.
+
+        Raises:
+            TypeError, ValueError: If ``after`` does not match the
+                requested order.
+        """
+        if after is None:
+            key = None
+        elif completed_since is not None:
+            key = (datetime.fromisoformat(str(after[0])), int(after[1]))
+        else:
+            key = (int(after[0]),)
+        chores = await self.chore_repository.list_chores(
+            limit + 1,
+            after=key,
+            person_id=person_id,
+            unassigned=unassigned,
+            completed_since=completed_since,
+            expand=expand,
+        )
+        if len(chores) <= limit:
+            return chores, None
+        chores = chores[:limit]
+        last = chores[-1]
+        if completed_since is not None:
+            return chores, [last.last_completed_date.isoformat(), last.id]
+        return chores, [last.id]
+
+    async def list_due(
+        self,
+        limit: int,
+        before: datetime,
+        after: list | None = None,
+        person_id: int | None = None,
+        unassigned: bool = False,
+        expand: Collection[str] = (),
+    ) -> tuple[list[Chore], list | None]:
+        """Retrieve one page of due chores and the key to resume after it.
+
+        Args:
+            limit: Page size.
+            before: Only chores due strictly before this time.
+            after: Key returned with the previous page.
+            person_id: Only chores assigned to this person.
+            unassigned: Only chores with no assignee.
+            expand: Relationships to load (see
+                ``ChoreRepository.EXPANDABLE``).
+
+        Returns:
+            tuple: Chores on this page, most overdue first, and the
+                JSON-serializable key of the next page or None if this is
+                the last one.
+
+        Raises:
+            TypeError, ValueError: If ``after`` is not a due-order key.
+        """
+        key = None
+        if after is not None:
+            key = (datetime.fromisoformat(str(after[0])), int(after[1]))
+        chores = await self.chore_repository.list_due(
+            limit + 1,
+            before,
+            after=key,
+            person_id=person_id,
+            unassigned=unassigned,
+            expand=expand,
+        )
+        if len(chores) <= limit:
+            return chores, None
+        chores = chores[:limit]
+        last = chores[-1]
+        return chores, [last.next_due_at.isoformat(), last.id]
+
+    async def list_completions(
+        self,
+        limit: int,
+        before: list | None = None,
+        chore_id: int | None = None,
+        person_id: int | None = None,
+    ) -> tuple[list[ChoreCompletion], list | None]:
+        """Retrieve one page of completion history and the key after it.
+
+        Args:
+            limit: Page size.
+            before: Key returned with the previous page.
+            chore_id: Only completions of this chore.
+            person_id: Only completions by this person.
+
         Returns:
-            list: All chore objects.
+            tuple: Completions on this page, newest first, and the
+                JSON-serializable key of the next page or None if this is
+                the last one.
+
+        Raises:
+            TypeError, ValueError: If ``before`` is not a history key.
         """
-        return await self.chore_repository.get_all_chores()
+        key = None
+        if before is not None:
+            key = (datetime.fromisoformat(str(before[0])), int(before[1]))
+        completions = await self.chore_repository.list_completions(
+            limit + 1,
+            before=key,
+            chore_id=chore_id,
+            person_id=person_id,
+        )
+        if len(completions) <= limit:
+            return completions, None
+        completions = completions[:limit]
+        last = completions[-1]
+        return completions, [last.completed_at.isoformat(), last.id]
+
+    async def roll_over_missed(self, now: datetime) -> int:
+        """Move missed recurring chores to their latest occurrence.
+
+        Only chores due over a day ago can have a later occurrence, so
+        that is the index range read.
 
-    async def get_chore_by_id(self, chore_id: int):
+        Args:
+            now: Current time.
+
+        Returns:
+            int: Number of chores rolled over.
+        """
+        chores = await self.chore_repository.get_missed(
+            now - timedelta(days=1)
+        )
+        rolled = 0
+        for chore in chores:
+            due_at = latest_due_at(
+                chore.recurrence,
+                chore.recurrence_day,
+                chore.next_due_at,
+                now,
+            )
+            if due_at != chore.next_due_at:
+                chore.next_due_at = due_at
+                self._publish("chore.updated", chore_id=chore.id)
+                rolled += 1
+        return rolled
+
+    async def send_due_reminders(
+        self,
+        now: datetime,
+        lookback: timedelta,
+    ) -> int:
+        """Announce chores that fell due and mark them as reminded.
+
+        Each ``chore.due`` event goes out once per due time, from the
+        transaction that records the reminder; other workers see the
+        write through the data version.
+
+        The in-memory due queue answers "is anything due yet?", so runs
+        with nothing due read only the changes since the last run. Chores
+        that fell due before the lookback window will never be reminded
+        and are dropped from the queue; a later edit queues them again.
+
+        Args:
+            now: Current time.
+            lookback: How far back a due time still earns a reminder.
+
+        Returns:
+            int: Number of reminders sent.
+        """
+        since = now - lookback
+        queue = await self.chore_repository.get_due_queue()
+        while (head := queue.peek()) is not None and head[0] < since:
+            queue.pop()
+        if head is None or head[0] > now:
+            return 0
+        chores = await self.chore_repository.get_unreminded_due(since, now)
+        for chore in chores:
+            chore.reminded_due_at = chore.next_due_at
+            self._publish(
+                "chore.due",
+                chore_id=chore.id,
+                person_id=chore.person_id,
+                due_at=chore.next_due_at.isoformat(),
+            )
+        return len(chores)
+
+    async def get_chore_by_id(
+        self,
+        chore_id: int,
+        expand: Collection[str] = (),
+    ):
         """Retrieve a chore by its ID.
 
         Args:
             chore_id: ID of chore to retrieve.
+            expand: Relationships to load (see
+                ``ChoreRepository.EXPANDABLE``).
 
         Returns:
             Chore: Chore object or None.
         """
-        return await self.chore_repository.get_chore_by_id(chore_id)
+        return await self.chore_repository.get_chore_by_id(chore_id, expand)
 
     async def update_chore(self, chore):
-        """Update a chore.
+        """Update a chore, rescheduling it if its rule changed.
 
         Args:
             chore: Chore object with updated data.
 
         Returns:
             Chore: Updated chore object.
+
+        Raises:
+            ValueError: If the recurrence rule is invalid.
         """
-        return await self.chore_repository.update_chore(chore)
+        self._reschedule(chore)
+        chore = await self.chore_repository.update_chore(chore)
+        self._publish("chore.updated", chore_id=chore.id)
+        return chore
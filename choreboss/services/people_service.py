@@ -2,10 +2,47 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left
+from collections.abc import Collection
 from typing import Optional
 
-from choreboss.models.people import People
-from choreboss.repositories.people_repository import PeopleRepository
+from choreboss.events import publish_after_commit
+from choreboss.models.people import RANK_GAP, People
+from choreboss.repositories.people_repository import (
+    AuthPrincipal,
+    PeopleRepository,
+)
+from choreboss.repositories.rows import PersonRow
+
+
+def _increasing_subsequence(values: list[int]) -> set[int]:
+    """Find the indexes of a longest strictly increasing subsequence.
+
+    Args:
+        values: Sequence to search.
+
+    Returns:
+        set: Indexes into ``values`` of one longest increasing run.
+    """
+    tails: list[int] = []  # tails[k]: index ending the best run of k + 1
+    tail_values: list[int] = []
+    previous = [-1] * len(values)
+    for i, value in enumerate(values):
+        k = bisect_left(tail_values, value)
+        if k:
+            previous[i] = tails[k - 1]
+        if k == len(tails):
+            tails.append(i)
+            tail_values.append(value)
+        else:
+            tails[k] = i
+            tail_values[k] = value
+    kept = set()
+    i = tails[-1] if tails else -1
+    while i != -1:
+        kept.add(i)
+        i = previous[i]
+    return kept
 
 
 class PeopleService:
@@ -19,6 +56,12 @@ class PeopleService:
         """
         self.people_repository = people_repository
 
+    def _publish(self, event_type: str, **data) -> None:
+        """Announce a change once the current transaction commits."""
+        publish_after_commit(
+            self.people_repository.session, event_type, **data
+        )
+
     async def add_person(
         self,
         first_name: str,
@@ -41,7 +84,7 @@ class PeopleService:
         Returns:
             People: Created person object.
         """
-        return await self.people_repository.add_person(
+        person = await self.people_repository.add_person(
             first_name=first_name,
             last_name=last_name,
             birthday=birthday,
@@ -49,6 +92,8 @@ class PeopleService:
             is_admin=is_admin,
             login_name=login_name,
         )
+        self._publish("person.created", person_id=person.id)
+        return person
 
     async def admins_exist(self) -> bool:
         """Check if any admins exist.
@@ -65,6 +110,7 @@ class PeopleService:
             person_id: ID of person to delete.
         """
         await self.people_repository.delete_person(person_id)
+        self._publish("person.deleted", person_id=person_id)
 
     async def delete_person_and_adjust_sequence(
         self,
@@ -72,26 +118,63 @@ class PeopleService:
     ) -> None:
         """Delete a person and adjust sequence numbers.
 
+        Everyone after the deleted person moves up one place via bulk
+        updates; no other rows are loaded.
+
         Args:
             person_id: ID of person to delete.
         """
-        person_to_delete = await self.get_person_by_id(person_id)
-        if person_to_delete:
-            deleted_seq = person_to_delete.sequence_num
+        deleted_seq = await self.people_repository.get_sequence_num(person_id)
+        if deleted_seq is not None:
             await self.delete_person(person_id)
-            remaining = await self.get_all_people()
-            for person in remaining:
-                if person.sequence_num > deleted_seq:
-                    person.sequence_num -= 1
-                    await self.update_person(person)
+            await self.people_repository.close_sequence_gap(deleted_seq)
+            self._publish("rotation.changed")
 
-    async def get_all_people(self) -> list[People]:
+    async def get_all_people(
+        self,
+        expand: Collection[str] = (),
+    ) -> list[PersonRow]:
         """Get all people.
 
+        Args:
+            expand: Relationships to load (see
+                ``PeopleRepository.EXPANDABLE``).
+
         Returns:
-            list: All people objects.
+            list: All people, as frozen rows.
         """
-        return await self.people_repository.get_all_people()
+        return await self.people_repository.get_all_people(expand)
+
+    async def list_people(
+        self,
+        limit: int,
+        after: list | None = None,
+        expand: Collection[str] = (),
+    ) -> tuple[list[PersonRow], list | None]:
+        """Retrieve one page of people and the key to resume after it.
+
+        Args:
+            limit: Page size.
+            after: Key returned with the previous page.
+            expand: Relationships to load (see
+                ``PeopleRepository.EXPANDABLE``).
+
+        Returns:
+            tuple: People on this page, and the JSON-serializable key of
+                the next page or None if this is the last one.
+
+        Raises:
+            TypeError, ValueError: If ``after`` is not a rank key.
+        """
+        people = await self.people_repository.list_people(
+            limit + 1,
+            after_rank=int(after[0]) if after is not None else None,
+            expand=expand,
+        )
+        if len(people) <= limit:
+            return people, None
+        people = people[:limit]
+        return people, [people[-1].rotation_rank]
 
     async def get_next_person_by_person_id(
         self,
@@ -109,16 +192,55 @@ class PeopleService:
             current_person_id
         )
 
-    async def get_person_by_id(self, person_id: int) -> Optional[People]:
+    async def get_auth_principal_by_id(
+        self,
+        person_id: int,
+    ) -> AuthPrincipal | None:
+        """Get the authentication columns for a person by ID.
+
+        Args:
+            person_id: ID of person to retrieve.
+
+        Returns:
+            AuthPrincipal: Projection or None.
+        """
+        return await self.people_repository.get_auth_principal_by_id(person_id)
+
+    async def get_auth_principal_by_login_name(
+        self,
+        login_name: str,
+    ) -> AuthPrincipal | None:
+        """Get the authentication columns for a person by login name.
+
+        Args:
+            login_name: Login name to look up.
+
+        Returns:
+            AuthPrincipal: Projection or None.
+        """
+        return await self.people_repository.get_auth_principal_by_login_name(
+            login_name
+        )
+
+    async def get_person_by_id(
+        self,
+        person_id: int,
+        expand: Collection[str] = (),
+    ) -> Optional[People]:
         """Get person by ID.
 
         Args:
             person_id: ID of person to retrieve.
+            expand: Relationships to load (see
+                ``PeopleRepository.EXPANDABLE``).
 
         Returns:
             People: Person object or None.
         """
-        return await self.people_repository.get_person_by_id(person_id)
+        return await self.people_repository.get_person_by_id(
+            person_id,
+            expand,
+        )
 
     async def get_person_by_login_name(self, login_name: str) -> Optional[People]:
         """Get person by login name.
@@ -142,16 +264,44 @@ class PeopleService:
         """
         return await self.people_repository.get_person_by_pin(pin)
 
-    async def is_admin(self, pin: str) -> bool:
+    async def backfill_pin_fingerprint(self, person_id: int, pin: str) -> None:
+        """Store the PIN fingerprint for a person that predates it.
+
+        Args:
+            person_id: ID of the person whose PIN was just verified.
+            pin: Verified plain text PIN.
+        """
+        await self.people_repository.backfill_pin_fingerprint_by_id(
+            person_id, pin
+        )
+
+    async def get_admin_by_pin(
+        self,
+        pin: str,
+        person_id: int | None = None,
+    ) -> People | None:
+        """Resolve the admin authorizing an action with a PIN.
+
+        Args:
+            pin: PIN to check.
+            person_id: Optional ID of the acting person.
+
+        Returns:
+            People: Matching admin or None.
+        """
+        return await self.people_repository.get_admin_by_pin(pin, person_id)
+
+    async def is_admin(self, pin: str, person_id: int | None = None) -> bool:
         """Check if person with PIN is admin.
 
         Args:
             pin: PIN to check.
+            person_id: Optional ID of the acting person.
 
         Returns:
             bool: True if admin.
         """
-        return await self.people_repository.is_admin(pin)
+        return await self.people_repository.is_admin(pin, person_id)
 
     async def update_person(self, person: People) -> People:
         """Update a person.
@@ -162,7 +312,101 @@ class PeopleService:
         Returns:
             People: Updated person object.
         """
-        return await self.people_repository.update_person(person)
+        person = await self.people_repository.update_person(person)
+        self._publish("person.updated", person_id=person.id)
+        return person
+
+    async def park_sequences(self, person_ids: list[int]) -> None:
+        """Move people to temporary sequence numbers before a reorder.
+
+        Args:
+            person_ids: IDs of people about to be resequenced.
+        """
+        await self.people_repository.park_sequences(person_ids)
+
+    async def resequence(self, positions: dict[int, int]) -> None:
+        """Apply a whole reorder in bulk.
+
+        Args:
+            positions: New sequence number keyed by person ID.
+        """
+        await self.people_repository.resequence(positions)
+        self._publish("rotation.changed")
+
+    async def reorder(self, positions: dict[int, int]) -> None:
+        """Move people to new rotation positions with minimal writes.
+
+        People not in ``positions`` keep their place relative to each
+        other. The longest run already in the right relative order stays
+        put; everyone else gets a rank in the gap between their new
+        neighbours, so moving one person updates one rank. Sequence
+        numbers are then renumbered from the ranks in the same
+        transaction. If a gap has run out the whole rotation is respread
+        instead.
+
+        Args:
+            positions: New 1-based position keyed by person ID. Unknown
+                IDs are ignored.
+        """
+        current = await self.people_repository.get_rank_order()
+        index = {pid: i for i, (pid, _) in enumerate(current)}
+        rank = dict(current)
+        desired = sorted(
+            index,
+            key=lambda pid: (
+                positions.get(pid, index[pid] + 1),
+                pid not in positions,
+            ),
+        )
+        kept = {
+            desired[i]
+            for i in _increasing_subsequence([index[p] for p in desired])
+        }
+
+        new_ranks: dict[int, int] = {}
+        lower = 0
+        i = 0
+        while i < len(desired):
+            if desired[i] in kept:
+                lower = rank[desired[i]]
+                i += 1
+                continue
+            j = i
+            while j < len(desired) and desired[j] not in kept:
+                j += 1
+            moved = desired[i:j]
+            upper = (
+                rank[desired[j]]
+                if j < len(desired)
+                else lower + RANK_GAP * (len(moved) + 1)
+            )
+            step = (upper - lower) // (len(moved) + 1)
+            if step == 0:
+                await self.resequence(
+                    {pid: pos for pos, pid in enumerate(desired, 1)}
+                )
+                return
+            for offset, pid in enumerate(moved, 1):
+                new_ranks[pid] = lower + step * offset
+            i = j
+        if new_ranks:
+            await self.people_repository.set_ranks(new_ranks)
+            await self.people_repository.renumber_sequences()
+            self._publish("rotation.changed")
+
+    async def rebalance_ranks(self, min_gap: int) -> bool:
+        """Respread rotation ranks and renumber positions if needed.
+
+        Args:
+            min_gap: Smallest acceptable gap between neighbouring ranks.
+
+        Returns:
+            bool: True if the rotation was rewritten.
+        """
+        rewritten = await self.people_repository.rebalance_ranks(min_gap)
+        if rewritten:
+            self._publish("rotation.changed")
+        return rewritten
 
     async def update_sequence(
         self,
@@ -176,6 +420,7 @@ class PeopleService:
             new_sequence: New sequence number.
         """
         await self.people_repository.update_sequence(person_id, new_sequence)
+        self._publish("rotation.changed")
 
     @staticmethod
     def validate_pin(pin: str) -> bool:
@@ -191,9 +436,8 @@ class PeopleService:
         """
         return 4 <= len(pin) <= 6 and pin.isdigit()
 
-    @staticmethod
-    def verify_pin(pin: str, hash: str) -> bool:
-        """Verify a PIN against a hash.
+    async def verify_pin(self, pin: str, hash: str) -> bool:
+        """Verify a PIN against a hash off the event loop.
 
         Args:
             pin: Plain PIN.
@@ -201,10 +445,8 @@ class PeopleService:
 
         Returns:
             bool: True if PIN matches hash.
-        """
-        import bcrypt
 
-        return bcrypt.checkpw(
-            pin.encode("utf-8"),
-            hash.encode("utf-8"),
-        )
+        Raises:
+            PasswordHasherOverloaded: If the hashing queue is full.
+        """
+        return await self.people_repository.hasher.verify_pin(pin, hash)
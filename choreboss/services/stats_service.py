@@ -0,0 +1,78 @@
+"""Async completion stats service."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+
+from choreboss.repositories.stats_repository import (
+    StatsRepository,
+    week_start,
+)
+
+
+@dataclass
+class CompletionStats:
+    """Completions per person over one day or week."""
+
+    period: str
+    start: date
+    end: date
+    counts: list[tuple[int, int]] = field(default_factory=list)
+
+
+class StatsService:
+    """Service answering "who did the most" from the rollups."""
+
+    PERIODS = ("day", "week")
+
+    def __init__(self, stats_repository: StatsRepository) -> None:
+        """Initialize stats service.
+
+        Args:
+            stats_repository: Repository for completion rollups.
+        """
+        self.stats_repository = stats_repository
+
+    async def completions(self, period: str, on: date) -> CompletionStats:
+        """Get completions per person for the day or week containing a day.
+
+        Reads rollup rows only; the completion history is never scanned.
+
+        Args:
+            period: ``"day"`` or ``"week"``.
+            on: Any UTC day in the period.
+
+        Returns:
+            CompletionStats: Period bounds and ``(person_id, count)``
+                pairs, most completions first.
+
+        Raises:
+            ValueError: If ``period`` is not one of ``PERIODS``.
+        """
+        if period == "day":
+            rows = await self.stats_repository.get_daily(on)
+            return CompletionStats(
+                period,
+                on,
+                on,
+                [(row.person_id, row.completions) for row in rows],
+            )
+        if period == "week":
+            start = week_start(on)
+            rows = await self.stats_repository.get_weekly(start)
+            return CompletionStats(
+                period,
+                start,
+                start + timedelta(days=6),
+                [(row.person_id, row.completions) for row in rows],
+            )
+        raise ValueError(f"Unknown stats period: {period}")
+
+    async def rebuild(self) -> tuple[int, int]:
+        """Recompute the rollups from the completion history.
+
+        Returns:
+            tuple: Number of daily and weekly rows written.
+        """
+        return await self.stats_repository.rebuild()
@@ -0,0 +1,83 @@
+"""Async delta sync service."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from choreboss.models.chore import Chore
+from choreboss.models.people import People
+from choreboss.repositories.change_repository import ChangeRepository
+from choreboss.repositories.chore_repository import ChoreRepository
+from choreboss.repositories.people_repository import PeopleRepository
+from choreboss.repositories.rows import ChoreRow, PersonRow
+
+
+@dataclass
+class ChangeSet:
+    """Everything a client needs to catch up to ``version``."""
+
+    version: int
+    full: bool
+    chores: list[Chore | ChoreRow] = field(default_factory=list)
+    people: list[People | PersonRow] = field(default_factory=list)
+    deleted_chores: list[int] = field(default_factory=list)
+    deleted_people: list[int] = field(default_factory=list)
+
+
+class SyncService:
+    """Service answering "what changed since version N"."""
+
+    def __init__(
+        self,
+        change_repository: ChangeRepository,
+        chore_repository: ChoreRepository,
+        people_repository: PeopleRepository,
+    ) -> None:
+        """Initialize sync service.
+
+        Args:
+            change_repository: Repository for versions and tombstones.
+            chore_repository: Repository for chore data access.
+            people_repository: Repository for people data access.
+        """
+        self.change_repository = change_repository
+        self.chore_repository = chore_repository
+        self.people_repository = people_repository
+
+    async def changes_since(self, since: int | None) -> ChangeSet:
+        """Collect the rows changed and deleted after a data version.
+
+        The version is read before the rows, so a commit landing in
+        between is returned now and again on the next poll, never lost.
+
+        Args:
+            since: Version from the client's previous sync, or None for
+                a full snapshot.
+
+        Returns:
+            ChangeSet: Changes, and the version to sync from next time.
+
+        Raises:
+            ValueError: If ``since`` is ahead of the database.
+        """
+        version = await self.change_repository.get_current_version()
+        if since is None:
+            return ChangeSet(
+                version=version,
+                full=True,
+                chores=await self.chore_repository.get_all_chores(),
+                people=await self.people_repository.get_all_people(),
+            )
+        if since > version:
+            raise ValueError("since is ahead of the current data version")
+        if since == version:
+            return ChangeSet(version=version, full=False)
+        deleted = await self.change_repository.get_deletions_since(since)
+        return ChangeSet(
+            version=version,
+            full=False,
+            chores=await self.chore_repository.get_changed_since(since),
+            people=await self.people_repository.get_changed_since(since),
+            deleted_chores=deleted["chore"],
+            deleted_people=deleted["person"],
+        )
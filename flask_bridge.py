@@ -14,8 +14,12 @@ Then visit http://localhost:8055 in your browser.
 """
 
 from flask import Flask, render_template, request, jsonify, session, redirect, url_for
+import copy
+import hmac
 import logging
 import os
+import time
+from collections import OrderedDict
 from datetime import date, datetime
 
 import requests
@@ -25,6 +29,7 @@ import json
 API_BASE_URL = os.getenv('API_BASE_URL', 'http://localhost:8000/api')
 FLASK_PORT = int(os.getenv('FLASK_PORT', 8055))
 FLASK_SECRET_KEY = os.getenv('FLASK_SECRET_KEY', 'dev-secret-key-change-in-prod')
+RESPONSE_CACHE_SIZE = int(os.getenv('BRIDGE_RESPONSE_CACHE_SIZE', 128))
 
 app = Flask(
     __name__,
@@ -39,9 +44,15 @@ app.logger.setLevel(logging.DEBUG)
 # Helper functions to call FastAPI backend
 # =============================================================================
 
-def get_auth_headers():
-    """Get Authorization header if user is logged in."""
+def get_auth_headers(step_up=False):
+    """Get Authorization header if user is logged in.
+
+    With ``step_up``, the short-lived step-up token is sent instead while
+    it is unexpired; routes guarded by ``require_step_up`` need it.
+    """
     token = session.get('token')
+    if step_up and _step_up_active():
+        token = session['step_up_token']
     if token:
         return {'Authorization': f'Bearer {token}'}
     return {}
@@ -71,7 +82,19 @@ def _normalize_dates(value):
     return value
 
 
-def api_call(method, endpoint, data=None, params=None):
+# GET responses by (endpoint, params): (ETag, parsed body), least recent first
+_response_cache = OrderedDict()
+
+
+def _remember_response(key, etag, parsed):
+    """Keep a GET body for revalidation, evicting the least recently used."""
+    _response_cache[key] = (etag, copy.deepcopy(parsed))
+    _response_cache.move_to_end(key)
+    while len(_response_cache) > RESPONSE_CACHE_SIZE:
+        _response_cache.popitem(last=False)
+
+
+def api_call(method, endpoint, data=None, params=None, step_up=False):
     """
     Make HTTP call to FastAPI backend.
     
@@ -80,14 +103,25 @@ def api_call(method, endpoint, data=None, params=None):
         endpoint: e.g., '/chores/' or '/people/1'
         data: Dict to send as JSON
         params: Query parameters
+        step_up: Authenticate with the step-up token from /verify_pin
     
+    GET bodies are remembered with their ETag and revalidated with
+    If-None-Match; a 304 returns the remembered body as a 200.
+
     Returns:
         (status_code, response_json)
     """
     url = f"{API_BASE_URL}{endpoint}"
-    headers = get_auth_headers()
+    headers = get_auth_headers(step_up)
     headers['Content-Type'] = 'application/json'
     app.logger.debug('API %s %s params=%s payload=%s', method, endpoint, params, data)
+
+    cache_key = cached = None
+    if method == 'GET':
+        cache_key = (endpoint, tuple(sorted((params or {}).items())))
+        cached = _response_cache.get(cache_key)
+        if cached:
+            headers['If-None-Match'] = cached[0]
     
     try:
         if method == 'GET':
@@ -100,6 +134,11 @@ def api_call(method, endpoint, data=None, params=None):
             resp = requests.delete(url, headers=headers, timeout=5)
         else:
             return 400, {'error': f'Unknown method: {method}'}
+
+        if cached and resp.status_code == 304:
+            app.logger.debug('API %s %s -> 304, reusing cached body', method, endpoint)
+            _response_cache.move_to_end(cache_key)
+            return 200, copy.deepcopy(cached[1])
         
         try:
             parsed = resp.json() if resp.text else {}
@@ -111,6 +150,10 @@ def api_call(method, endpoint, data=None, params=None):
 
         parsed = _normalize_dates(parsed)
 
+        etag = resp.headers.get('ETag')
+        if cache_key and resp.status_code == 200 and etag:
+            _remember_response(cache_key, etag, parsed)
+
         if isinstance(parsed, dict):
             app.logger.debug('API %s %s -> %s dict_keys=%s', method, endpoint, resp.status_code, list(parsed.keys()))
         elif isinstance(parsed, list):
@@ -149,6 +192,33 @@ def _collection_items(payload, collection_name: str) -> list:
     return []
 
 
+def api_collection(endpoint, collection_name, params=None):
+    """
+    Fetch every page of a paginated FastAPI listing.
+
+    Follows ``next_cursor`` until the last page.
+
+    Args:
+        endpoint: e.g., '/chores/'
+        collection_name: Key holding the items, e.g., 'chores'
+        params: Extra query parameters (filters, page size)
+
+    Returns:
+        (status_code, items), or the failing page's (status_code, payload)
+    """
+    params = dict(params or {})
+    items = []
+    while True:
+        status, payload = api_call('GET', endpoint, params=params)
+        if status != 200:
+            return status, payload
+        items.extend(_collection_items(payload, collection_name))
+        cursor = payload.get('next_cursor') if isinstance(payload, dict) else None
+        if not cursor:
+            return status, items
+        params['cursor'] = cursor
+
+
 @app.route('/')
 def index():
     """Home page."""
@@ -156,11 +226,11 @@ def index():
         return redirect(url_for('login'))
     
     # Get chores and people for dashboard
-    status, chores_data = api_call('GET', '/chores/')
+    status, chores_data = api_collection('/chores/', 'chores')
     if status != 200:
         return f"Error fetching chores: {chores_data}", 500
     
-    status, people_data = api_call('GET', '/people/')
+    status, people_data = api_collection('/people/', 'people')
     if status != 200:
         return f"Error fetching people: {people_data}", 500
     
@@ -208,7 +278,9 @@ def login():
 
 @app.route('/logout')
 def logout():
-    """Logout - clear session."""
+    """Logout - revoke the backend token and clear session."""
+    if 'token' in session:
+        api_call('POST', '/auth/logout')
     session.clear()
     return redirect(url_for('login'))
 
@@ -219,7 +291,7 @@ def chores_list():
     if 'token' not in session:
         return redirect(url_for('login'))
     
-    status, data = api_call('GET', '/chores/')
+    status, data = api_collection('/chores/', 'chores')
     if status != 200:
         return f"Error: {data}", 500
     
@@ -233,22 +305,20 @@ def chore_detail(chore_id):
     if 'token' not in session:
         return redirect(url_for('login'))
     
-    status, chore = api_call('GET', f'/chores/{chore_id}')
+    status, chore = api_call(
+        'GET',
+        f'/chores/{chore_id}',
+        params={'expand': 'assignee,last_completer'},
+    )
     if status != 200:
         return f"Chore not found: {chore}", 404
 
     if isinstance(chore, dict):
         chore = dict(chore)
-        person_id = chore.get('person_id')
-        if person_id:
-            person_status, person = api_call('GET', f'/people/{person_id}')
-            if person_status == 200 and isinstance(person, dict):
-                chore['person_id_foreign_key'] = person
-        last_completed_id = chore.get('last_completed_id')
-        if last_completed_id:
-            person_status, person = api_call('GET', f'/people/{last_completed_id}')
-            if person_status == 200 and isinstance(person, dict):
-                chore['last_completed_id_foreign_key'] = person
+        if chore.get('assignee'):
+            chore['person_id_foreign_key'] = chore['assignee']
+        if chore.get('last_completer'):
+            chore['last_completed_id_foreign_key'] = chore['last_completer']
     
     return render_template('chore_detail.html', chore=chore)
 
@@ -276,10 +346,10 @@ def add_chore():
             message = result.get('error', 'Failed to add chore') if isinstance(result, dict) else 'Failed to add chore'
             if request.is_json:
                 return jsonify({'error': message}), status
-            return render_template('add_chore.html', people=_collection_items(api_call('GET', '/people/')[1], 'people'), error=message), status
+            return render_template('add_chore.html', people=_collection_items(api_collection('/people/', 'people')[1], 'people'), error=message), status
     
     # GET: Show form
-    status, people_data = api_call('GET', '/people/')
+    status, people_data = api_collection('/people/', 'people')
     people = _collection_items(people_data, 'people') if status == 200 else []
     return render_template('add_chore.html', people=people)
 
@@ -307,7 +377,7 @@ def edit_chore(chore_id):
             if request.is_json:
                 return jsonify({'error': message}), status
             status2, chore = api_call('GET', f'/chores/{chore_id}')
-            status3, people_data = api_call('GET', '/people/')
+            status3, people_data = api_collection('/people/', 'people')
             people = _collection_items(people_data, 'people') if status3 == 200 else []
             return render_template('edit_chore.html', chore=chore, people=people, error=message), status
     
@@ -316,7 +386,7 @@ def edit_chore(chore_id):
     if status != 200:
         return f"Chore not found: {chore}", 404
     
-    status, people_data = api_call('GET', '/people/')
+    status, people_data = api_collection('/people/', 'people')
     people = _collection_items(people_data, 'people') if status == 200 else []
     
     return render_template('edit_chore.html', chore=chore, people=people)
@@ -353,7 +423,7 @@ def delete_chore(chore_id):
     if 'token' not in session:
         return redirect(url_for('login'))
     
-    status, result = api_call('DELETE', f'/chores/{chore_id}')
+    status, result = api_call('DELETE', f'/chores/{chore_id}', step_up=True)
     
     if status in (200, 204):
         if request.is_json:
@@ -363,7 +433,7 @@ def delete_chore(chore_id):
         message = result.get('error', 'Failed to delete') if isinstance(result, dict) else 'Failed to delete'
         if request.is_json:
             return jsonify({'error': message}), status
-        status2, data = api_call('GET', '/chores/')
+        status2, data = api_collection('/chores/', 'chores')
         chores = _collection_items(data, 'chores') if status2 == 200 else []
         return render_template('chores_list.html', chores=chores, error=message), status
 
@@ -372,9 +442,12 @@ def delete_chore(chore_id):
 def verify_pin():
     """Validate PIN entry for modal-driven actions.
 
-    The browser bridge keeps the current login_name in session, so we can
-    reuse the auth endpoint to verify the entered PIN against the logged-in
-    person before allowing the form submit to proceed.
+    The first confirmation calls the backend step-up endpoint, which checks
+    the PIN for the logged-in person once and returns a short-lived
+    elevated token; destructive calls then send that token. Inside the
+    window, a PIN matching the keyed digest of the one the backend
+    confirmed is answered without another bcrypt verify; any other PIN
+    goes back to the backend.
     """
     if 'token' not in session or 'login_name' not in session:
         return jsonify({'status': 'failure'}), 401
@@ -386,48 +459,56 @@ def verify_pin():
     if not pin or not context:
         return jsonify({'status': 'failure'})
 
-    status, auth_result = api_call('POST', '/auth/login', {
-        'login_name': session['login_name'],
-        'pin': pin,
-    })
-    if status != 200 or not isinstance(auth_result, dict):
-        # Cannot verify PIN (invalid credentials)
-        return jsonify({'status': 'failure', 'reason': 'invalid'})
-
-    # Refresh the bridge session with the latest backend token/role so a
-    # just-promoted admin can immediately perform admin actions.
-    session['token'] = auth_result.get('access_token')
-    session['person_id'] = auth_result.get('person_id')
-    session['is_admin'] = bool(auth_result.get('is_admin'))
-    # Keep login_name normalized in session (lowercase)
-    _ln = session.get('login_name') or data.get('login_name')
-    if _ln:
-        session['login_name'] = _ln.strip().lower()
-
-    is_admin = bool(auth_result.get('is_admin'))
-    if context == 'add_person':
-        status2, people_data = api_call('GET', '/people/')
-        people = _collection_items(people_data, 'people') if status2 == 200 else []
-        if is_admin or not people:
-            return jsonify({'status': 'success'})
-        return jsonify({'status': 'failure', 'reason': 'not_admin'})
-
+    confirmed = _step_up_active() and hmac.compare_digest(
+        session.get('step_up_pin', ''), _pin_digest(pin)
+    )
+    if not confirmed:
+        status, step_up = api_call('POST', '/auth/step-up', {'pin': pin})
+        if status != 200 or not isinstance(step_up, dict):
+            # Cannot verify PIN (invalid credentials)
+            return jsonify({'status': 'failure'})
+
+        # The backend only returns an access token when the role changed, so
+        # a just-promoted admin can immediately perform admin actions.
+        if step_up.get('access_token'):
+            session['token'] = step_up['access_token']
+        session['person_id'] = step_up.get('person_id')
+        session['is_admin'] = bool(step_up.get('is_admin'))
+        session['step_up_token'] = step_up.get('step_up_token')
+        session['step_up_pin'] = _pin_digest(pin)
+        session['step_up_expires_at'] = time.time() + int(step_up.get('expires_in', 0))
+
+    is_admin = bool(session.get('is_admin'))
     if context == 'complete_chore':
         return jsonify({'status': 'success'})
 
-    if context in {'change_sequence', 'delete_chore', 'delete_person', 'edit_chore', 'edit_person'}:
-        return jsonify({'status': 'success' if is_admin else 'failure', 'reason': (None if is_admin else 'not_admin')})
+    # A logged-in bridge session implies at least one person exists, so only
+    # admins may add people here; bootstrap registration bypasses this modal.
+    if context in {'add_person', 'change_sequence', 'delete_chore', 'delete_person', 'edit_chore', 'edit_person'}:
+        if is_admin:
+            return jsonify({'status': 'success'})
+        return jsonify({'status': 'failure', 'reason': 'not_admin'})
 
     return jsonify({'status': 'failure', 'reason': 'invalid'})
 
 
+def _pin_digest(pin) -> str:
+    """Key a confirmed PIN with the bridge secret, for window re-checks."""
+    return hmac.new(app.secret_key.encode(), str(pin).encode(), 'sha256').hexdigest()
+
+
+def _step_up_active() -> bool:
+    """Return True while the session holds an unexpired step-up token."""
+    return bool(session.get('step_up_token')) and session.get('step_up_expires_at', 0) > time.time()
+
+
 @app.route('/people')
 def people_list():
     """List all people."""
     if 'token' not in session:
         return redirect(url_for('login'))
     
-    status, data = api_call('GET', '/people/')
+    status, data = api_collection('/people/', 'people')
     if status != 200:
         return f"Error: {data}", 500
     
@@ -514,7 +595,7 @@ def delete_person(person_id):
     if 'token' not in session:
         return redirect(url_for('login'))
 
-    status, result = api_call('DELETE', f'/people/{person_id}')
+    status, result = api_call('DELETE', f'/people/{person_id}', step_up=True)
     if status == 204:
         if request.is_json:
             return jsonify({'success': True})
@@ -548,7 +629,7 @@ def change_sequence():
     if 'token' not in session:
         return redirect(url_for('login'))
 
-    status, data = api_call('GET', '/people/')
+    status, data = api_collection('/people/', 'people')
     people = _collection_items(data, 'people') if status == 200 else []
     if request.method == 'POST':
         message = 'Sequence updates are not yet implemented in the FastAPI backend.'
@@ -582,7 +663,7 @@ def update_sequence():
         app.logger.exception('Bad sequence_data payload: %s', e)
         if request.is_json:
             return jsonify({'error': 'Bad sequence data'}), 400
-        return render_template('change_sequence.html', people=_collection_items(api_call('GET', '/people/')[1], 'people'), error='Invalid sequence payload'), 400
+        return render_template('change_sequence.html', people=_collection_items(api_collection('/people/', 'people')[1], 'people'), error='Invalid sequence payload'), 400
 
     status, result = api_call('POST', '/people/sequence', seq)
     if status == 200:
@@ -594,7 +675,7 @@ def update_sequence():
         message = result.get('error', 'Failed to update sequence') if isinstance(result, dict) else 'Failed to update sequence'
         if request.is_json:
             return jsonify({'error': message, 'status': 'failure'}), status
-        people = _collection_items(api_call('GET', '/people/')[1], 'people')
+        people = _collection_items(api_collection('/people/', 'people')[1], 'people')
         return render_template('change_sequence.html', people=people, error=message), status
 
 
@@ -77,10 +77,10 @@ describe('App', () => {
         return mockJsonResponse(loginResponse);
       }
       if (url.endsWith('/chores/')) {
-        return mockJsonResponse(choresResponse);
+        return mockJsonResponse({ chores: choresResponse, next_cursor: null });
       }
       if (url.endsWith('/people/')) {
-        return mockJsonResponse(peopleResponse);
+        return mockJsonResponse({ people: peopleResponse, next_cursor: null });
       }
       throw new Error(`Unexpected fetch: ${url}`);
     });
@@ -112,7 +112,7 @@ describe('App', () => {
         return mockJsonResponse(loginResponse);
       }
       if (url.endsWith('/chores/')) {
-        return mockJsonResponse(choresResponse);
+        return mockJsonResponse({ chores: choresResponse, next_cursor: null });
       }
       if (url.endsWith('/people/') && init?.method === 'POST') {
         return mockJsonResponse({
@@ -128,7 +128,7 @@ describe('App', () => {
         });
       }
       if (url.endsWith('/people/')) {
-        return mockJsonResponse(peopleResponse);
+        return mockJsonResponse({ people: peopleResponse, next_cursor: null });
       }
       if (url.endsWith('/people/5') && init?.method === 'PUT') {
         return mockJsonResponse({
@@ -143,13 +143,31 @@ describe('App', () => {
           updated_at: '2026-05-06T00:00:00',
         });
       }
+      if (url.endsWith('/auth/step-up')) {
+        expect(init?.body).toBe(JSON.stringify({ pin: '5868' }));
+        return mockJsonResponse({
+          step_up_token: 'step-up-456',
+          expires_in: 300,
+          scope: 'step_up',
+          access_token: null,
+          token_type: 'bearer',
+          person_id: 5,
+          is_admin: true,
+        });
+      }
       if (url.endsWith('/people/5') && init?.method === 'DELETE') {
+        // The server refuses deletes made with the plain access token
+        const authorization = new Headers(init.headers).get('Authorization');
+        if (authorization !== 'Bearer step-up-456') {
+          return mockJsonResponse({ detail: 'PIN confirmation required' }, { status: 403 });
+        }
         return new Response(null, { status: 204 });
       }
       throw new Error(`Unexpected fetch: ${url}`);
     });
 
     vi.spyOn(window, 'confirm').mockReturnValue(true);
+    const promptMock = vi.spyOn(window, 'prompt').mockReturnValue('5868');
 
     const user = userEvent.setup();
     render(<App />);
@@ -183,6 +201,7 @@ describe('App', () => {
     await user.click(deleteButtons[0]);
 
     expect(await screen.findByText('Deleted Toan Nguyen')).toBeInTheDocument();
+    expect(promptMock).toHaveBeenCalledTimes(1);
     await waitFor(() => {
       const mains = screen.getAllByRole('main');
       const activeMain = mains[mains.length - 1];
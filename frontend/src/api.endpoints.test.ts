@@ -9,17 +9,20 @@ import {
   loadChores,
   loadPeople,
   login,
+  stepUp,
   updatePerson,
 } from './api';
 
 describe('api endpoint validity', () => {
   it('keeps the FastAPI endpoint paths aligned', () => {
     expect(API_ENDPOINTS.authLogin).toBe('/auth/login');
+    expect(API_ENDPOINTS.authStepUp).toBe('/auth/step-up');
     expect(API_ENDPOINTS.people).toBe('/people/');
     expect(API_ENDPOINTS.chores).toBe('/chores/');
     expect(API_ENDPOINTS.personById(7)).toBe('/people/7');
     expect(API_ENDPOINTS.choreById(9)).toBe('/chores/9');
     expect(API_ENDPOINTS.choreComplete(9)).toBe('/chores/9/complete');
+    expect(API_ENDPOINTS.events).toBe('/events');
   });
 
   it('targets the FastAPI auth login endpoint', async () => {
@@ -40,9 +43,34 @@ describe('api endpoint validity', () => {
     );
   });
 
+  it('confirms the PIN at the FastAPI step-up endpoint', async () => {
+    const fetchMock = vi.spyOn(globalThis, 'fetch').mockResolvedValueOnce(
+      new Response(JSON.stringify({
+        step_up_token: 'step-up',
+        expires_in: 300,
+        scope: 'step_up',
+        access_token: null,
+        token_type: 'bearer',
+        person_id: 5,
+        is_admin: true,
+      })),
+    );
+
+    const response = await stepUp('token', '5868');
+
+    expect(response.step_up_token).toBe('step-up');
+    expect(fetchMock).toHaveBeenCalledWith(
+      expect.stringContaining(API_ENDPOINTS.authStepUp),
+      expect.objectContaining({
+        method: 'POST',
+        headers: expect.objectContaining({ Authorization: 'Bearer token' }),
+      }),
+    );
+  });
+
   it('targets the FastAPI chores list endpoint', async () => {
     const fetchMock = vi.spyOn(globalThis, 'fetch').mockResolvedValueOnce(
-      new Response(JSON.stringify([])),
+      new Response(JSON.stringify({ chores: [], next_cursor: null })),
     );
 
     await loadChores('token');
@@ -55,6 +83,47 @@ describe('api endpoint validity', () => {
     );
   });
 
+  it('follows next_cursor until the last chores page', async () => {
+    const fetchMock = vi
+      .spyOn(globalThis, 'fetch')
+      .mockResolvedValueOnce(
+        new Response(JSON.stringify({ chores: [{ id: 1 }], next_cursor: 'abc' })),
+      )
+      .mockResolvedValueOnce(
+        new Response(JSON.stringify({ chores: [{ id: 2 }], next_cursor: null })),
+      );
+
+    const chores = await loadChores('token');
+
+    expect(chores.map((chore) => chore.id)).toEqual([1, 2]);
+    expect(fetchMock).toHaveBeenLastCalledWith(
+      expect.stringContaining(`${API_ENDPOINTS.chores}?cursor=abc`),
+      expect.anything(),
+    );
+  });
+
+  it('revalidates cached lists with If-None-Match', async () => {
+    const fetchMock = vi
+      .spyOn(globalThis, 'fetch')
+      .mockResolvedValueOnce(
+        new Response(JSON.stringify({ people: [{ id: 3 }], next_cursor: null }), {
+          headers: { ETag: '"7-abc"' },
+        }),
+      )
+      .mockResolvedValueOnce(new Response(null, { status: 304, headers: { ETag: '"7-abc"' } }));
+
+    await loadPeople('token');
+    const people = await loadPeople('token');
+
+    expect(people.map((person) => person.id)).toEqual([3]);
+    expect(fetchMock).toHaveBeenLastCalledWith(
+      expect.stringContaining(API_ENDPOINTS.people),
+      expect.objectContaining({
+        headers: expect.objectContaining({ 'If-None-Match': '"7-abc"' }),
+      }),
+    );
+  });
+
   it('targets the FastAPI chore complete endpoint', async () => {
     const fetchMock = vi.spyOn(globalThis, 'fetch').mockResolvedValueOnce(
       new Response(JSON.stringify({
@@ -81,7 +150,7 @@ describe('api endpoint validity', () => {
 
   it('targets the FastAPI people list endpoint', async () => {
     const fetchMock = vi.spyOn(globalThis, 'fetch').mockResolvedValueOnce(
-      new Response(JSON.stringify([])),
+      new Response(JSON.stringify({ people: [], next_cursor: null })),
     );
 
     await loadPeople('token');
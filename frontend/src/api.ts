@@ -1,14 +1,21 @@
 import { API_ENDPOINTS } from './endpoints';
 import type {
   AuthSession,
+  ChorePage,
   ChoreRead,
   LoginResponse,
   PersonCreateInput,
+  PersonPage,
   PersonRead,
   PersonUpdateInput,
+  StepUpResponse,
 } from './types';
 
 const DEFAULT_API_BASE_URL = 'http://localhost:8055/api';
+const MAX_CACHED_RESPONSES = 100;
+
+// GET bodies by URL with their ETag, least recently used first
+const responseCache = new Map<string, { etag: string; body: unknown }>();
 
 export class ApiError extends Error {
   public readonly status: number;
@@ -77,6 +84,46 @@ function authorizedHeaders(token: string): HeadersInit {
   };
 }
 
+function rememberResponse(url: string, etag: string, body: unknown): void {
+  responseCache.delete(url);
+  responseCache.set(url, { etag, body: structuredClone(body) });
+  if (responseCache.size > MAX_CACHED_RESPONSES) {
+    const oldest = responseCache.keys().next().value;
+    if (oldest !== undefined) {
+      responseCache.delete(oldest);
+    }
+  }
+}
+
+// GET with If-None-Match, reusing the remembered body on 304 Not Modified.
+async function getJsonRevalidated<T>(token: string, path: string): Promise<T> {
+  const url = `${getApiBaseUrl()}${path}`;
+  const cached = responseCache.get(url);
+  const response = await fetch(url, {
+    method: 'GET',
+    headers: {
+      Authorization: `Bearer ${token}`,
+      ...(cached ? { 'If-None-Match': cached.etag } : {}),
+    },
+  });
+
+  if (response.status === 304 && cached) {
+    rememberResponse(url, cached.etag, cached.body);
+    return structuredClone(cached.body) as T;
+  }
+
+  if (!response.ok) {
+    throw new ApiError(await parseResponseError(response), response.status);
+  }
+
+  const body = (await response.json()) as T;
+  const etag = response.headers.get('ETag');
+  if (etag) {
+    rememberResponse(url, etag, body);
+  }
+  return body;
+}
+
 export async function login(loginName: string, pin: string): Promise<LoginResponse> {
   return requestJson<LoginResponse>(API_ENDPOINTS.authLogin, {
     method: 'POST',
@@ -84,16 +131,64 @@ export async function login(loginName: string, pin: string): Promise<LoginRespon
   });
 }
 
-export async function loadChores(token: string): Promise<ChoreRead[]> {
-  const response = await fetch(`${getApiBaseUrl()}${API_ENDPOINTS.chores}`, {
+// Confirms the PIN for a short-lived token that destructive routes require.
+export async function stepUp(token: string, pin: string): Promise<StepUpResponse> {
+  return requestJson<StepUpResponse>(API_ENDPOINTS.authStepUp, {
+    method: 'POST',
     headers: authorizedHeaders(token),
+    body: JSON.stringify({ pin }),
   });
+}
 
-  if (!response.ok) {
-    throw new ApiError(await parseResponseError(response), response.status);
+async function loadAllPages<T, P extends { next_cursor: string | null }>(
+  token: string,
+  path: string,
+  itemsOf: (page: P) => T[],
+): Promise<T[]> {
+  const items: T[] = [];
+  let cursor: string | null = null;
+  do {
+    const query: string = cursor ? `?cursor=${encodeURIComponent(cursor)}` : '';
+    const page = await getJsonRevalidated<P>(token, `${path}${query}`);
+    items.push(...itemsOf(page));
+    cursor = page.next_cursor;
+  } while (cursor);
+
+  return items;
+}
+
+// Subscribes to committed changes; returns a function that unsubscribes.
+// EventSource cannot send headers, so the token goes in the query string,
+// and it resumes from Last-Event-ID on its own after a reconnect.
+export function subscribeToChanges(token: string, onChange: (type: string) => void): () => void {
+  if (typeof EventSource === 'undefined') {
+    return () => undefined;
   }
 
-  return (await response.json()) as ChoreRead[];
+  const query = `?access_token=${encodeURIComponent(token)}`;
+  const source = new EventSource(`${getApiBaseUrl()}${API_ENDPOINTS.events}${query}`);
+  const eventTypes = [
+    'chore.created',
+    'chore.updated',
+    'chore.deleted',
+    'chore.completed',
+    'person.created',
+    'person.updated',
+    'person.deleted',
+    'rotation.changed',
+    'sync',
+    'resync',
+  ];
+  const listener = (event: Event): void => onChange(event.type);
+  for (const type of eventTypes) {
+    source.addEventListener(type, listener);
+  }
+
+  return () => source.close();
+}
+
+export async function loadChores(token: string): Promise<ChoreRead[]> {
+  return loadAllPages<ChoreRead, ChorePage>(token, API_ENDPOINTS.chores, (page) => page.chores);
 }
 
 export async function completeChore(token: string, choreId: number): Promise<ChoreRead> {
@@ -104,22 +199,11 @@ export async function completeChore(token: string, choreId: number): Promise<Cho
 }
 
 export async function loadPeople(token: string): Promise<PersonRead[]> {
-  const response = await fetch(`${getApiBaseUrl()}${API_ENDPOINTS.people}`, {
-    headers: authorizedHeaders(token),
-  });
-
-  if (!response.ok) {
-    throw new ApiError(await parseResponseError(response), response.status);
-  }
-
-  return (await response.json()) as PersonRead[];
+  return loadAllPages<PersonRead, PersonPage>(token, API_ENDPOINTS.people, (page) => page.people);
 }
 
 export async function getPerson(token: string, personId: number): Promise<PersonRead> {
-  return requestJson<PersonRead>(API_ENDPOINTS.personById(personId), {
-    method: 'GET',
-    headers: authorizedHeaders(token),
-  });
+  return getJsonRevalidated<PersonRead>(token, API_ENDPOINTS.personById(personId));
 }
 
 export async function createPerson(token: string, person: PersonCreateInput): Promise<PersonRead> {
@@ -142,10 +226,11 @@ export async function updatePerson(
   });
 }
 
-export async function deletePerson(token: string, personId: number): Promise<void> {
+// Takes the step_up_token from stepUp, not the session access token.
+export async function deletePerson(stepUpToken: string, personId: number): Promise<void> {
   await requestVoid(API_ENDPOINTS.personById(personId), {
     method: 'DELETE',
-    headers: authorizedHeaders(token),
+    headers: authorizedHeaders(stepUpToken),
   });
 }
 
@@ -1,9 +1,11 @@
 export const API_ENDPOINTS = {
   health: '/health',
   authLogin: '/auth/login',
+  authStepUp: '/auth/step-up',
   people: '/people/',
   personById: (personId: number): string => `/people/${personId}`,
   chores: '/chores/',
   choreById: (choreId: number): string => `/chores/${choreId}`,
   choreComplete: (choreId: number): string => `/chores/${choreId}/complete`,
+  events: '/events',
 } as const;
@@ -1,5 +1,5 @@
 import { useEffect, useState } from 'react';
-import { loadChores, loadPeople } from '../api';
+import { loadChores, loadPeople, subscribeToChanges } from '../api';
 import type { AuthSession, ChoreRead, PersonRead } from '../types';
 
 interface UseChoreBossDashboardDataOptions {
@@ -22,6 +22,18 @@ export function useChoreBossDashboardData({
   const [chores, setChores] = useState<ChoreRead[]>([]);
   const [people, setPeople] = useState<PersonRead[]>([]);
   const [dashboardLoading, setDashboardLoading] = useState(false);
+  // Bumped by live change events to trigger a quiet refetch
+  const [revision, setRevision] = useState(0);
+
+  useEffect(() => {
+    if (!session) {
+      return;
+    }
+
+    return subscribeToChanges(session.access_token, () => {
+      setRevision((current) => current + 1);
+    });
+  }, [session]);
 
   useEffect(() => {
     if (!session) {
@@ -29,10 +41,13 @@ export function useChoreBossDashboardData({
     }
 
     let isCurrent = true;
+    const isRefresh = revision > 0;
 
     const run = async (): Promise<void> => {
-      setDashboardLoading(true);
-      onMessageChange('Loading chores…');
+      if (!isRefresh) {
+        setDashboardLoading(true);
+        onMessageChange('Loading chores…');
+      }
 
       try {
         const [nextChores, nextPeople] = await Promise.all([
@@ -44,7 +59,9 @@ export function useChoreBossDashboardData({
         }
         setChores(nextChores);
         setPeople(nextPeople);
-        onMessageChange(`Welcome, ${session.loginName}`);
+        if (!isRefresh) {
+          onMessageChange(`Welcome, ${session.loginName}`);
+        }
       } catch (error: unknown) {
         if (!isCurrent) {
           return;
@@ -62,7 +79,7 @@ export function useChoreBossDashboardData({
     return () => {
       isCurrent = false;
     };
-  }, [session, onMessageChange]);
+  }, [session, onMessageChange, revision]);
 
   return {
     chores,
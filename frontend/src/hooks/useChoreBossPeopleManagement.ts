@@ -1,6 +1,6 @@
 import type { FormEvent } from 'react';
-import { useState } from 'react';
-import { createPerson, deletePerson, updatePerson } from '../api';
+import { useRef, useState } from 'react';
+import { ApiError, createPerson, deletePerson, stepUp, updatePerson } from '../api';
 import type { AuthSession, PersonRead } from '../types';
 import {
   type PersonCreateFormState,
@@ -59,6 +59,28 @@ export function useChoreBossPeopleManagement({
   const [editingPersonId, setEditingPersonId] = useState<number | null>(null);
   const [peopleFormError, setPeopleFormError] = useState<string>('');
   const [peopleFormBusy, setPeopleFormBusy] = useState(false);
+  // Step-up token reused for deletes until shortly before it expires
+  const stepUpRef = useRef<{ accessToken: string; token: string; expiresAt: number } | null>(null);
+
+  async function getStepUpToken(accessToken: string): Promise<string | null> {
+    const cached = stepUpRef.current;
+    if (cached && cached.accessToken === accessToken && cached.expiresAt > Date.now()) {
+      return cached.token;
+    }
+
+    const pin = window.prompt('Enter your PIN to confirm');
+    if (!pin) {
+      return null;
+    }
+
+    const response = await stepUp(accessToken, pin);
+    stepUpRef.current = {
+      accessToken,
+      token: response.step_up_token,
+      expiresAt: Date.now() + Math.max(response.expires_in - 10, 0) * 1000,
+    };
+    return response.step_up_token;
+  }
 
   async function handleCreatePerson(event: FormEvent<HTMLFormElement>): Promise<void> {
     event.preventDefault();
@@ -129,13 +151,20 @@ export function useChoreBossPeopleManagement({
     setPeopleFormError('');
 
     try {
-      await deletePerson(session.access_token, personId);
+      const stepUpToken = await getStepUpToken(session.access_token);
+      if (!stepUpToken) {
+        return;
+      }
+      await deletePerson(stepUpToken, personId);
       setPeople((current) => current.filter((candidate) => candidate.id !== personId));
       onMessageChange(`Deleted ${label}`);
       if (editingPersonId === personId) {
         cancelEditPerson();
       }
     } catch (error: unknown) {
+      if (error instanceof ApiError && error.status === 403) {
+        stepUpRef.current = null;
+      }
       setPeopleFormError(error instanceof Error ? error.message : 'Unable to delete person');
     } finally {
       setPeopleFormBusy(false);
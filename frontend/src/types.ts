@@ -40,6 +40,16 @@ export interface ChoreRead {
   updated_at: string;
 }
 
+export interface ChorePage {
+  chores: ChoreRead[];
+  next_cursor: string | null;
+}
+
+export interface PersonPage {
+  people: PersonRead[];
+  next_cursor: string | null;
+}
+
 export interface LoginResponse {
   access_token: string;
   token_type: string;
@@ -47,6 +57,16 @@ export interface LoginResponse {
   is_admin: boolean;
 }
 
+export interface StepUpResponse {
+  step_up_token: string;
+  expires_in: number;
+  scope: string;
+  access_token: string | null;
+  token_type: string;
+  person_id: number;
+  is_admin: boolean;
+}
+
 export interface AuthSession extends LoginResponse {
   loginName: string;
 }
@@ -0,0 +1,50 @@
+"""Add sparse rotation_rank to people
+
+Existing rows are ranked by their current sequence number, spaced
+RANK_GAP apart, so the rotation order is unchanged.
+
+Revision ID: 3f8a6c1e2b47
+Revises: d58f0a2c6e91
+Create Date: 2026-10-17 15:02:18.640371
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f8a6c1e2b47'
+down_revision: Union[str, Sequence[str], None] = 'd58f0a2c6e91'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Must match choreboss.models.people.RANK_GAP
+RANK_GAP = 1 << 20
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('people') as batch_op:
+        batch_op.add_column(
+            sa.Column('rotation_rank', sa.BigInteger(), nullable=True)
+        )
+    op.execute(
+        sa.text('UPDATE people SET rotation_rank = sequence_num * :gap')
+        .bindparams(gap=RANK_GAP)
+    )
+    with op.batch_alter_table('people') as batch_op:
+        batch_op.alter_column(
+            'rotation_rank', existing_type=sa.BigInteger(), nullable=False
+        )
+        batch_op.create_unique_constraint(
+            'uq_people_rotation_rank', ['rotation_rank']
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('people') as batch_op:
+        batch_op.drop_constraint('uq_people_rotation_rank', type_='unique')
+        batch_op.drop_column('rotation_rank')
@@ -0,0 +1,39 @@
+"""Add indexed pin_fingerprint to people
+
+Existing rows keep a NULL fingerprint; it is backfilled the next time each
+person logs in, since the plain PIN is only available at that point.
+
+Revision ID: 4c2e9a7d1f03
+Revises: b17de874045a
+Create Date: 2026-10-17 09:12:41.503218
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4c2e9a7d1f03'
+down_revision: Union[str, Sequence[str], None] = 'b17de874045a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('people') as batch_op:
+        batch_op.add_column(
+            sa.Column('pin_fingerprint', sa.String(length=64), nullable=True)
+        )
+        batch_op.create_index(
+            'ix_people_pin_fingerprint', ['pin_fingerprint'], unique=False
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('people') as batch_op:
+        batch_op.drop_index('ix_people_pin_fingerprint')
+        batch_op.drop_column('pin_fingerprint')
@@ -0,0 +1,36 @@
+"""Add data_version table
+
+Single-row counter that every transaction writing chores or people
+bumps, so per-worker list caches can tell when they are stale.
+
+Revision ID: 5a9c2e7f4b18
+Revises: 7b2d4e9f1a65
+Create Date: 2026-10-17 18:40:12.519304
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5a9c2e7f4b18'
+down_revision: Union[str, Sequence[str], None] = '7b2d4e9f1a65'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    data_version = op.create_table('data_version',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('version', sa.BigInteger(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.bulk_insert(data_version, [{'id': 1, 'version': 0}])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('data_version')
@@ -0,0 +1,36 @@
+"""Keyset listing indexes on chores
+
+Replaces the single-column chores.person_id index with (person_id, id),
+which still serves the foreign key and also returns each assignee's
+chores in listing order. Adds (last_completed_date, id) for the
+completed_since filter.
+
+Revision ID: 7b2d4e9f1a65
+Revises: 3f8a6c1e2b47
+Create Date: 2026-10-17 16:21:07.331942
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7b2d4e9f1a65'
+down_revision: Union[str, Sequence[str], None] = '3f8a6c1e2b47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_chores_person_id_id', 'chores', ['person_id', 'id'], unique=False)
+    op.drop_index('ix_chores_person_id', table_name='chores')
+    op.create_index('ix_chores_completed', 'chores', ['last_completed_date', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_chores_completed', table_name='chores')
+    op.create_index('ix_chores_person_id', 'chores', ['person_id'], unique=False)
+    op.drop_index('ix_chores_person_id_id', table_name='chores')
@@ -0,0 +1,44 @@
+"""Add per-person daily and weekly completion rollups
+
+The rollups are kept up to date by each completion. Rows for history
+recorded before the upgrade come from ``python -m api.tasks
+rebuild-rollups``.
+
+Revision ID: a6f3c9e1d472
+Revises: e4b8d2f6a913
+Create Date: 2026-10-17 22:14:09.203518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a6f3c9e1d472'
+down_revision: Union[str, Sequence[str], None] = 'e4b8d2f6a913'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('daily_completions',
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('person_id', sa.Integer(), nullable=False),
+    sa.Column('completions', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('day', 'person_id')
+    )
+    op.create_table('weekly_completions',
+    sa.Column('week_start', sa.Date(), nullable=False),
+    sa.Column('person_id', sa.Integer(), nullable=False),
+    sa.Column('completions', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('week_start', 'person_id')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('weekly_completions')
+    op.drop_table('daily_completions')
@@ -0,0 +1,54 @@
+"""Record completion history and rollups with triggers
+
+Completing a chore no longer inserts the history row and upserts the
+rollups itself; triggers on ``chores`` and ``chore_completions`` do it
+in the completing statement. Existing rollups already count existing
+history, so nothing is backfilled.
+
+Revision ID: b3d9f6e2a871
+Revises: e7c1f4a9b206
+Create Date: 2026-10-19 10:41:27.604318
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+from choreboss.models.triggers import POSTGRESQL, SQLITE
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3d9f6e2a871'
+down_revision: Union[str, Sequence[str], None] = 'e7c1f4a9b206'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_TRIGGERS = {
+    'chores_record_completion': 'chores',
+    'chore_completions_roll_up': 'chore_completions',
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    dialect = op.get_bind().dialect.name
+    statements = {'sqlite': SQLITE, 'postgresql': POSTGRESQL}.get(dialect)
+    if statements is None:
+        raise NotImplementedError(
+            f'No completion triggers for the {dialect} dialect'
+        )
+    for statement in statements:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    dialect = op.get_bind().dialect.name
+    for name, table in _TRIGGERS.items():
+        if dialect == 'postgresql':
+            op.execute(f'DROP TRIGGER IF EXISTS {name} ON {table}')
+        else:
+            op.execute(f'DROP TRIGGER IF EXISTS {name}')
+    if dialect == 'postgresql':
+        op.execute('DROP FUNCTION IF EXISTS record_chore_completion()')
+        op.execute('DROP FUNCTION IF EXISTS roll_up_chore_completion()')
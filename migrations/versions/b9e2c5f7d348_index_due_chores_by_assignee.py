@@ -0,0 +1,30 @@
+"""Index due chores by assignee
+
+Serves GET /api/chores/due?assignee= as a range scan; the unfiltered
+listing already uses ix_chores_next_due.
+
+Revision ID: b9e2c5f7d348
+Revises: f1d7b3a8c520
+Create Date: 2026-10-17 23:41:26.018377
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b9e2c5f7d348'
+down_revision: Union[str, Sequence[str], None] = 'f1d7b3a8c520'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_chores_person_next_due', 'chores', ['person_id', 'next_due_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_chores_person_next_due', table_name='chores')
@@ -0,0 +1,50 @@
+"""Add change versions and tombstones for delta sync
+
+Chores and people get a change_version column, stamped at commit with
+the data version of the last transaction that wrote the row. Existing
+rows start at version 0, which a full snapshot already covers.
+
+Revision ID: c3e7a1d9f2b5
+Revises: 5a9c2e7f4b18
+Create Date: 2026-10-17 19:25:44.806113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3e7a1d9f2b5'
+down_revision: Union[str, Sequence[str], None] = '5a9c2e7f4b18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in ('chores', 'people'):
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.add_column(sa.Column('change_version', sa.BigInteger(), nullable=True))
+            batch_op.create_index(f'ix_{table}_change_version', ['change_version'], unique=False)
+        op.execute(f'UPDATE {table} SET change_version = 0')
+    op.create_table('tombstones',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('entity', sa.String(length=16), nullable=False),
+    sa.Column('entity_id', sa.Integer(), nullable=False),
+    sa.Column('change_version', sa.BigInteger(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_tombstones_change_version', 'tombstones', ['change_version'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_tombstones_change_version', table_name='tombstones')
+    op.drop_table('tombstones')
+    for table in ('people', 'chores'):
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.drop_index(f'ix_{table}_change_version')
+            batch_op.drop_column('change_version')
@@ -0,0 +1,37 @@
+"""Add background job leases and a due reminder marker on chores
+
+Revision ID: c8a4e6d2b193
+Revises: b9e2c5f7d348
+Create Date: 2026-10-18 00:27:13.640952
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c8a4e6d2b193'
+down_revision: Union[str, Sequence[str], None] = 'b9e2c5f7d348'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('job_leases',
+    sa.Column('name', sa.String(length=64), nullable=False),
+    sa.Column('holder', sa.String(length=128), nullable=False),
+    sa.Column('expires_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('name')
+    )
+    with op.batch_alter_table('chores') as batch_op:
+        batch_op.add_column(sa.Column('reminded_due_at', sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('chores') as batch_op:
+        batch_op.drop_column('reminded_due_at')
+    op.drop_table('job_leases')
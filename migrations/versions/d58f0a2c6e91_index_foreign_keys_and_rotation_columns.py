@@ -0,0 +1,60 @@
+"""Index foreign keys and rotation columns
+
+Adds indexes on chores.person_id and chores.last_completed_id, a unique
+constraint on people.sequence_num, and an admins-only partial index on
+people (a plain is_admin index where partial indexes are unsupported).
+Sequence numbers are renumbered 1..n first, so duplicates left by the
+old reorder code do not stop the constraint from being created.
+
+Revision ID: d58f0a2c6e91
+Revises: 9e1b7c3a5d20
+Create Date: 2026-10-17 13:40:55.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd58f0a2c6e91'
+down_revision: Union[str, Sequence[str], None] = '9e1b7c3a5d20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PARTIAL_INDEX_DIALECTS = {'postgresql', 'sqlite'}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_chores_person_id', 'chores', ['person_id'], unique=False)
+    op.create_index('ix_chores_last_completed_id', 'chores', ['last_completed_id'], unique=False)
+    # Keep the current order, breaking ties between duplicates by id
+    op.execute(
+        'UPDATE people SET sequence_num = ranked.new_num '
+        'FROM (SELECT id, ROW_NUMBER() OVER (ORDER BY sequence_num, id) '
+        'AS new_num FROM people) AS ranked '
+        'WHERE people.id = ranked.id'
+    )
+    with op.batch_alter_table('people') as batch_op:
+        batch_op.create_unique_constraint('uq_people_sequence_num', ['sequence_num'])
+
+    if op.get_bind().dialect.name in PARTIAL_INDEX_DIALECTS:
+        # Must match the compiled form of People.is_admin.is_(True)
+        op.create_index(
+            'ix_people_admins', 'people', ['id'], unique=False,
+            postgresql_where=sa.text('is_admin IS true'),
+            sqlite_where=sa.text('is_admin IS 1'),
+        )
+    else:
+        op.create_index('ix_people_admins', 'people', ['is_admin'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_people_admins', table_name='people')
+    with op.batch_alter_table('people') as batch_op:
+        batch_op.drop_constraint('uq_people_sequence_num', type_='unique')
+    op.drop_index('ix_chores_last_completed_id', table_name='chores')
+    op.drop_index('ix_chores_person_id', table_name='chores')
@@ -0,0 +1,48 @@
+"""Add chore completion history table
+
+Completions were only kept as the last completer and date on the chore
+row. Existing last completions seed the history so it is not empty for
+chores completed before the upgrade.
+
+Revision ID: e4b8d2f6a913
+Revises: c3e7a1d9f2b5
+Create Date: 2026-10-17 21:02:37.512846
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4b8d2f6a913'
+down_revision: Union[str, Sequence[str], None] = 'c3e7a1d9f2b5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('chore_completions',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('chore_id', sa.Integer(), nullable=False),
+    sa.Column('person_id', sa.Integer(), nullable=False),
+    sa.Column('completed_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_chore_completions_chore_id_completed_at', 'chore_completions', ['chore_id', 'completed_at'], unique=False)
+    op.create_index('ix_chore_completions_person_id_completed_at', 'chore_completions', ['person_id', 'completed_at'], unique=False)
+    op.execute(
+        'INSERT INTO chore_completions (chore_id, person_id, completed_at) '
+        'SELECT id, last_completed_id, last_completed_date FROM chores '
+        'WHERE last_completed_id IS NOT NULL '
+        'AND last_completed_date IS NOT NULL'
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_chore_completions_person_id_completed_at', table_name='chore_completions')
+    op.drop_index('ix_chore_completions_chore_id_completed_at', table_name='chore_completions')
+    op.drop_table('chore_completions')
@@ -0,0 +1,27 @@
+"""Index revoked_tokens.created_at for overlap-window syncs
+
+Revision ID: e7c1f4a9b206
+Revises: c8a4e6d2b193
+Create Date: 2026-10-18 09:12:40.517203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7c1f4a9b206'
+down_revision: Union[str, Sequence[str], None] = 'c8a4e6d2b193'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_revoked_tokens_created_at', 'revoked_tokens', ['created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_revoked_tokens_created_at', table_name='revoked_tokens')
@@ -0,0 +1,40 @@
+"""Add recurrence rules and an indexed next_due_at to chores
+
+The API accepted recurrence and recurrence_day but the chores table had
+nowhere to keep them. Existing chores become one-off chores with no due
+date.
+
+Revision ID: f1d7b3a8c520
+Revises: a6f3c9e1d472
+Create Date: 2026-10-17 23:03:51.774210
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1d7b3a8c520'
+down_revision: Union[str, Sequence[str], None] = 'a6f3c9e1d472'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('chores') as batch_op:
+        batch_op.add_column(sa.Column('recurrence', sa.String(length=16), nullable=False, server_default='none'))
+        batch_op.add_column(sa.Column('recurrence_day', sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column('next_due_at', sa.DateTime(), nullable=True))
+        batch_op.create_index('ix_chores_next_due', ['next_due_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('chores') as batch_op:
+        batch_op.drop_index('ix_chores_next_due')
+        batch_op.drop_column('next_due_at')
+        batch_op.drop_column('recurrence_day')
+        batch_op.drop_column('recurrence')
@@ -2,7 +2,6 @@
 """Setup test data for ChoreBoss FastAPI backend."""
 
 import asyncio
-import bcrypt
 from choreboss.models.chore import Chore
 from choreboss.models.people import People
 from choreboss.models import Base
@@ -38,7 +37,7 @@ async def setup_test_data():
             last_name='Smith',
             login_name='alice',
             birthday='2000-01-15',
-            pin=bcrypt.hashpw(b'1234', bcrypt.gensalt()).decode(),
+            pin='1234',
             is_admin=True,
             sequence_num=1
         )
@@ -47,10 +46,13 @@ async def setup_test_data():
             last_name='Jones',
             login_name='bob',
             birthday='2001-05-20',
-            pin=bcrypt.hashpw(b'5678', bcrypt.gensalt()).decode(),
+            pin='5678',
             is_admin=False,
             sequence_num=2
         )
+        # Hash through the shared hasher so the fingerprints are set too
+        await person1.set_pin('1234')
+        await person2.set_pin('5678')
         
         # Create chores
         chore1 = Chore(
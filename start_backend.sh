@@ -21,6 +21,15 @@ source .venv/bin/activate
 # Set database to SQLite (async)
 export DATABASE_URL="sqlite+aiosqlite:///choreboss.db"
 
+# PIN_PEPPER is required. Without one, generate it once and keep it in
+# .pin_pepper: changing it invalidates every stored PIN fingerprint.
+if [ -z "$PIN_PEPPER" ]; then
+    if [ ! -f .pin_pepper ]; then
+        (umask 077 && python3 -c "import secrets; print(secrets.token_urlsafe(32))" > .pin_pepper)
+    fi
+    export PIN_PEPPER="$(cat .pin_pepper)"
+fi
+
 echo "✅ Database: $DATABASE_URL"
 echo ""
 LAN_IP=$(hostname -I 2>/dev/null | awk '{print $1}')
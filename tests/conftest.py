@@ -11,9 +11,59 @@ from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
+from api.dependencies.auth import claims_cache, revocations
 from api.dependencies.db import get_session
+from api.dependencies.login_throttle import get_login_throttle
 from api.main import create_app
+from choreboss.config import get_config
+from choreboss.events import broker
 from choreboss.models import Base
+from choreboss.repositories import list_cache
+from choreboss.repositories.chore_repository import due_queue
+from choreboss.services.assignment_policy import load_heap
+
+# PIN_PEPPER is required; tests use a fixed one unless the env sets it
+_config = get_config()
+_config.pin_pepper = _config.pin_pepper or "test-pin-pepper"
+
+
+@pytest.fixture(autouse=True)
+def reset_token_state():
+    """Clear per-process token caches between tests.
+
+    Yields:
+        None: Control to the test.
+    """
+    yield
+    claims_cache.clear()
+    revocations.reset()
+    get_login_throttle().backend.clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_list_cache():
+    """Clear version-keyed caches, since every test starts at version 0.
+
+    Yields:
+        None: Control to the test.
+    """
+    yield
+    list_cache.clear()
+    due_queue.load(())
+    due_queue.version = None
+    load_heap.load((), ())
+    load_heap.version = None
+
+
+@pytest.fixture(autouse=True)
+def reset_event_broker():
+    """Clear event history and subscribers between tests.
+
+    Yields:
+        None: Control to the test.
+    """
+    yield
+    broker.clear()
 
 
 @pytest_asyncio.fixture
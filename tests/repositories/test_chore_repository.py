@@ -0,0 +1,190 @@
+"""Tests for the chore repository."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import event, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from choreboss.models.chore_completion import ChoreCompletion
+from choreboss.repositories import ChoreRepository
+from tests.setup_memory_records import setup_test_chores, setup_test_people
+
+
+@pytest.mark.asyncio
+async def test_complete_and_rotate_is_a_single_update(
+    async_session: AsyncSession,
+) -> None:
+    """Test completion, rotation and history take a single UPDATE.
+
+    Args:
+        async_session: Database session.
+    """
+    people = await setup_test_people(async_session, 3)
+    chores = await setup_test_chores(async_session, 1)
+    chores[0].person_id = people[1].id
+    await async_session.commit()
+    repo = ChoreRepository(async_session)
+    statements = []
+
+    def count(conn, cursor, statement, *args) -> None:
+        statements.append(statement)
+
+    engine = async_session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", count)
+    try:
+        chore = await repo.complete_and_rotate(chores[0].id, people[1].id)
+    finally:
+        event.remove(engine, "before_cursor_execute", count)
+
+    # The transaction's first write also bumps the data version
+    assert len(statements) == 2
+    assert "data_version" in statements[0]
+    assert statements[1].lstrip().upper().startswith("UPDATE CHORES")
+    assert chore.person_id == people[2].id
+    assert chore.last_completed_id == people[1].id
+    assert chore.last_completed_date is not None
+    history = await repo.list_completions(10, chore_id=chores[0].id)
+    assert [c.completed_at for c in history] == [chore.last_completed_date]
+
+
+@pytest.mark.asyncio
+async def test_complete_and_rotate_wraps_and_skips_unassigned(
+    async_session: AsyncSession,
+) -> None:
+    """Test rotation wraps to the first person and leaves unassigned alone.
+
+    Args:
+        async_session: Database session.
+    """
+    people = await setup_test_people(async_session, 3)
+    chores = await setup_test_chores(async_session, 3)
+    chores[0].person_id = people[2].id
+    chores[2].person_id = people[0].id
+    await async_session.commit()
+    repo = ChoreRepository(async_session)
+
+    # Each chore rotates from its own assignee, not another chore's
+    advanced = await repo.complete_and_rotate(chores[2].id, people[0].id)
+    wrapped = await repo.complete_and_rotate(chores[0].id, people[2].id)
+    unassigned = await repo.complete_and_rotate(chores[1].id, people[0].id)
+
+    assert advanced.person_id == people[1].id
+    assert wrapped.person_id == people[0].id
+    assert unassigned.person_id is None
+    assert unassigned.last_completed_id == people[0].id
+    assert await repo.complete_and_rotate(999, people[0].id) is None
+
+
+@pytest.mark.asyncio
+async def test_completion_history_pages_newest_first(
+    async_session: AsyncSession,
+) -> None:
+    """Test each completion is kept and history pages by chore and person.
+
+    Args:
+        async_session: Database session.
+    """
+    people = await setup_test_people(async_session, 2)
+    chores = await setup_test_chores(async_session, 2)
+    await async_session.commit()
+    repo = ChoreRepository(async_session)
+    done_at = datetime(2026, 3, 1)
+    for day, (chore, person) in enumerate(
+        [(0, 0), (0, 1), (1, 0), (0, 0)],
+    ):
+        await async_session.execute(
+            insert(ChoreCompletion).values(
+                chore_id=chores[chore].id,
+                person_id=people[person].id,
+                completed_at=done_at + timedelta(days=day),
+            )
+        )
+    await async_session.commit()
+
+    first = await repo.list_completions(2, chore_id=chores[0].id)
+    last = first[-1]
+    rest = await repo.list_completions(
+        2,
+        before=(last.completed_at, last.id),
+        chore_id=chores[0].id,
+    )
+    by_person = await repo.list_completions(10, person_id=people[0].id)
+
+    assert [c.completed_at.day for c in first + rest] == [4, 2, 1]
+    assert [c.person_id for c in first + rest] == [
+        people[0].id,
+        people[1].id,
+        people[0].id,
+    ]
+    assert [c.chore_id for c in by_person] == [
+        chores[0].id,
+        chores[1].id,
+        chores[0].id,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_completion_history_rolls_back_with_the_completion(
+    async_session: AsyncSession,
+) -> None:
+    """Test the history row is written in the completion transaction.
+
+    Args:
+        async_session: Database session.
+    """
+    people = await setup_test_people(async_session, 1)
+    chores = await setup_test_chores(async_session, 1)
+    await async_session.commit()
+    chore_id = chores[0].id
+    person_id = people[0].id
+    repo = ChoreRepository(async_session)
+
+    await repo.complete_and_rotate(chore_id, person_id)
+    await async_session.rollback()
+    assert await repo.list_completions(10, chore_id=chore_id) == []
+
+    await repo.complete_and_rotate(chore_id, person_id)
+    await async_session.commit()
+    history = await repo.list_completions(10, chore_id=chore_id)
+    assert [c.person_id for c in history] == [person_id]
+
+
+@pytest.mark.asyncio
+async def test_get_chore_loads_relationships_only_on_expand(
+    async_session: AsyncSession,
+) -> None:
+    """Test relationships cost an extra SELECT only when expanded.
+
+    Args:
+        async_session: Database session.
+    """
+    people = await setup_test_people(async_session, 1)
+    chores = await setup_test_chores(async_session, 1)
+    chores[0].person_id = people[0].id
+    await async_session.commit()
+    async_session.expunge_all()
+    repo = ChoreRepository(async_session)
+    statements = []
+
+    def count(conn, cursor, statement, *args) -> None:
+        statements.append(statement)
+
+    engine = async_session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", count)
+    try:
+        plain = await repo.get_chore_by_id(chores[0].id)
+        plain_count = len(statements)
+        async_session.expunge_all()
+        expanded = await repo.get_chore_by_id(
+            chores[0].id, expand={"assignee"}
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", count)
+
+    assert plain_count == 1
+    assert plain.assignee is None
+    assert len(statements) - plain_count == 2
+    assert expanded.assignee.id == people[0].id
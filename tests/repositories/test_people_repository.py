@@ -0,0 +1,303 @@
+"""Tests for the people repository."""
+
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.main import create_app
+from choreboss.config import get_config
+from choreboss.models.people import RANK_GAP
+from choreboss.repositories import (
+    AuthPrincipal,
+    ChangeRepository,
+    PeopleRepository,
+)
+from choreboss.services import PeopleService
+from choreboss.security import pin_fingerprint
+from tests.setup_memory_records import setup_test_people
+
+
+@pytest.mark.asyncio
+async def test_get_person_by_pin_uses_fingerprint(
+    async_session: AsyncSession,
+) -> None:
+    """Test PIN lookup resolves the person via the fingerprint column.
+
+    Args:
+        async_session: Database session.
+    """
+    people = await setup_test_people(async_session, 3)
+    await async_session.commit()
+    repo = PeopleRepository(async_session)
+
+    person = await repo.get_person_by_pin("5678")
+
+    assert person is not None
+    assert person.id == people[1].id
+    assert person.pin_fingerprint == pin_fingerprint("5678")
+    assert await repo.get_person_by_pin("0000") is None
+
+
+@pytest.mark.asyncio
+async def test_get_person_by_pin_backfills_legacy_rows(
+    async_session: AsyncSession,
+) -> None:
+    """Test people without a fingerprint are found and backfilled.
+
+    Args:
+        async_session: Database session.
+    """
+    people = await setup_test_people(async_session, 2)
+    people[1].pin_fingerprint = None
+    await async_session.commit()
+    repo = PeopleRepository(async_session)
+
+    person = await repo.get_person_by_pin("5678")
+
+    assert person is not None
+    assert person.id == people[1].id
+    assert person.pin_fingerprint == pin_fingerprint("5678")
+
+
+def test_pin_fingerprint_needs_its_own_pepper(monkeypatch) -> None:
+    """Test fingerprints ignore SECRET_KEY and require PIN_PEPPER.
+
+    Args:
+        monkeypatch: Pytest monkeypatch fixture.
+    """
+    config = get_config()
+    before = pin_fingerprint("1234")
+    monkeypatch.setattr(config, "secret_key", "rotated-jwt-key")
+
+    assert pin_fingerprint("1234") == before
+    monkeypatch.setattr(config, "pin_pepper", "")
+    with pytest.raises(RuntimeError):
+        pin_fingerprint("1234")
+    with pytest.raises(RuntimeError):
+        create_app()
+
+
+@pytest.mark.asyncio
+async def test_get_admin_by_pin(async_session: AsyncSession) -> None:
+    """Test admin resolution by fingerprint and by acting person.
+
+    Args:
+        async_session: Database session.
+    """
+    people = await setup_test_people(async_session, 2)
+    await async_session.commit()
+    admin, member = people
+    repo = PeopleRepository(async_session)
+
+    assert (await repo.get_admin_by_pin("1234")).id == admin.id
+    assert await repo.get_admin_by_pin("5678") is None
+    assert await repo.is_admin("1234", person_id=admin.id)
+    assert not await repo.is_admin("1234", person_id=member.id)
+    assert not await repo.is_admin("9999", person_id=admin.id)
+
+
+@pytest.mark.asyncio
+async def test_get_auth_principal_is_single_lean_query(
+    async_session: AsyncSession,
+) -> None:
+    """Test the auth projection issues one query and loads no chores.
+
+    Args:
+        async_session: Database session.
+    """
+    people = await setup_test_people(async_session, 1)
+    await async_session.commit()
+    repo = PeopleRepository(async_session)
+    statements = []
+
+    def count(conn, cursor, statement, *args) -> None:
+        statements.append(statement)
+
+    engine = async_session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", count)
+    try:
+        principal = await repo.get_auth_principal_by_login_name("JOHN")
+    finally:
+        event.remove(engine, "before_cursor_execute", count)
+
+    assert isinstance(principal, AuthPrincipal)
+    assert principal.id == people[0].id
+    assert principal.is_admin is True
+    assert len(statements) == 1
+    assert "chores" not in statements[0]
+    assert await repo.get_auth_principal_by_id(999) is None
+
+
+@pytest.mark.asyncio
+async def test_resequence_reverses_order_in_batches(
+    async_session: AsyncSession,
+) -> None:
+    """Test a full reorder is applied across several CASE batches.
+
+    Args:
+        async_session: Database session.
+    """
+    people = await setup_test_people(async_session, 3)
+    await async_session.commit()
+    repo = PeopleRepository(async_session)
+
+    await repo.resequence(
+        {person.id: 4 - person.sequence_num for person in people},
+        batch_size=2,
+    )
+    await async_session.commit()
+
+    ordered = await repo.get_all_people()
+    assert [p.id for p in ordered] == [p.id for p in reversed(people)]
+    assert [p.sequence_num for p in ordered] == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_delete_person_and_adjust_sequence_closes_gap(
+    async_session: AsyncSession,
+) -> None:
+    """Test deleting a person shifts later people up without loading them.
+
+    Args:
+        async_session: Database session.
+    """
+    people = await setup_test_people(async_session, 3)
+    await async_session.commit()
+    service = PeopleService(PeopleRepository(async_session))
+
+    await service.delete_person_and_adjust_sequence(people[0].id)
+    await async_session.commit()
+
+    ordered = await service.get_all_people()
+    assert [p.id for p in ordered] == [people[1].id, people[2].id]
+    assert [p.sequence_num for p in ordered] == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_reorder_single_move_updates_one_row(
+    async_session: AsyncSession,
+) -> None:
+    """Test moving one person writes one rank, then renumbers in bulk.
+
+    Args:
+        async_session: Database session.
+    """
+    people = await setup_test_people(async_session, 3)
+    await async_session.commit()
+    admin, jane, mary = people
+    service = PeopleService(PeopleRepository(async_session))
+    statements = []
+
+    def count(conn, cursor, statement, parameters, *args) -> None:
+        if statement.lstrip().upper().startswith("UPDATE"):
+            statements.append((statement, parameters))
+
+    engine = async_session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", count)
+    try:
+        await service.reorder({mary.id: 1})
+    finally:
+        event.remove(engine, "before_cursor_execute", count)
+    await async_session.commit()
+
+    # The version bump, one rank, then the two renumbering statements
+    assert len(statements) == 4
+    assert "data_version" in statements[0][0]
+    assert "rotation_rank" in statements[1][0]
+    assert mary.id in statements[1][1]
+    ordered = await service.get_all_people()
+    assert [p.id for p in ordered] == [mary.id, admin.id, jane.id]
+    assert [p.sequence_num for p in ordered] == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_reorder_respreads_when_gap_runs_out(
+    async_session: AsyncSession,
+) -> None:
+    """Test a move into an exhausted gap rewrites the whole rotation.
+
+    Args:
+        async_session: Database session.
+    """
+    people = await setup_test_people(async_session, 3)
+    admin, jane, mary = people
+    jane.rotation_rank = admin.rotation_rank + 1
+    await async_session.commit()
+    service = PeopleService(PeopleRepository(async_session))
+
+    await service.reorder({mary.id: 2})
+    await async_session.commit()
+
+    ordered = await service.get_all_people()
+    assert [p.id for p in ordered] == [admin.id, mary.id, jane.id]
+    assert [p.sequence_num for p in ordered] == [1, 2, 3]
+    assert [p.rotation_rank for p in ordered] == [
+        RANK_GAP,
+        2 * RANK_GAP,
+        3 * RANK_GAP,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_rebalance_ranks_only_when_needed(
+    async_session: AsyncSession,
+) -> None:
+    """Test the rebalance is a no-op until ranks get too close.
+
+    Args:
+        async_session: Database session.
+    """
+    people = await setup_test_people(async_session, 3)
+    await async_session.commit()
+    repo = PeopleRepository(async_session)
+
+    assert not await repo.rebalance_ranks(min_gap=1024)
+
+    # The move halves a gap and already renumbers positions
+    await PeopleService(repo).reorder({people[2].id: 1})
+    assert not await repo.rebalance_ranks(min_gap=1024)
+    assert await repo.rebalance_ranks(min_gap=RANK_GAP)
+    await async_session.commit()
+
+    ordered = await repo.get_all_people()
+    assert [p.id for p in ordered] == [
+        people[2].id,
+        people[0].id,
+        people[1].id,
+    ]
+    assert [p.sequence_num for p in ordered] == [1, 2, 3]
+    assert [p.rotation_rank for p in ordered] == [
+        RANK_GAP,
+        2 * RANK_GAP,
+        3 * RANK_GAP,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_delete_person_stamps_changes_and_tombstone(
+    async_session: AsyncSession,
+) -> None:
+    """Test bulk-shifted people and the tombstone get the commit's version.
+
+    Args:
+        async_session: Database session.
+    """
+    people = await setup_test_people(async_session, 3)
+    await async_session.commit()
+    removed_id, kept_ids = people[0].id, [people[1].id, people[2].id]
+    changes = ChangeRepository(async_session)
+    before = await changes.get_current_version()
+    service = PeopleService(PeopleRepository(async_session))
+
+    await service.delete_person_and_adjust_sequence(removed_id)
+    await async_session.commit()
+
+    changed = await PeopleRepository(async_session).get_changed_since(before)
+    assert await changes.get_current_version() == before + 1
+    assert [p.id for p in changed] == kept_ids
+    assert await changes.get_deletions_since(before) == {
+        "chore": [],
+        "person": [removed_id],
+    }
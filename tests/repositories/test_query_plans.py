@@ -0,0 +1,208 @@
+"""Guard rotation, admin and listing queries against full scans in SQLite."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy import func, select, tuple_, update
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from choreboss.models.chore import Chore
+from choreboss.models.chore_completion import ChoreCompletion
+from choreboss.models.people import People
+
+
+async def _plan(session: AsyncSession, stmt) -> list[str]:
+    """Return the EXPLAIN QUERY PLAN detail lines for a statement.
+
+    Args:
+        session: Database session.
+        stmt: SQLAlchemy statement to explain.
+
+    Returns:
+        list: Plan detail strings.
+    """
+    compiled = stmt.compile(
+        dialect=sqlite.dialect(),
+        compile_kwargs={"literal_binds": True},
+    )
+    result = await session.connection()
+    rows = await result.exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled}")
+    return [row[3] for row in rows]
+
+
+def _assert_no_table_scan(plan: list[str], table: str) -> None:
+    """Fail if the plan scans ``table`` without an index."""
+    for detail in plan:
+        assert detail != f"SCAN {table}", plan
+
+
+@pytest.mark.asyncio
+async def test_delete_person_unassign_uses_chore_fk_indexes(
+    async_session: AsyncSession,
+) -> None:
+    """Test unassigning a deleted person's chores searches both FK indexes.
+
+    Args:
+        async_session: Database session.
+    """
+    stmt = (
+        update(Chore)
+        .where((Chore.person_id == 1) | (Chore.last_completed_id == 1))
+        .values(person_id=None, last_completed_id=None)
+    )
+
+    plan = await _plan(async_session, stmt)
+
+    _assert_no_table_scan(plan, "chores")
+    assert any("ix_chores_person_id" in detail for detail in plan)
+    assert any("ix_chores_last_completed_id" in detail for detail in plan)
+
+
+@pytest.mark.asyncio
+async def test_next_person_rotation_uses_sequence_index(
+    async_session: AsyncSession,
+) -> None:
+    """Test the next-in-sequence lookup and max sequence use the index.
+
+    Args:
+        async_session: Database session.
+    """
+    next_stmt = (
+        select(People)
+        .where(People.sequence_num > 1)
+        .order_by(People.sequence_num)
+        .limit(1)
+    )
+    max_stmt = select(func.max(People.sequence_num))
+
+    for stmt in (next_stmt, max_stmt):
+        plan = await _plan(async_session, stmt)
+        _assert_no_table_scan(plan, "people")
+        # SQLite backs the unique constraint with an autoindex
+        assert any("USING" in d and "INDEX" in d for d in plan), plan
+
+
+@pytest.mark.asyncio
+async def test_admins_exist_uses_partial_index(
+    async_session: AsyncSession,
+) -> None:
+    """Test admins_exist reads the admins-only partial index.
+
+    Args:
+        async_session: Database session.
+    """
+    stmt = select(People.id).where(People.is_admin.is_(True)).limit(1)
+
+    plan = await _plan(async_session, stmt)
+
+    _assert_no_table_scan(plan, "people")
+    assert any("ix_people_admins" in detail for detail in plan)
+
+
+@pytest.mark.asyncio
+async def test_chore_listing_pages_are_index_range_scans(
+    async_session: AsyncSession,
+) -> None:
+    """Test filtered chore pages read an index in order without sorting.
+
+    Args:
+        async_session: Database session.
+    """
+    by_assignee = (
+        select(Chore)
+        .where(Chore.person_id == 1, Chore.id > 10)
+        .order_by(Chore.id)
+        .limit(51)
+    )
+    by_completion = (
+        select(Chore)
+        .where(
+            Chore.last_completed_date >= datetime(2026, 1, 1),
+            tuple_(Chore.last_completed_date, Chore.id)
+            > tuple_(datetime(2026, 2, 1), 10),
+        )
+        .order_by(Chore.last_completed_date, Chore.id)
+        .limit(51)
+    )
+
+    for stmt, index in (
+        (by_assignee, "ix_chores_person_id_id"),
+        (by_completion, "ix_chores_completed"),
+    ):
+        plan = await _plan(async_session, stmt)
+        _assert_no_table_scan(plan, "chores")
+        assert any(index in detail for detail in plan), plan
+        assert not any("TEMP B-TREE" in detail for detail in plan), plan
+
+
+@pytest.mark.asyncio
+async def test_completion_history_pages_use_composite_indexes(
+    async_session: AsyncSession,
+) -> None:
+    """Test history pages by chore or person are index range scans.
+
+    Args:
+        async_session: Database session.
+    """
+    after = tuple_(
+        ChoreCompletion.completed_at,
+        ChoreCompletion.id,
+    ) < tuple_(datetime(2026, 1, 1), 500)
+    order = (ChoreCompletion.completed_at.desc(), ChoreCompletion.id.desc())
+    cases = {
+        "ix_chore_completions_chore_id_completed_at": (
+            ChoreCompletion.chore_id == 3
+        ),
+        "ix_chore_completions_person_id_completed_at": (
+            ChoreCompletion.person_id == 3
+        ),
+    }
+
+    for index, condition in cases.items():
+        stmt = (
+            select(ChoreCompletion)
+            .where(condition, after)
+            .order_by(*order)
+            .limit(50)
+        )
+        plan = await _plan(async_session, stmt)
+
+        _assert_no_table_scan(plan, "chore_completions")
+        assert any(index in detail for detail in plan), plan
+        assert not any("TEMP B-TREE" in detail for detail in plan), plan
+
+
+@pytest.mark.asyncio
+async def test_due_chore_pages_use_next_due_indexes(
+    async_session: AsyncSession,
+) -> None:
+    """Test due listings, with or without an assignee, are range scans.
+
+    Args:
+        async_session: Database session.
+    """
+    order = (Chore.next_due_at, Chore.id)
+    due = (
+        select(Chore)
+        .where(
+            Chore.next_due_at < datetime(2026, 3, 1),
+            tuple_(*order) > tuple_(datetime(2026, 1, 1), 10),
+        )
+        .order_by(*order)
+        .limit(50)
+    )
+    cases = (
+        (due, "ix_chores_next_due"),
+        (due.where(Chore.person_id == 2), "ix_chores_person_next_due"),
+        (due.where(Chore.person_id.is_(None)), "ix_chores_person_next_due"),
+    )
+
+    for stmt, index in cases:
+        plan = await _plan(async_session, stmt)
+
+        _assert_no_table_scan(plan, "chores")
+        assert any(index in detail for detail in plan), plan
+        assert not any("TEMP B-TREE" in detail for detail in plan), plan
@@ -0,0 +1,91 @@
+"""Tests for the completion rollup repository."""
+
+from __future__ import annotations
+
+from datetime import date, datetime
+
+import pytest
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from choreboss.models.chore_completion import ChoreCompletion
+from choreboss.models.completion_rollup import DailyCompletions
+from choreboss.repositories import StatsRepository
+from choreboss.repositories.stats_repository import week_start
+
+
+def _counts(rows) -> list[tuple[int, int]]:
+    """Flatten rollup rows into ``(person_id, completions)`` pairs."""
+    return [(row.person_id, row.completions) for row in rows]
+
+
+async def _record(
+    session: AsyncSession,
+    person_id: int,
+    completed_at: datetime,
+) -> None:
+    """Append a completion to the history, as completing a chore does."""
+    await session.execute(
+        insert(ChoreCompletion).values(
+            chore_id=7,
+            person_id=person_id,
+            completed_at=completed_at,
+        )
+    )
+
+
+@pytest.mark.asyncio
+async def test_history_rolls_up_by_day_and_monday_week(
+    async_session: AsyncSession,
+) -> None:
+    """Test completions are counted per UTC day and Monday-start week.
+
+    Args:
+        async_session: Database session.
+    """
+    repo = StatsRepository(async_session)
+    # Sunday 2026-03-08 closes the week; Monday 2026-03-09 opens the next
+    for person_id, completed_at in [
+        (1, datetime(2026, 3, 2, 8)),
+        (1, datetime(2026, 3, 2, 20)),
+        (2, datetime(2026, 3, 2, 9)),
+        (2, datetime(2026, 3, 8, 23, 59)),
+        (2, datetime(2026, 3, 9, 0, 1)),
+    ]:
+        await _record(async_session, person_id, completed_at)
+    await async_session.commit()
+
+    assert _counts(await repo.get_daily(date(2026, 3, 2))) == [(1, 2), (2, 1)]
+    assert _counts(await repo.get_weekly(date(2026, 3, 2))) == [(1, 2), (2, 2)]
+    assert _counts(await repo.get_weekly(date(2026, 3, 9))) == [(2, 1)]
+    assert week_start(date(2026, 3, 8)) == date(2026, 3, 2)
+
+
+@pytest.mark.asyncio
+async def test_rebuild_matches_history(async_session: AsyncSession) -> None:
+    """Test a rebuild recomputes both rollups from the completion history.
+
+    Args:
+        async_session: Database session.
+    """
+    stats = StatsRepository(async_session)
+    for person_id, completed_at in [
+        (1, datetime(2026, 3, 3, 10)),
+        (1, datetime(2026, 3, 4, 10)),
+        (2, datetime(2026, 3, 4, 11)),
+        (2, datetime(2026, 3, 10, 11)),
+    ]:
+        await _record(async_session, person_id, completed_at)
+    # A stale rollup row that the rebuild must drop
+    async_session.add(
+        DailyCompletions(day=date(2026, 3, 4), person_id=3, completions=1)
+    )
+    await async_session.commit()
+
+    daily, weekly = await stats.rebuild()
+    await async_session.commit()
+
+    assert (daily, weekly) == (4, 3)
+    assert _counts(await stats.get_daily(date(2026, 3, 4))) == [(1, 1), (2, 1)]
+    assert _counts(await stats.get_weekly(date(2026, 3, 2))) == [(1, 2), (2, 1)]
+    assert _counts(await stats.get_weekly(date(2026, 3, 9))) == [(2, 1)]
@@ -4,10 +4,13 @@ from __future__ import annotations
 
 import pytest
 from fastapi import status
+from fastapi.security import HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from api.dependencies import get_current_person
+from choreboss.hashing import PasswordHasher, PasswordHasherOverloaded
 from choreboss.models.people import People
-from tests.setup_memory_records import setup_test_people
+from tests.setup_memory_records import setup_test_chores, setup_test_people
 
 
 @pytest.mark.asyncio
@@ -80,3 +83,238 @@ async def test_login_person_not_found(test_client) -> None:
 
     assert response.status_code == status.HTTP_404_NOT_FOUND
     assert "Person not found" in response.json()["detail"]
+
+
+@pytest.mark.asyncio
+async def test_login_backfills_pin_fingerprint(
+    test_client,
+    async_session: AsyncSession,
+) -> None:
+    """Test a successful login stores a missing PIN fingerprint.
+
+    Args:
+        test_client: FastAPI test client.
+        async_session: Database session.
+    """
+    people = await setup_test_people(async_session, 1)
+    person = people[0]
+    person.pin_fingerprint = None
+    await async_session.commit()
+
+    response = test_client.post(
+        "/api/auth/login",
+        json={"login_name": person.login_name, "pin": "1234"},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    await async_session.refresh(person)
+    assert person.pin_fingerprint is not None
+
+
+@pytest.mark.asyncio
+async def test_login_returns_503_when_hasher_overloaded(
+    test_client,
+    async_session: AsyncSession,
+    monkeypatch,
+) -> None:
+    """Test login sheds load when the hashing queue is full.
+
+    Args:
+        test_client: FastAPI test client.
+        async_session: Database session.
+        monkeypatch: Pytest monkeypatch fixture.
+    """
+    people = await setup_test_people(async_session, 1)
+    await async_session.commit()
+
+    async def overloaded(self, pin, hashed):
+        raise PasswordHasherOverloaded("Password hashing queue is full")
+
+    monkeypatch.setattr(PasswordHasher, "verify_pin", overloaded)
+
+    response = test_client.post(
+        "/api/auth/login",
+        json={"login_name": people[0].login_name, "pin": "1234"},
+    )
+
+    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert response.headers["Retry-After"] == "1"
+
+
+@pytest.mark.asyncio
+async def test_step_up_issues_scoped_short_lived_token(
+    test_client,
+    async_session: AsyncSession,
+) -> None:
+    """Test step-up confirms the PIN and returns an elevated token.
+
+    Args:
+        test_client: FastAPI test client.
+        async_session: Database session.
+    """
+    people = await setup_test_people(async_session, 1)
+    await async_session.commit()
+    token = test_client.post(
+        "/api/auth/login",
+        json={"login_name": people[0].login_name, "pin": "1234"},
+    ).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+
+    bad = test_client.post(
+        "/api/auth/step-up", json={"pin": "9999"}, headers=headers
+    )
+    response = test_client.post(
+        "/api/auth/step-up", json={"pin": "1234"}, headers=headers
+    )
+
+    assert bad.status_code == status.HTTP_401_UNAUTHORIZED
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert data["scope"] == "step_up"
+    assert data["expires_in"] == 300
+    assert data["is_admin"] is True
+    # The role is unchanged, so no new long-lived token is minted
+    assert data["access_token"] is None
+    claims = await get_current_person(
+        HTTPAuthorizationCredentials(
+            scheme="Bearer", credentials=data["step_up_token"]
+        ),
+        async_session,
+    )
+    assert claims["scope"] == "step_up"
+
+
+@pytest.mark.asyncio
+async def test_destructive_routes_require_step_up_token(
+    test_client,
+    async_session: AsyncSession,
+) -> None:
+    """Test deletes refuse a plain access token and accept a step-up one.
+
+    Args:
+        test_client: FastAPI test client.
+        async_session: Database session.
+    """
+    people = await setup_test_people(async_session, 1)
+    chores = await setup_test_chores(async_session, 1)
+    await async_session.commit()
+    token = test_client.post(
+        "/api/auth/login",
+        json={"login_name": people[0].login_name, "pin": "1234"},
+    ).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+
+    plain = test_client.delete(f"/api/chores/{chores[0].id}", headers=headers)
+    step_up = test_client.post(
+        "/api/auth/step-up", json={"pin": "1234"}, headers=headers
+    ).json()["step_up_token"]
+    elevated = test_client.delete(
+        f"/api/chores/{chores[0].id}",
+        headers={"Authorization": f"Bearer {step_up}"},
+    )
+
+    assert plain.status_code == status.HTTP_403_FORBIDDEN
+    assert plain.json()["detail"] == "PIN confirmation required"
+    assert elevated.status_code == status.HTTP_204_NO_CONTENT
+
+
+@pytest.mark.asyncio
+async def test_logout_revokes_token(
+    test_client,
+    async_session: AsyncSession,
+) -> None:
+    """Test a logged-out token is rejected on the next request.
+
+    Args:
+        test_client: FastAPI test client.
+        async_session: Database session.
+    """
+    people = await setup_test_people(async_session, 1)
+    await async_session.commit()
+    token = test_client.post(
+        "/api/auth/login",
+        json={"login_name": people[0].login_name, "pin": "1234"},
+    ).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    assert test_client.get("/api/chores/", headers=headers).status_code == 200
+
+    response = test_client.post("/api/auth/logout", headers=headers)
+
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+    response = test_client.get("/api/chores/", headers=headers)
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    assert response.json()["detail"] == "Token has been revoked"
+
+
+@pytest.mark.asyncio
+async def test_login_throttled_after_repeated_failures(
+    test_client,
+    async_session: AsyncSession,
+    monkeypatch,
+) -> None:
+    """Test repeated bad PINs are answered with 429 before hashing.
+
+    Args:
+        test_client: FastAPI test client.
+        async_session: Database session.
+        monkeypatch: Pytest monkeypatch fixture.
+    """
+    people = await setup_test_people(async_session, 1)
+    await async_session.commit()
+    login_name = people[0].login_name
+    for _ in range(6):
+        response = test_client.post(
+            "/api/auth/login",
+            json={"login_name": login_name, "pin": "9999"},
+        )
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    async def no_hashing(self, pin, hashed):
+        raise AssertionError("PIN verified while throttled")
+
+    monkeypatch.setattr(PasswordHasher, "verify_pin", no_hashing)
+    response = test_client.post(
+        "/api/auth/login",
+        json={"login_name": login_name.upper(), "pin": "1234"},
+    )
+
+    assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+    assert int(response.headers["Retry-After"]) >= 1
+
+
+@pytest.mark.asyncio
+async def test_step_up_throttled_after_repeated_failures(
+    test_client,
+    async_session: AsyncSession,
+    monkeypatch,
+) -> None:
+    """Test repeated bad step-up PINs are answered with 429 before hashing.
+
+    Args:
+        test_client: FastAPI test client.
+        async_session: Database session.
+        monkeypatch: Pytest monkeypatch fixture.
+    """
+    people = await setup_test_people(async_session, 1)
+    await async_session.commit()
+    token = test_client.post(
+        "/api/auth/login",
+        json={"login_name": people[0].login_name, "pin": "1234"},
+    ).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    for _ in range(6):
+        response = test_client.post(
+            "/api/auth/step-up", json={"pin": "9999"}, headers=headers
+        )
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    async def no_hashing(self, pin, hashed):
+        raise AssertionError("PIN verified while throttled")
+
+    monkeypatch.setattr(PasswordHasher, "verify_pin", no_hashing)
+    response = test_client.post(
+        "/api/auth/step-up", json={"pin": "1234"}, headers=headers
+    )
+
+    assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+    assert int(response.headers["Retry-After"]) >= 1
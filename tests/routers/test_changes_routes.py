@@ -0,0 +1,98 @@
+"""Tests for the delta sync route."""
+
+from __future__ import annotations
+
+import pytest
+from fastapi import status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from tests.setup_memory_records import setup_test_chores, setup_test_people
+
+
+@pytest.mark.asyncio
+async def test_changes_returns_only_rows_written_after_cursor(
+    test_client,
+    async_session: AsyncSession,
+) -> None:
+    """Test a poll returns changed rows, tombstones and a new cursor.
+
+    Args:
+        test_client: FastAPI test client.
+        async_session: Database session.
+    """
+    people = await setup_test_people(async_session, 2)
+    chores = await setup_test_chores(async_session, 3)
+    chores[0].person_id = people[0].id
+    await async_session.commit()
+    token = test_client.post(
+        "/api/auth/login",
+        json={"login_name": people[0].login_name, "pin": "1234"},
+    ).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+
+    snapshot = test_client.get("/api/changes", headers=headers).json()
+    idle = test_client.get(
+        "/api/changes",
+        params={"since": snapshot["cursor"]},
+        headers=headers,
+    ).json()
+    test_client.post(f"/api/chores/{chores[0].id}/complete", headers=headers)
+    step_up = test_client.post(
+        "/api/auth/step-up", json={"pin": "1234"}, headers=headers
+    ).json()["step_up_token"]
+    test_client.delete(
+        f"/api/chores/{chores[2].id}",
+        headers={"Authorization": f"Bearer {step_up}"},
+    )
+    delta = test_client.get(
+        "/api/changes",
+        params={"since": snapshot["cursor"]},
+        headers=headers,
+    ).json()
+
+    assert snapshot["full"] is True
+    assert len(snapshot["chores"]) == 3
+    assert len(snapshot["people"]) == 2
+    assert idle == {
+        "full": False,
+        "chores": [],
+        "people": [],
+        "deleted_chores": [],
+        "deleted_people": [],
+        "cursor": snapshot["cursor"],
+    }
+    assert [chore["id"] for chore in delta["chores"]] == [chores[0].id]
+    assert delta["chores"][0]["person_id"] == people[1].id
+    assert delta["people"] == []
+    assert delta["deleted_chores"] == [chores[2].id]
+    assert delta["cursor"] != snapshot["cursor"]
+
+
+@pytest.mark.asyncio
+async def test_changes_rejects_invalid_cursor(
+    test_client,
+    async_session: AsyncSession,
+) -> None:
+    """Test a malformed or future cursor is a 400.
+
+    Args:
+        test_client: FastAPI test client.
+        async_session: Database session.
+    """
+    people = await setup_test_people(async_session, 1)
+    await async_session.commit()
+    token = test_client.post(
+        "/api/auth/login",
+        json={"login_name": people[0].login_name, "pin": "1234"},
+    ).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+
+    garbage = test_client.get(
+        "/api/changes", params={"since": "garbage"}, headers=headers
+    )
+    future = test_client.get(
+        "/api/changes", params={"since": "WzEwMF0"}, headers=headers
+    )
+
+    assert garbage.status_code == status.HTTP_400_BAD_REQUEST
+    assert future.status_code == status.HTTP_400_BAD_REQUEST
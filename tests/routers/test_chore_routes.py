@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+from datetime import datetime
+
 import pytest
 from fastapi import status
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from tests.setup_memory_records import setup_test_chores, setup_test_people
@@ -41,7 +44,8 @@ async def test_list_chores_authenticated(
 
     assert response.status_code == status.HTTP_200_OK
     data = response.json()
-    assert len(data) >= 3
+    assert len(data["chores"]) >= 3
+    assert data["next_cursor"] is None
 
 
 @pytest.mark.asyncio
@@ -164,6 +168,73 @@ async def test_create_chore_admin(
     assert data["description"] == "This is a test chore with content"
 
 
+@pytest.mark.asyncio
+async def test_create_and_edit_chore_persist_recurrence(
+    test_client,
+    async_session: AsyncSession,
+) -> None:
+    """Test recurrence fields are stored and drive next_due_at.
+
+    Args:
+        test_client: FastAPI test client.
+        async_session: Database session.
+    """
+    await setup_test_people(async_session, 1)
+    await async_session.commit()
+    login_response = test_client.post(
+        "/api/auth/login",
+        json={"login_name": "john", "pin": "1234"},
+    )
+    headers = {
+        "Authorization": f"Bearer {login_response.json()['access_token']}"
+    }
+    today = datetime.utcnow().date()
+
+    created = test_client.post(
+        "/api/chores/",
+        headers=headers,
+        json={
+            "name": "Take out bins",
+            "description": "Both bins to the kerb",
+            "recurrence": "weekly",
+            "recurrence_day": today.weekday(),
+        },
+    ).json()
+    fetched = test_client.get(
+        f"/api/chores/{created['id']}",
+        headers=headers,
+    ).json()
+    edited = test_client.put(
+        f"/api/chores/{created['id']}",
+        headers=headers,
+        json={"recurrence": "none"},
+    ).json()
+    bad_day = test_client.put(
+        f"/api/chores/{created['id']}",
+        headers=headers,
+        json={"recurrence": "weekly", "recurrence_day": 7},
+    )
+    bad_create = test_client.post(
+        "/api/chores/",
+        headers=headers,
+        json={
+            "name": "Water plants",
+            "description": "All the indoor plants",
+            "recurrence": "daily",
+            "recurrence_day": 3,
+        },
+    )
+
+    assert fetched["recurrence"] == "weekly"
+    assert fetched["recurrence_day"] == today.weekday()
+    assert fetched["next_due_at"] == f"{today.isoformat()}T00:00:00"
+    assert edited["recurrence"] == "none"
+    assert edited["recurrence_day"] is None
+    assert edited["next_due_at"] is None
+    assert bad_day.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    assert bad_create.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
 @pytest.mark.asyncio
 async def test_create_chore_non_admin(
     test_client,
@@ -235,3 +306,345 @@ async def test_complete_chore(
     data = response.json()
     assert data["last_completed_id"] == person.id
     assert data["last_completed_date"] is not None
+
+
+@pytest.mark.asyncio
+async def test_completion_history_routes(
+    test_client,
+    async_session: AsyncSession,
+) -> None:
+    """Test each completion shows up in the chore and person history.
+
+    Args:
+        test_client: FastAPI test client.
+        async_session: Database session.
+    """
+    people = await setup_test_people(async_session, 1)
+    chores = await setup_test_chores(async_session, 1)
+    await async_session.commit()
+    person_id = people[0].id
+    chore_id = chores[0].id
+    login_response = test_client.post(
+        "/api/auth/login",
+        json={"login_name": people[0].login_name, "pin": "1234"},
+    )
+    headers = {
+        "Authorization": f"Bearer {login_response.json()['access_token']}"
+    }
+
+    for _ in range(3):
+        test_client.post(f"/api/chores/{chore_id}/complete", headers=headers)
+    first = test_client.get(
+        f"/api/chores/{chore_id}/history?limit=2",
+        headers=headers,
+    ).json()
+    rest = test_client.get(
+        f"/api/chores/{chore_id}/history?limit=2"
+        f"&cursor={first['next_cursor']}",
+        headers=headers,
+    ).json()
+    by_person = test_client.get(
+        f"/api/people/{person_id}/history",
+        headers=headers,
+    ).json()
+    bad_cursor = test_client.get(
+        f"/api/chores/{chore_id}/history?cursor=bm9wZQ",
+        headers=headers,
+    )
+
+    ids = [c["id"] for c in first["completions"] + rest["completions"]]
+    assert len(ids) == 3
+    assert ids == sorted(ids, reverse=True)
+    assert rest["next_cursor"] is None
+    assert [c["id"] for c in by_person["completions"]] == ids
+    assert bad_cursor.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.asyncio
+async def test_list_due_chores_pages_most_overdue_first(
+    test_client,
+    async_session: AsyncSession,
+) -> None:
+    """Test the due listing filters, orders and pages by next_due_at.
+
+    Args:
+        test_client: FastAPI test client.
+        async_session: Database session.
+    """
+    people = await setup_test_people(async_session, 2)
+    chores = await setup_test_chores(async_session, 3)
+    due = [datetime(2026, 3, 3), datetime(2026, 3, 1), datetime(2026, 3, 9)]
+    for chore, due_at in zip(chores, due, strict=True):
+        chore.next_due_at = due_at
+        chore.person_id = people[0].id
+    chores[1].person_id = people[1].id
+    await async_session.commit()
+    ids = [chore.id for chore in chores]
+    login_response = test_client.post(
+        "/api/auth/login",
+        json={"login_name": "john", "pin": "1234"},
+    )
+    headers = {
+        "Authorization": f"Bearer {login_response.json()['access_token']}"
+    }
+
+    first = test_client.get(
+        "/api/chores/due?before=2026-03-05T00:00:00&limit=1",
+        headers=headers,
+    ).json()
+    rest = test_client.get(
+        "/api/chores/due?before=2026-03-05T00:00:00&limit=1"
+        f"&cursor={first['next_cursor']}",
+        headers=headers,
+    ).json()
+    mine = test_client.get(
+        f"/api/chores/due?before=2026-03-05T01:00:00%2B01:00"
+        f"&assignee={people[0].id}",
+        headers=headers,
+    ).json()
+    everything = test_client.get("/api/chores/due", headers=headers).json()
+
+    assert [c["id"] for c in first["chores"]] == [ids[1]]
+    assert [c["id"] for c in rest["chores"]] == [ids[0]]
+    assert rest["next_cursor"] is None
+    assert [c["id"] for c in mine["chores"]] == [ids[0]]
+    assert [c["id"] for c in everything["chores"]] == [ids[1], ids[0], ids[2]]
+
+
+@pytest.mark.asyncio
+async def test_complete_chore_not_found(
+    test_client,
+    async_session: AsyncSession,
+) -> None:
+    """Test completing a missing chore returns 404.
+
+    Args:
+        test_client: FastAPI test client.
+        async_session: Database session.
+    """
+    people = await setup_test_people(async_session, 1)
+    await async_session.commit()
+    token = test_client.post(
+        "/api/auth/login",
+        json={"login_name": people[0].login_name, "pin": "1234"},
+    ).json()["access_token"]
+
+    response = test_client.post(
+        "/api/chores/999/complete",
+        headers={"Authorization": f"Bearer {token}"},
+    )
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.asyncio
+async def test_list_chores_pages_with_cursor(
+    test_client,
+    async_session: AsyncSession,
+) -> None:
+    """Test walking the chore listing with next-cursor tokens.
+
+    Args:
+        test_client: FastAPI test client.
+        async_session: Database session.
+    """
+    people = await setup_test_people(async_session, 1)
+    chores = await setup_test_chores(async_session, 5)
+    await async_session.commit()
+    token = test_client.post(
+        "/api/auth/login",
+        json={"login_name": people[0].login_name, "pin": "1234"},
+    ).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+
+    seen = []
+    params = {"limit": 2}
+    while True:
+        page = test_client.get(
+            "/api/chores/", params=params, headers=headers
+        ).json()
+        seen.extend(chore["id"] for chore in page["chores"])
+        if page["next_cursor"] is None:
+            break
+        params = {"limit": 2, "cursor": page["next_cursor"]}
+
+    assert seen == [chore.id for chore in chores]
+    response = test_client.get(
+        "/api/chores/", params={"cursor": "not-a-cursor"}, headers=headers
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.asyncio
+async def test_list_chores_filters(
+    test_client,
+    async_session: AsyncSession,
+) -> None:
+    """Test the assignee, unassigned and completed_since filters.
+
+    Args:
+        test_client: FastAPI test client.
+        async_session: Database session.
+    """
+    people = await setup_test_people(async_session, 2)
+    chores = await setup_test_chores(async_session, 4)
+    chores[0].person_id = people[0].id
+    chores[1].person_id = people[1].id
+    chores[2].last_completed_date = datetime(2026, 1, 2)
+    chores[3].last_completed_date = datetime(2026, 1, 1)
+    await async_session.commit()
+    token = test_client.post(
+        "/api/auth/login",
+        json={"login_name": people[0].login_name, "pin": "1234"},
+    ).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+
+    def ids(**params) -> list[int]:
+        page = test_client.get(
+            "/api/chores/", params=params, headers=headers
+        ).json()
+        return [chore["id"] for chore in page["chores"]]
+
+    assert ids(assignee=people[1].id) == [chores[1].id]
+    assert ids(unassigned=True) == [chores[2].id, chores[3].id]
+    # Completion filters are ordered by completion time
+    assert ids(completed_since="2025-12-31T00:00:00") == [
+        chores[3].id,
+        chores[2].id,
+    ]
+    assert ids(completed_since="2026-01-02T00:00:00") == [chores[2].id]
+    response = test_client.get(
+        "/api/chores/",
+        params={"assignee": people[0].id, "unassigned": True},
+        headers=headers,
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.asyncio
+async def test_get_chore_expands_assignee_and_last_completer(
+    test_client,
+    async_session: AsyncSession,
+) -> None:
+    """Test ?expand= embeds people only when asked for.
+
+    Args:
+        test_client: FastAPI test client.
+        async_session: Database session.
+    """
+    people = await setup_test_people(async_session, 2)
+    chores = await setup_test_chores(async_session, 1)
+    chores[0].person_id = people[1].id
+    chores[0].last_completed_id = people[0].id
+    await async_session.commit()
+    async_session.expunge_all()
+    token = test_client.post(
+        "/api/auth/login",
+        json={"login_name": people[0].login_name, "pin": "1234"},
+    ).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    url = f"/api/chores/{chores[0].id}"
+
+    plain = test_client.get(url, headers=headers).json()
+    expanded = test_client.get(
+        url,
+        params={"expand": "assignee,last_completer"},
+        headers=headers,
+    ).json()
+    bad = test_client.get(url, params={"expand": "chores"}, headers=headers)
+
+    assert plain["assignee"] is None
+    assert plain["last_completer"] is None
+    assert expanded["assignee"]["login_name"] == "jane"
+    assert expanded["last_completer"]["login_name"] == "john"
+    assert bad.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.asyncio
+async def test_list_chores_answers_conditional_get_with_304(
+    test_client,
+    async_session: AsyncSession,
+) -> None:
+    """Test a matching If-None-Match gets 304 until the data changes.
+
+    Args:
+        test_client: FastAPI test client.
+        async_session: Database session.
+    """
+    people = await setup_test_people(async_session, 2)
+    chores = await setup_test_chores(async_session, 1)
+    chores[0].person_id = people[0].id
+    await async_session.commit()
+    token = test_client.post(
+        "/api/auth/login",
+        json={"login_name": people[0].login_name, "pin": "1234"},
+    ).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+
+    first = test_client.get("/api/chores/", headers=headers)
+    etag = first.headers["ETag"]
+    repeat = test_client.get(
+        "/api/chores/", headers={**headers, "If-None-Match": etag}
+    )
+    other_query = test_client.get(
+        "/api/chores/",
+        params={"limit": 10},
+        headers={**headers, "If-None-Match": etag},
+    )
+    test_client.post(f"/api/chores/{chores[0].id}/complete", headers=headers)
+    after_write = test_client.get(
+        "/api/chores/", headers={**headers, "If-None-Match": etag}
+    )
+
+    assert first.status_code == status.HTTP_200_OK
+    assert repeat.status_code == status.HTTP_304_NOT_MODIFIED
+    assert repeat.content == b""
+    assert repeat.headers["ETag"] == etag
+    assert other_query.status_code == status.HTTP_200_OK
+    assert other_query.headers["ETag"] != etag
+    assert after_write.status_code == status.HTTP_200_OK
+    assert after_write.headers["ETag"] != etag
+
+
+@pytest.mark.asyncio
+async def test_complete_chore_request_statement_count(
+    test_client,
+    async_session: AsyncSession,
+) -> None:
+    """Test a completion request runs a fixed, small set of statements.
+
+    Args:
+        test_client: FastAPI test client.
+        async_session: Database session.
+    """
+    people = await setup_test_people(async_session, 2)
+    chores = await setup_test_chores(async_session, 1)
+    chores[0].person_id = people[0].id
+    await async_session.commit()
+    token = test_client.post(
+        "/api/auth/login",
+        json={"login_name": people[0].login_name, "pin": "1234"},
+    ).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    # Let the token check pull revocations before counting
+    test_client.get("/api/chores/", headers=headers)
+    statements = []
+
+    def count(conn, cursor, statement, *args) -> None:
+        statements.append(" ".join(statement.split()[:2]).upper())
+
+    engine = async_session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", count)
+    try:
+        response = test_client.post(
+            f"/api/chores/{chores[0].id}/complete",
+            headers=headers,
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", count)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["person_id"] == people[1].id
+    # The version bump returns the version; the chore UPDATE stamps it and
+    # its triggers write the history and rollups
+    assert statements == ["UPDATE DATA_VERSION", "UPDATE CHORES"]
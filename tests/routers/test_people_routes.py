@@ -7,6 +7,7 @@ from fastapi import status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from choreboss.models.chore import Chore
+from choreboss.services import PeopleService
 from tests.setup_memory_records import setup_test_people, setup_test_chores
 
 
@@ -41,7 +42,8 @@ async def test_list_people_authenticated(
 
     assert response.status_code == status.HTTP_200_OK
     data = response.json()
-    assert len(data) >= 2
+    assert len(data["people"]) >= 2
+    assert data["next_cursor"] is None
 
 
 @pytest.mark.asyncio
@@ -111,10 +113,15 @@ async def test_delete_person_unassigns_chores(
         json={"login_name": admin.login_name, "pin": "1234"},
     )
     token = login_response.json()["access_token"]
+    step_up = test_client.post(
+        "/api/auth/step-up",
+        json={"pin": "1234"},
+        headers={"Authorization": f"Bearer {token}"},
+    ).json()["step_up_token"]
 
     response = test_client.delete(
         f"/api/people/{admin.id}",
-        headers={"Authorization": f"Bearer {token}"},
+        headers={"Authorization": f"Bearer {step_up}"},
     )
 
     assert response.status_code == status.HTTP_204_NO_CONTENT
@@ -296,3 +303,178 @@ async def test_create_person_non_admin(
     )
 
     assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+@pytest.mark.asyncio
+async def test_demoting_admin_revokes_their_tokens(
+    test_client,
+    async_session: AsyncSession,
+) -> None:
+    """Test removing admin rights invalidates tokens claiming them.
+
+    Args:
+        test_client: FastAPI test client.
+        async_session: Database session.
+    """
+    people = await setup_test_people(async_session, 1)
+    await async_session.commit()
+    admin = people[0]
+    token = test_client.post(
+        "/api/auth/login",
+        json={"login_name": admin.login_name, "pin": "1234"},
+    ).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+
+    response = test_client.put(
+        f"/api/people/{admin.id}",
+        json={"is_admin": False},
+        headers=headers,
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    response = test_client.get("/api/people/", headers=headers)
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.asyncio
+async def test_update_sequence_swaps_positions(
+    test_client,
+    async_session: AsyncSession,
+) -> None:
+    """Test swapping two people's positions reorders the rotation.
+
+    Args:
+        test_client: FastAPI test client.
+        async_session: Database session.
+    """
+    people = await setup_test_people(async_session, 3)
+    await async_session.commit()
+    admin, jane, mary = people
+    token = test_client.post(
+        "/api/auth/login",
+        json={"login_name": admin.login_name, "pin": "1234"},
+    ).json()["access_token"]
+
+    headers = {"Authorization": f"Bearer {token}"}
+
+    response = test_client.post(
+        "/api/people/sequence",
+        json=[
+            {"id": jane.id, "sequence": 3},
+            {"id": mary.id, "sequence": 2},
+        ],
+        headers=headers,
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    listed = test_client.get("/api/people/", headers=headers).json()
+    assert [p["id"] for p in listed["people"]] == [
+        admin.id,
+        mary.id,
+        jane.id,
+    ]
+    assert [p["sequence_num"] for p in listed["people"]] == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_list_people_pages_in_rotation_order(
+    test_client,
+    async_session: AsyncSession,
+) -> None:
+    """Test people pages follow the rotation and end without a cursor.
+
+    Args:
+        test_client: FastAPI test client.
+        async_session: Database session.
+    """
+    people = await setup_test_people(async_session, 3)
+    await async_session.commit()
+    token = test_client.post(
+        "/api/auth/login",
+        json={"login_name": people[0].login_name, "pin": "1234"},
+    ).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+
+    first = test_client.get(
+        "/api/people/", params={"limit": 2}, headers=headers
+    ).json()
+    second = test_client.get(
+        "/api/people/",
+        params={"limit": 2, "cursor": first["next_cursor"]},
+        headers=headers,
+    ).json()
+
+    assert [p["id"] for p in first["people"]] == [
+        people[0].id,
+        people[1].id,
+    ]
+    assert [p["id"] for p in second["people"]] == [people[2].id]
+    assert second["next_cursor"] is None
+
+
+@pytest.mark.asyncio
+async def test_list_people_expands_chores(
+    test_client,
+    async_session: AsyncSession,
+) -> None:
+    """Test ?expand=chores embeds each person's assigned chores.
+
+    Args:
+        test_client: FastAPI test client.
+        async_session: Database session.
+    """
+    people = await setup_test_people(async_session, 2)
+    chores = await setup_test_chores(async_session, 1)
+    chores[0].person_id = people[1].id
+    await async_session.commit()
+    async_session.expunge_all()
+    token = test_client.post(
+        "/api/auth/login",
+        json={"login_name": people[0].login_name, "pin": "1234"},
+    ).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+
+    plain = test_client.get("/api/people/", headers=headers).json()
+    expanded = test_client.get(
+        "/api/people/", params={"expand": "chores"}, headers=headers
+    ).json()
+
+    assert [p["assigned_chores"] for p in plain["people"]] == [None, None]
+    assert [
+        [chore["id"] for chore in p["assigned_chores"]]
+        for p in expanded["people"]
+    ] == [[], [chores[0].id]]
+
+
+@pytest.mark.asyncio
+async def test_get_person_304_skips_loading(
+    test_client,
+    async_session: AsyncSession,
+    monkeypatch,
+) -> None:
+    """Test a conditional hit answers before the person is loaded.
+
+    Args:
+        test_client: FastAPI test client.
+        async_session: Database session.
+        monkeypatch: Pytest monkeypatch fixture.
+    """
+    people = await setup_test_people(async_session, 1)
+    await async_session.commit()
+    token = test_client.post(
+        "/api/auth/login",
+        json={"login_name": people[0].login_name, "pin": "1234"},
+    ).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    url = f"/api/people/{people[0].id}"
+    etag = test_client.get(url, headers=headers).headers["ETag"]
+
+    async def fail_load(*args, **kwargs):
+        raise AssertionError("person loaded for a 304")
+
+    monkeypatch.setattr(PeopleService, "get_person_by_id", fail_load)
+    response = test_client.get(
+        url, headers={**headers, "If-None-Match": f"W/{etag}"}
+    )
+
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
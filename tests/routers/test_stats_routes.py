@@ -0,0 +1,74 @@
+"""Tests for the completion stats routes."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+import pytest
+from fastapi import status
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from tests.setup_memory_records import setup_test_chores, setup_test_people
+
+
+@pytest.mark.asyncio
+async def test_stats_reads_rollups_kept_by_completions(
+    test_client,
+    async_session: AsyncSession,
+) -> None:
+    """Test completions show up in /api/stats without scanning history.
+
+    Args:
+        test_client: FastAPI test client.
+        async_session: Database session.
+    """
+    people = await setup_test_people(async_session, 2)
+    chores = await setup_test_chores(async_session, 1)
+    await async_session.commit()
+    person_ids = [person.id for person in people]
+    chore_id = chores[0].id
+    headers = []
+    for login_name, pin in (("john", "1234"), ("jane", "5678")):
+        login = test_client.post(
+            "/api/auth/login",
+            json={"login_name": login_name, "pin": pin},
+        )
+        token = login.json()["access_token"]
+        headers.append({"Authorization": f"Bearer {token}"})
+    for who in (1, 0, 1):
+        test_client.post(
+            f"/api/chores/{chore_id}/complete",
+            headers=headers[who],
+        )
+    statements = []
+
+    def record(conn, cursor, statement, *args) -> None:
+        statements.append(statement)
+
+    engine = async_session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        week = test_client.get("/api/stats", headers=headers[0])
+        day = test_client.get("/api/stats?period=day", headers=headers[0])
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    empty = test_client.get(
+        "/api/stats?period=day&on=2000-01-01",
+        headers=headers[0],
+    )
+    bad = test_client.get("/api/stats?period=year", headers=headers[0])
+
+    today = datetime.utcnow().date()
+    assert week.status_code == status.HTTP_200_OK
+    assert week.json()["period"] == "week"
+    assert week.json()["start"] <= today.isoformat() <= week.json()["end"]
+    expected = [
+        {"person_id": person_ids[1], "completions": 2},
+        {"person_id": person_ids[0], "completions": 1},
+    ]
+    assert week.json()["people"] == expected
+    assert day.json()["people"] == expected
+    assert not any("chore_completions" in sql for sql in statements)
+    assert empty.json()["people"] == []
+    assert bad.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
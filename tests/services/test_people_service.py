@@ -1,3 +1,4 @@
+import asyncio
 from datetime import datetime
 import unittest
 from sqlalchemy import create_engine
@@ -43,7 +44,7 @@ class TestPeopleService(unittest.TestCase):
             new_person.birthday,
             datetime.strptime('2002-01-01', '%Y-%m-%d').date()
         )
-        self.assertEqual(new_person.verify_pin('234567'), True)
+        self.assertEqual(asyncio.run(new_person.verify_pin('234567')), True)
         self.assertTrue(new_person.is_admin)
         self.assertTrue(new_person.sequence_num, 4)
 
@@ -159,7 +160,7 @@ class TestPeopleService(unittest.TestCase):
         person.first_name = 'Johnny'
         person.last_name = 'Doer'
         person.birthday = datetime.strptime('2002-01-01', '%Y-%m-%d').date()
-        person.set_pin('234567')
+        asyncio.run(person.set_pin('234567'))
         person.is_admin = False
         self.people_service.update_person(person)
 
@@ -170,7 +171,7 @@ class TestPeopleService(unittest.TestCase):
             updated_person.birthday,
             datetime.strptime('2002-01-01', '%Y-%m-%d').date()
         )
-        self.assertEqual(updated_person.verify_pin('234567'), True)
+        self.assertEqual(asyncio.run(updated_person.verify_pin('234567')), True)
         self.assertFalse(updated_person.is_admin)
 
     def test_update_sequence(self):
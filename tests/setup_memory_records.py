@@ -57,7 +57,7 @@ async def setup_test_people(
 
     for i in range(min(count, 3)):
         person = People(**test_data[i])
-        person.set_pin(test_data[i]["pin"])
+        await person.set_pin(test_data[i]["pin"])
         session.add(person)
         people.append(person)
 
@@ -0,0 +1,76 @@
+"""Tests for the load heap and the least-loaded assignment policy."""
+
+from __future__ import annotations
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from choreboss.load_heap import LoadHeap
+from choreboss.repositories import ChoreRepository, PeopleRepository
+from choreboss.services import ChoreService, LeastLoadedPolicy
+from tests.setup_memory_records import setup_test_chores, setup_test_people
+
+
+def test_load_heap_tracks_moves_and_breaks_ties_by_rank() -> None:
+    """Test loads follow reassignments, with rank deciding ties."""
+    heap = LoadHeap(
+        [(1, 10), (2, 20), (3, 30)],
+        [(100, 1), (101, 1), (102, 2), (103, None)],
+    )
+
+    assert heap.peek() == 3
+    heap.assign(103, 3)
+    assert heap.peek() == 2
+    heap.assign(100, 2)
+    heap.discard_chore(101)
+
+    assert [heap.load_of(i) for i in (1, 2, 3)] == [0, 2, 1]
+    assert heap.peek() == 1
+    assert heap.peek(exclude=1) == 3
+    heap.set_person(3, 5)
+    heap.discard_person(1)
+    assert len(heap) == 2
+    assert heap.peek() == 3
+    assert LoadHeap([(1, 10)]).peek(exclude=1) is None
+
+
+@pytest.mark.asyncio
+async def test_least_loaded_policy_hands_chores_to_the_idlest(
+    async_session: AsyncSession,
+) -> None:
+    """Test completions go to the least loaded person, not the next one.
+
+    Args:
+        async_session: Database session.
+    """
+    people = await setup_test_people(async_session, 3)
+    chores = await setup_test_chores(async_session, 4)
+    for chore, person in zip(chores, [0, 0, 0, 1], strict=True):
+        chore.person_id = people[person].id
+    await async_session.commit()
+    heap = LoadHeap()
+    service = ChoreService(
+        ChoreRepository(async_session),
+        PeopleRepository(async_session),
+        assignment_policy=LeastLoadedPolicy(heap),
+    )
+
+    first = await service.complete_chore(chores[0].id, people[0].id)
+    await async_session.commit()
+    second = await service.complete_chore(chores[1].id, people[0].id)
+    await async_session.commit()
+    await service.delete_chore(chores[3].id)
+    await async_session.commit()
+    third = await service.complete_chore(chores[2].id, people[1].id)
+    await async_session.commit()
+
+    # Loads after the first two moves are 1, 1, 1; rank breaks the tie
+    assert first.person_id == people[2].id
+    assert second.person_id == people[1].id
+    # The deleted chore is replayed from its tombstone
+    assert third.person_id == people[1].id
+    await service.assignment_policy.get_heap(
+        service.chore_repository,
+        service.people_repository,
+    )
+    assert [heap.load_of(person.id) for person in people] == [0, 2, 1]
@@ -23,3 +23,65 @@ def test_index_accepts_raw_list_payloads(monkeypatch) -> None:
 
     assert response.status_code == 200
     assert response.get_data(as_text=True) == "ok"
+
+
+def test_index_follows_next_cursor(monkeypatch) -> None:
+    client = app.test_client()
+    rendered = {}
+    chore_pages = {
+        None: {"chores": [{"id": 1}], "next_cursor": "page2"},
+        "page2": {"chores": [{"id": 2}], "next_cursor": None},
+    }
+
+    def fake_api_call(method, endpoint, data=None, params=None):
+        if endpoint == "/chores/":
+            return 200, chore_pages[(params or {}).get("cursor")]
+        if endpoint == "/people/":
+            return 200, {"people": [{"id": 1}], "next_cursor": None}
+        raise AssertionError(f"Unexpected endpoint: {endpoint}")
+
+    def fake_render(template, **context):
+        rendered.update(context)
+        return "ok"
+
+    monkeypatch.setattr("flask_bridge.api_call", fake_api_call)
+    monkeypatch.setattr("flask_bridge.render_template", fake_render)
+
+    with client.session_transaction() as sess:
+        sess["token"] = "fake-token"
+
+    response = client.get("/")
+
+    assert response.status_code == 200
+    assert [chore["id"] for chore in rendered["chores"]] == [1, 2]
+    assert [person["id"] for person in rendered["people"]] == [1]
+
+
+def test_chore_detail_embeds_people_in_one_call(monkeypatch) -> None:
+    client = app.test_client()
+    calls = []
+    rendered = {}
+
+    def fake_api_call(method, endpoint, data=None, params=None):
+        calls.append((endpoint, params))
+        return 200, {
+            "id": 3,
+            "assignee": {"id": 1, "first_name": "Toan"},
+            "last_completer": None,
+        }
+
+    def fake_render(template, **context):
+        rendered.update(context)
+        return "ok"
+
+    monkeypatch.setattr("flask_bridge.api_call", fake_api_call)
+    monkeypatch.setattr("flask_bridge.render_template", fake_render)
+
+    with client.session_transaction() as sess:
+        sess["token"] = "fake-token"
+
+    response = client.get("/chores/3")
+
+    assert response.status_code == 200
+    assert calls == [("/chores/3", {"expand": "assignee,last_completer"})]
+    assert rendered["chore"]["person_id_foreign_key"]["first_name"] == "Toan"
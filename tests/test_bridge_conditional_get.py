@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import flask_bridge
+from flask_bridge import api_call, app
+
+
+class FakeResponse:
+    def __init__(self, status_code, body=None, etag=None):
+        self.status_code = status_code
+        self.text = '' if body is None else 'json'
+        self._body = body
+        self.headers = {'ETag': etag} if etag else {}
+
+    def json(self):
+        return self._body
+
+
+def test_api_call_revalidates_cached_get(monkeypatch) -> None:
+    sent = []
+    responses = [
+        FakeResponse(200, {'people': [{'id': 1}], 'next_cursor': None}, '"1-a"'),
+        FakeResponse(304, etag='"1-a"'),
+    ]
+
+    def fake_get(url, headers=None, params=None, timeout=None):
+        sent.append(dict(headers))
+        return responses.pop(0)
+
+    monkeypatch.setattr(flask_bridge, '_response_cache', flask_bridge.OrderedDict())
+    monkeypatch.setattr('flask_bridge.requests.get', fake_get)
+
+    with app.test_request_context():
+        first = api_call('GET', '/people/', params={'limit': 50})
+        first[1]['people'].append({'id': 99})
+        second = api_call('GET', '/people/', params={'limit': 50})
+
+    assert 'If-None-Match' not in sent[0]
+    assert sent[1]['If-None-Match'] == '"1-a"'
+    assert second == (200, {'people': [{'id': 1}], 'next_cursor': None})
@@ -7,9 +7,12 @@ def test_verify_pin_allows_admin_delete_context(monkeypatch) -> None:
     client = app.test_client()
 
     def fake_api_call(method, endpoint, data=None, params=None):
-        if method == 'POST' and endpoint == '/auth/login':
-            assert data == {'login_name': 'admin', 'pin': '1111'}
+        if method == 'POST' and endpoint == '/auth/step-up':
+            assert data == {'pin': '1111'}
             return 200, {
+                'step_up_token': 'elevated-token',
+                'expires_in': 300,
+                'scope': 'step_up',
                 'access_token': 'fresh-token',
                 'token_type': 'bearer',
                 'person_id': 1,
@@ -31,13 +34,78 @@ def test_verify_pin_allows_admin_delete_context(monkeypatch) -> None:
         assert sess['token'] == 'fresh-token'
         assert sess['person_id'] == 1
         assert sess['is_admin'] is True
+        assert sess['step_up_token'] == 'elevated-token'
+
+
+def test_verify_pin_skips_backend_inside_step_up_window(monkeypatch) -> None:
+    client = app.test_client()
+    calls = []
+
+    def fake_api_call(method, endpoint, data=None, params=None, step_up=False):
+        calls.append((method, endpoint))
+        return 200, {
+            'step_up_token': 'elevated-token',
+            'expires_in': 300,
+            'scope': 'step_up',
+            'access_token': 'fresh-token',
+            'token_type': 'bearer',
+            'person_id': 1,
+            'is_admin': True,
+        }
+
+    monkeypatch.setattr('flask_bridge.api_call', fake_api_call)
+
+    with client.session_transaction() as sess:
+        sess['token'] = 'token'
+        sess['login_name'] = 'admin'
+
+    for context in ('edit_chore', 'delete_chore', 'add_person'):
+        response = client.post('/verify_pin', json={'context': context, 'pin': '1111'})
+        assert response.get_json() == {'status': 'success'}
+
+    assert calls == [('POST', '/auth/step-up')]
+
+
+def test_verify_pin_rechecks_a_different_pin_inside_window(monkeypatch) -> None:
+    client = app.test_client()
+    pins = []
+
+    def fake_api_call(method, endpoint, data=None, params=None, step_up=False):
+        pins.append(data['pin'])
+        if data['pin'] != '1111':
+            return 401, {'detail': 'Invalid PIN'}
+        return 200, {
+            'step_up_token': 'elevated-token',
+            'expires_in': 300,
+            'scope': 'step_up',
+            'access_token': None,
+            'token_type': 'bearer',
+            'person_id': 1,
+            'is_admin': True,
+        }
+
+    monkeypatch.setattr('flask_bridge.api_call', fake_api_call)
+
+    with client.session_transaction() as sess:
+        sess['token'] = 'token'
+        sess['login_name'] = 'admin'
+
+    first = client.post('/verify_pin', json={'context': 'delete_chore', 'pin': '1111'})
+    wrong = client.post('/verify_pin', json={'context': 'delete_chore', 'pin': '2222'})
+
+    assert first.get_json() == {'status': 'success'}
+    assert wrong.get_json() == {'status': 'failure'}
+    assert pins == ['1111', '2222']
+    with client.session_transaction() as sess:
+        assert sess['token'] == 'token'
+        assert sess['step_up_token'] == 'elevated-token'
 
 
 def test_verify_pin_rejects_bad_pin(monkeypatch) -> None:
     client = app.test_client()
 
     def fake_api_call(method, endpoint, data=None, params=None):
-        if method == 'POST' and endpoint == '/auth/login':
+        if method == 'POST' and endpoint == '/auth/step-up':
             return 401, {'detail': 'Invalid PIN'}
         raise AssertionError(f'unexpected call: {method} {endpoint}')
 
@@ -56,8 +124,9 @@ def test_verify_pin_rejects_bad_pin(monkeypatch) -> None:
 def test_delete_chore_redirects_after_success(monkeypatch) -> None:
     client = app.test_client()
 
-    def fake_api_call(method, endpoint, data=None, params=None):
+    def fake_api_call(method, endpoint, data=None, params=None, step_up=False):
         if method == 'DELETE' and endpoint == '/chores/7':
+            assert step_up is True
             return 204, {}
         raise AssertionError(f'unexpected call: {method} {endpoint}')
 
@@ -0,0 +1,68 @@
+"""Tests for database engine configuration."""
+
+from __future__ import annotations
+
+import logging
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from api.dependencies.db import (
+    TimedQueuePool,
+    _engine_options,
+    install_statement_logger,
+    pool_wait_stats,
+)
+from choreboss.config import Settings
+
+
+def test_engine_options_follow_settings() -> None:
+    """Test pool and driver options come from settings, not debug."""
+    config = Settings(
+        debug=True,
+        database_url="postgresql+asyncpg://db/choreboss",
+        db_pool_size=3,
+        db_statement_cache_size=0,
+    )
+
+    options = _engine_options(config)
+
+    assert options["echo"] is False
+    assert options["poolclass"] is TimedQueuePool
+    assert options["pool_size"] == 3
+    assert options["connect_args"] == {"statement_cache_size": 0}
+
+
+def test_in_memory_sqlite_skips_pool_sizing() -> None:
+    """Test pool sizing is not applied to in-memory SQLite."""
+    options = _engine_options(
+        Settings(database_url="sqlite+aiosqlite:///:memory:")
+    )
+
+    assert "pool_size" not in options
+    assert "connect_args" not in options
+
+
+@pytest.mark.asyncio
+async def test_pool_wait_and_statement_logging(tmp_path, caplog) -> None:
+    """Test checkouts are timed and statements logged when enabled.
+
+    Args:
+        tmp_path: Temporary directory for the SQLite file.
+        caplog: Pytest log capture fixture.
+    """
+    url = f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}"
+    engine = create_async_engine(
+        url, **_engine_options(Settings(database_url=url))
+    )
+    install_statement_logger(engine.sync_engine, min_duration_ms=0)
+    checkouts = pool_wait_stats.count
+
+    with caplog.at_level(logging.INFO, logger="choreboss.sql"):
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+    await engine.dispose()
+
+    assert pool_wait_stats.count > checkouts
+    assert any("SELECT 1" in message for message in caplog.messages)
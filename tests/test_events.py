@@ -0,0 +1,193 @@
+"""Tests for the live event broker and stream."""
+
+from __future__ import annotations
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.routers.events import _sse_stream
+from choreboss.config import get_config
+from choreboss.events import EventBroker, broker, parse_event_id
+from choreboss.repositories import ChoreRepository, PeopleRepository
+from choreboss.services import ChoreService
+from tests.setup_memory_records import setup_test_chores, setup_test_people
+
+
+def test_broker_drops_subscriber_whose_queue_is_full() -> None:
+    """Test a slow consumer is dropped instead of blocking publishers."""
+    events = EventBroker(queue_size=2, history_size=10)
+    slow = events.subscribe()
+    fast = events.subscribe()
+
+    events.publish(1, [("chore.created", {"chore_id": 1})])
+    fast.queue.get_nowait()
+    events.publish(2, [("chore.created", {"chore_id": 2})])
+    fast.queue.get_nowait()
+    events.publish(3, [("chore.created", {"chore_id": 3})])
+
+    assert slow.dropped
+    assert not fast.dropped
+    assert fast.queue.get_nowait().id == "3-0"
+    assert len(events) == 1
+    assert events.dropped == 1
+
+
+def test_broker_replays_after_last_event_id() -> None:
+    """Test resumes replay missed events or ask for a resync."""
+    events = EventBroker(queue_size=10, history_size=3)
+    events.publish(1, [("chore.created", {}), ("chore.updated", {})])
+    events.publish(2, [("chore.deleted", {})])
+
+    resumed = events.subscribe(parse_event_id("1-0"))
+    events.publish(3, [("chore.created", {})])
+    still_covered = events.subscribe(parse_event_id("1-0"))
+    too_old = events.subscribe(parse_event_id("0-0"))
+
+    assert [resumed.queue.get_nowait().id for _ in range(3)] == [
+        "1-1",
+        "2-0",
+        "3-0",
+    ]
+    assert not resumed.resync
+    assert not still_covered.resync
+    assert too_old.resync
+
+
+def test_broker_resyncs_resumes_it_cannot_cover() -> None:
+    """Test resumes from before this worker's history ask for a resync."""
+    restarted = EventBroker(queue_size=10, history_size=10)
+    behind = restarted.subscribe(parse_event_id("4-0"), current_version=6)
+    current = restarted.subscribe(parse_event_id("6-1"), current_version=6)
+    restarted.publish(7, [("chore.created", {})])
+    before_history = restarted.subscribe(parse_event_id("6-1"))
+    covered = restarted.subscribe(parse_event_id("7-0"))
+
+    assert behind.resync
+    assert not current.resync
+    assert before_history.resync
+    assert not covered.resync
+
+
+def test_broker_tells_other_workers_commits_from_its_own() -> None:
+    """Test only versions this worker did not commit count as external."""
+    events = EventBroker(queue_size=10, history_size=10)
+
+    assert not events.note_version(5)
+    events.record_commit(6)
+    events.record_commit(7)
+    assert not events.note_version(7)
+    # Version 9 is ours but 8 is not, even though we are ahead of it
+    events.record_commit(9)
+    assert events.note_version(9)
+    assert not events.note_version(9)
+    events.publish(9, [("sync", {"version": 9})])
+    events.publish(9, [("sync", {"version": 9})])
+    assert [item.id for item in events._history] == ["9-0", "9-1"]
+
+
+@pytest.mark.asyncio
+async def test_events_are_published_only_on_commit(
+    async_session: AsyncSession,
+) -> None:
+    """Test completing a chore publishes after commit, not on rollback.
+
+    Args:
+        async_session: Database session.
+    """
+    people = await setup_test_people(async_session, 2)
+    chores = await setup_test_chores(async_session, 1)
+    chores[0].person_id = people[0].id
+    await async_session.commit()
+    chore_id, first_id, second_id = chores[0].id, people[0].id, people[1].id
+    service = ChoreService(
+        ChoreRepository(async_session),
+        PeopleRepository(async_session),
+    )
+    subscription = broker.subscribe()
+
+    await service.complete_chore(chore_id, first_id)
+    await async_session.rollback()
+    await service.complete_chore(chore_id, first_id)
+    assert subscription.queue.empty()
+    await async_session.commit()
+
+    item = subscription.queue.get_nowait()
+    assert item.type == "chore.completed"
+    assert item.data == {
+        "chore_id": chore_id,
+        "completed_by": first_id,
+        "person_id": second_id,
+    }
+    assert subscription.queue.empty()
+
+
+class _DisconnectingRequest:
+    """Request stub whose client leaves after the first heartbeat wait."""
+
+    async def is_disconnected(self) -> bool:
+        return True
+
+
+@pytest.mark.asyncio
+async def test_event_stream_resumes_from_last_event_id(monkeypatch) -> None:
+    """Test the SSE stream replays events after Last-Event-ID.
+
+    Args:
+        monkeypatch: Pytest monkeypatch fixture.
+    """
+    monkeypatch.setattr(get_config(), "events_heartbeat_seconds", 0.01)
+    broker.publish(4, [("chore.created", {"chore_id": 1})])
+    broker.publish(5, [("chore.deleted", {"chore_id": 1})])
+    subscription = broker.subscribe(parse_event_id("4-0"))
+
+    messages = [
+        message
+        async for message in _sse_stream(
+            _DisconnectingRequest(), subscription
+        )
+    ]
+
+    assert messages == [
+        "retry: 3000\n\n",
+        'id: 5-0\nevent: chore.deleted\ndata: {"chore_id":1}\n\n',
+    ]
+    assert len(broker) == 0
+
+
+@pytest.mark.asyncio
+async def test_event_stream_requires_token(test_client) -> None:
+    """Test the stream rejects unauthenticated clients.
+
+    Args:
+        test_client: FastAPI test client.
+    """
+    response = test_client.get("/api/events")
+
+    assert response.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_event_websocket_sends_json_events(
+    test_client,
+    async_session: AsyncSession,
+) -> None:
+    """Test the WebSocket variant replays events as JSON.
+
+    Args:
+        test_client: FastAPI test client.
+        async_session: Database session.
+    """
+    people = await setup_test_people(async_session, 1)
+    await async_session.commit()
+    token = test_client.post(
+        "/api/auth/login",
+        json={"login_name": people[0].login_name, "pin": "1234"},
+    ).json()["access_token"]
+    broker.publish(7, [("rotation.changed", {})])
+
+    with test_client.websocket_connect(
+        f"/api/events/ws?access_token={token}&last_event_id=6-0"
+    ) as websocket:
+        message = websocket.receive_json()
+
+    assert message == {"id": "7-0", "type": "rotation.changed", "data": {}}
@@ -0,0 +1,160 @@
+"""Tests for the versioned list query cache."""
+
+from __future__ import annotations
+
+import dataclasses
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from choreboss.cache import VersionedCache
+from choreboss.repositories import (
+    ChoreRepository,
+    ChoreRow,
+    get_data_version,
+    list_cache,
+)
+from tests.setup_memory_records import setup_test_chores, setup_test_people
+
+
+def test_cache_evicts_least_recently_used() -> None:
+    """Test the cache stays within its size bound."""
+    cache = VersionedCache(max_entries=2, ttl_seconds=60)
+    cache.put("a", 1, [1])
+    cache.put("b", 1, [2])
+    assert cache.get("a", 1) == [1]
+
+    cache.put("c", 1, [3])
+
+    assert cache.get("b", 1) is None
+    assert cache.get("a", 1) == [1]
+    assert cache.stats().evictions == 1
+
+
+def test_cache_drops_everything_on_newer_version() -> None:
+    """Test a newer version invalidates, and stale loads are not stored."""
+    cache = VersionedCache(max_entries=4, ttl_seconds=60)
+    cache.put("a", 1, [1])
+    cache.put("b", 1, [2])
+
+    assert cache.get("a", 2) is None
+    cache.put("b", 1, [2])
+
+    assert len(cache) == 0
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.invalidations) == (0, 1, 1)
+
+
+def test_cache_expires_entries() -> None:
+    """Test entries are not served past their TTL."""
+    cache = VersionedCache(max_entries=4, ttl_seconds=0)
+    cache.put("a", 1, [1])
+
+    assert cache.get("a", 1) is None
+
+
+@pytest.mark.asyncio
+async def test_commits_bump_version_and_rollbacks_do_not(
+    async_session: AsyncSession,
+) -> None:
+    """Test only committed chore and people writes bump the version.
+
+    Args:
+        async_session: Database session.
+    """
+    people = await setup_test_people(async_session, 2)
+    chores = await setup_test_chores(async_session, 1)
+    await async_session.commit()
+    committed = await get_data_version(async_session)
+    chore_id, person_id = chores[0].id, people[0].id
+
+    chores[0].person_id = person_id
+    await async_session.flush()
+    await async_session.rollback()
+    after_rollback = await get_data_version(async_session)
+    await async_session.commit()
+    after_read_only = await get_data_version(async_session)
+    await ChoreRepository(async_session).complete_and_rotate(
+        chore_id, person_id
+    )
+    await async_session.commit()
+
+    assert committed == 1
+    assert after_rollback == after_read_only == committed
+    assert await get_data_version(async_session) == committed + 1
+
+
+@pytest.mark.asyncio
+async def test_list_is_served_from_cache_until_another_session_writes(
+    async_session: AsyncSession,
+) -> None:
+    """Test a repeat listing runs only the version check.
+
+    Args:
+        async_session: Database session.
+    """
+    await setup_test_chores(async_session, 2)
+    await async_session.commit()
+    repo = ChoreRepository(async_session)
+    statements = []
+
+    def count(conn, cursor, statement, *args) -> None:
+        statements.append(statement)
+
+    engine = async_session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", count)
+    try:
+        first = await repo.list_chores(10)
+        statements.clear()
+        second = await repo.list_chores(10)
+    finally:
+        event.remove(engine, "before_cursor_execute", count)
+
+    assert second == first
+    assert len(statements) == 1
+    assert "data_version" in statements[0]
+
+    other_worker = sessionmaker(async_session.bind, class_=AsyncSession)
+    async with other_worker() as other:
+        chore = await ChoreRepository(other).get_chore_by_id(first[0].id)
+        chore.description = "Changed by another worker"
+        await other.commit()
+    async_session.expunge_all()
+
+    third = await repo.list_chores(10)
+
+    assert third[0].description == "Changed by another worker"
+    stats = list_cache.stats()
+    assert (stats.hits, stats.misses, stats.invalidations) == (1, 2, 1)
+
+
+@pytest.mark.asyncio
+async def test_cached_lists_hold_frozen_rows_not_orm_objects(
+    async_session: AsyncSession,
+) -> None:
+    """Test sessions sharing a cached list cannot change each other's rows.
+
+    Args:
+        async_session: Database session.
+    """
+    people = await setup_test_people(async_session, 1)
+    chores = await setup_test_chores(async_session, 1)
+    chores[0].person_id = people[0].id
+    await async_session.commit()
+    first = await ChoreRepository(async_session).list_chores(
+        10, expand={"assignee"}
+    )
+
+    other_worker = sessionmaker(async_session.bind, class_=AsyncSession)
+    async with other_worker() as other:
+        second = await ChoreRepository(other).list_chores(
+            10, expand={"assignee"}
+        )
+
+    assert second[0] is first[0]
+    assert second[0].assignee.id == people[0].id
+    assert isinstance(first[0], ChoreRow)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        first[0].description = "Changed through the cache"
@@ -0,0 +1,128 @@
+"""Tests for failed-login throttling."""
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from api.dependencies.login_throttle import (
+    LoginThrottle,
+    MemoryThrottleBackend,
+    SqliteThrottleBackend,
+)
+
+
+def _throttle(backend) -> LoginThrottle:
+    """Build a throttle with small allowances for testing."""
+    return LoginThrottle(
+        backend=backend,
+        free_attempts=2,
+        client_free_attempts=4,
+        base_delay=10,
+        max_delay=40,
+        window=900,
+    )
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def backend(request, tmp_path):
+    """Provide each throttle backend.
+
+    Args:
+        request: Pytest fixture request.
+        tmp_path: Temporary directory for the SQLite file.
+
+    Returns:
+        Throttle backend under test.
+    """
+    if request.param == "memory":
+        return MemoryThrottleBackend()
+    return SqliteThrottleBackend(str(tmp_path / "throttle.db"))
+
+
+def test_backoff_doubles_after_free_attempts(backend) -> None:
+    """Test lockouts start after the allowance and grow exponentially.
+
+    Args:
+        backend: Throttle backend under test.
+    """
+    throttle = _throttle(backend)
+    for _ in range(2):
+        throttle.record_failure("John", "10.0.0.1")
+    assert throttle.retry_after("john", "10.0.0.1") == 0
+
+    throttle.record_failure("john", "10.0.0.1")
+    assert 9 < throttle.retry_after("john", "10.0.0.1") <= 10
+    throttle.record_failure("john", "10.0.0.1")
+    assert 19 < throttle.retry_after("john", "10.0.0.1") <= 20
+    for _ in range(3):
+        throttle.record_failure("john", "10.0.0.1")
+    assert throttle.retry_after("john", "10.0.0.1") <= 40
+
+
+def test_success_resets_login_but_not_client(backend) -> None:
+    """Test a good login clears its name but keeps client history.
+
+    Args:
+        backend: Throttle backend under test.
+    """
+    throttle = _throttle(backend)
+    for name in ("a", "b", "c", "d", "e"):
+        throttle.record_failure(name, "10.0.0.2")
+
+    throttle.record_success("e", "10.0.0.2")
+
+    assert throttle.retry_after("e", "10.0.0.2") > 0
+    assert throttle.retry_after("e", "10.0.0.3") == 0
+
+
+def test_reserve_counts_attempts_before_they_finish(backend) -> None:
+    """Test concurrent reservations cannot all pass one lockout check.
+
+    Args:
+        backend: Throttle backend under test.
+    """
+    throttle = _throttle(backend)
+
+    # None of these attempts has finished, so none has been checked yet
+    admitted = [throttle.reserve("john", "10.0.0.4") for _ in range(4)]
+
+    assert admitted[:3] == [0, 0, 0]
+    assert 9 < admitted[3] <= 10
+    # The refused attempt was not counted against either key
+    assert backend.get("login:john").failures == 3
+    assert backend.get("client:10.0.0.4").failures == 3
+
+
+def test_success_refunds_its_reservation(backend) -> None:
+    """Test a good PIN clears its subject and refunds only itself.
+
+    Args:
+        backend: Throttle backend under test.
+    """
+    throttle = _throttle(backend)
+    throttle.record_failure("a", "10.0.0.5")
+    throttle.reserve(None, "10.0.0.5", person_id=7)
+
+    throttle.record_success(None, "10.0.0.5", person_id=7, reserved=True)
+
+    assert backend.get("person:7") is None
+    assert backend.get("login:a").failures == 1
+    assert backend.get("client:10.0.0.5").failures == 1
+
+
+@pytest.mark.asyncio
+async def test_blocking_backend_runs_off_the_event_loop(tmp_path) -> None:
+    """Test SQLite throttle calls run in a worker thread.
+
+    Args:
+        tmp_path: Temporary directory for the SQLite file.
+    """
+    throttle = _throttle(SqliteThrottleBackend(str(tmp_path / "t.db")))
+    loop_thread = threading.get_ident()
+
+    assert await throttle.run(threading.get_ident) != loop_thread
+    assert await throttle.run(throttle.reserve, "john", "10.0.0.6") == 0
+    memory = _throttle(MemoryThrottleBackend())
+    assert await memory.run(threading.get_ident) == loop_thread
@@ -0,0 +1,56 @@
+"""Tests for the off-event-loop password hasher."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from choreboss.hashing import PasswordHasher, PasswordHasherOverloaded
+
+
+@pytest.fixture
+def hasher():
+    """Create a single-worker hasher with no waiting room.
+
+    Yields:
+        PasswordHasher: Hasher under test.
+    """
+    hasher = PasswordHasher(max_workers=1, queue_depth=0)
+    yield hasher
+    hasher.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_hash_and_verify_round_trip(hasher: PasswordHasher) -> None:
+    """Test hashing in the pool produces verifiable bcrypt hashes.
+
+    Args:
+        hasher: Hasher under test.
+    """
+    hashed = await hasher.hash_pin("1234")
+
+    assert await hasher.verify_pin("1234", hashed)
+    assert not await hasher.verify_pin("9999", hashed)
+    stats = hasher.stats()
+    assert stats.hash.count == 1
+    assert stats.verify.count == 2
+    assert stats.verify.mean_ms > 0
+    assert stats.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_overload_is_rejected(hasher: PasswordHasher) -> None:
+    """Test requests beyond the queue bound are shed immediately.
+
+    Args:
+        hasher: Hasher under test.
+    """
+    results = await asyncio.gather(
+        hasher.hash_pin("1234"),
+        hasher.hash_pin("5678"),
+        return_exceptions=True,
+    )
+
+    assert isinstance(results[1], PasswordHasherOverloaded)
+    assert hasher.stats().rejected == 1
@@ -0,0 +1,191 @@
+"""Tests for recurrence rules, next_due_at and the due queue."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from choreboss.due_queue import DueQueue
+from choreboss.recurrence import next_due_at, validate_rule
+from choreboss.repositories import ChoreRepository, PeopleRepository
+from choreboss.services import ChoreService
+from tests.setup_memory_records import setup_test_people
+
+# 2026-03-02 is a Monday
+MONDAY = datetime(2026, 3, 2, 18, 30)
+
+
+@pytest.mark.parametrize(
+    ("recurrence", "day", "last", "expected"),
+    [
+        ("none", None, MONDAY, None),
+        ("daily", None, None, datetime(2026, 3, 2)),
+        ("daily", None, MONDAY, datetime(2026, 3, 3)),
+        ("weekly", 0, None, datetime(2026, 3, 2)),
+        ("weekly", 0, MONDAY, datetime(2026, 3, 9)),
+        ("weekly", 3, MONDAY, datetime(2026, 3, 5)),
+        ("weekly", None, MONDAY, datetime(2026, 3, 9)),
+        ("monthly", 1, None, datetime(2026, 4, 1)),
+        ("monthly", 31, datetime(2026, 1, 31), datetime(2026, 2, 28)),
+        ("monthly", 15, datetime(2026, 12, 20), datetime(2027, 1, 15)),
+        ("monthly", None, datetime(2026, 1, 10), datetime(2026, 2, 10)),
+    ],
+)
+def test_next_due_at(recurrence, day, last, expected) -> None:
+    """Test due dates for each rule, before and after a completion."""
+    assert next_due_at(recurrence, day, last, MONDAY) == expected
+
+
+def test_validate_rule_rejects_days_outside_the_type() -> None:
+    """Test recurrence days must fit their recurrence type."""
+    for recurrence, day in [
+        ("weekly", 7),
+        ("monthly", 0),
+        ("daily", 1),
+        ("yearly", None),
+    ]:
+        with pytest.raises(ValueError):
+            validate_rule(recurrence, day)
+
+
+def test_due_queue_reschedules_and_pops_in_due_order() -> None:
+    """Test rescheduled and removed chores leave no stale entries."""
+    queue = DueQueue(
+        [
+            (1, datetime(2026, 3, 3)),
+            (2, datetime(2026, 3, 1)),
+            (3, datetime(2026, 3, 2)),
+        ]
+    )
+
+    queue.push(2, datetime(2026, 3, 5))
+    queue.discard(3)
+    queue.push(4, None)
+
+    assert len(queue) == 2
+    assert queue.peek() == (datetime(2026, 3, 3), 1)
+    assert queue.pop_due(datetime(2026, 3, 4)) == [(datetime(2026, 3, 3), 1)]
+    assert queue.pop() == (datetime(2026, 3, 5), 2)
+    assert queue.peek() is None
+
+
+@pytest.mark.asyncio
+async def test_service_keeps_next_due_at_current(
+    async_session: AsyncSession,
+) -> None:
+    """Test next_due_at follows creation, edits and completions.
+
+    Args:
+        async_session: Database session.
+    """
+    people = await setup_test_people(async_session, 1)
+    await async_session.commit()
+    repo = ChoreRepository(async_session)
+    service = ChoreService(repo, PeopleRepository(async_session))
+    daily = await service.add_chore(
+        "Feed the cat",
+        "Wet food, morning",
+        recurrence="daily",
+    )
+    once = await service.add_chore("Clean garage", "Before winter starts")
+    await async_session.commit()
+    today = datetime.combine(datetime.utcnow().date(), datetime.min.time())
+
+    assert daily.next_due_at == today
+    assert once.next_due_at is None
+    assert (await repo.get_due_queue()).peek() == (today, daily.id)
+
+    once.recurrence = "weekly"
+    once.recurrence_day = today.weekday()
+    await service.update_chore(once)
+    completed = await service.complete_chore(daily.id, people[0].id)
+    await async_session.commit()
+
+    assert once.next_due_at == today
+    assert completed.next_due_at.date() > today.date()
+    assert (await repo.get_due_queue()).peek() == (today, once.id)
+
+
+@pytest.mark.asyncio
+async def test_completion_update_reschedules_from_the_row_rule(
+    async_session: AsyncSession,
+) -> None:
+    """Test the completing UPDATE picks the due time of each chore's rule.
+
+    Args:
+        async_session: Database session.
+    """
+    people = await setup_test_people(async_session, 1)
+    repo = ChoreRepository(async_session)
+    rules = [
+        ("none", None),
+        ("daily", None),
+        ("weekly", None),
+        ("weekly", 4),
+        ("monthly", None),
+        ("monthly", 31),
+    ]
+    chores = [
+        await repo.add_chore(
+            f"Rule chore {i}", "Follows its rule", people[0].id, *rule
+        )
+        for i, rule in enumerate(rules)
+    ]
+    await async_session.commit()
+
+    for chore, (recurrence, day) in zip(chores, rules, strict=True):
+        done = await repo.complete_and_rotate(chore.id, people[0].id)
+        assert done.next_due_at == next_due_at(
+            recurrence,
+            day,
+            done.last_completed_date,
+            done.created_at,
+        )
+    await async_session.commit()
+
+@pytest.mark.asyncio
+async def test_due_queue_replays_changes_and_gates_reminders(
+    async_session: AsyncSession,
+) -> None:
+    """Test the queue catches up from the change log and skips idle runs.
+
+    Args:
+        async_session: Database session.
+    """
+    repo = ChoreRepository(async_session)
+    service = ChoreService(repo, PeopleRepository(async_session))
+    today = datetime.combine(datetime.utcnow().date(), datetime.min.time())
+    soon = await service.add_chore("Feed the cat", "Wet food, morning")
+    later = await service.add_chore("Clean garage", "Before winter starts")
+    soon.next_due_at = today + timedelta(days=1)
+    later.next_due_at = today + timedelta(days=2)
+    await async_session.commit()
+    queue = await repo.get_due_queue()
+    statements = []
+
+    def count(conn, cursor, statement, *args) -> None:
+        statements.append(statement)
+
+    engine = async_session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", count)
+    try:
+        # Nothing due yet: one version check, no chore query
+        assert await service.send_due_reminders(today, timedelta(1)) == 0
+        assert len(statements) == 1
+        await service.delete_chore(later.id)
+        soon.next_due_at = today - timedelta(hours=1)
+        await async_session.commit()
+        statements.clear()
+        assert await repo.get_due_queue() is queue
+    finally:
+        event.remove(engine, "before_cursor_execute", count)
+
+    # Version check, tombstones and changed chores; no full reload
+    assert len(statements) == 3
+    assert len(queue) == 1
+    assert await service.send_due_reminders(today, timedelta(1)) == 1
+    await async_session.commit()
+    assert (await repo.get_due_queue()).peek() is None
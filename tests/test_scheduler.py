@@ -0,0 +1,141 @@
+"""Tests for the background scheduler, job leases and scheduled jobs."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api import scheduler as scheduler_module
+from api import tasks
+from api.scheduler import Job, Scheduler
+from choreboss.events import broker
+from choreboss.repositories import LeaseRepository
+from tests.setup_memory_records import setup_test_chores
+
+
+@pytest.fixture
+def shared_session(monkeypatch, async_session: AsyncSession):
+    """Point the scheduler and jobs at the test database.
+
+    Args:
+        monkeypatch: Pytest monkeypatch fixture.
+        async_session: Database session.
+
+    Returns:
+        AsyncSession: The session every job will use.
+    """
+
+    async def get_session():
+        yield async_session
+
+    monkeypatch.setattr(scheduler_module, "get_session", get_session)
+    monkeypatch.setattr(tasks, "get_session", get_session)
+    return async_session
+
+
+@pytest.mark.asyncio
+async def test_lease_is_exclusive_until_released_or_expired(
+    async_session: AsyncSession,
+) -> None:
+    """Test one holder at a time, with renewal, release and takeover.
+
+    Args:
+        async_session: Database session.
+    """
+    leases = LeaseRepository(async_session)
+
+    assert await leases.try_acquire("job", "a", 60)
+    await async_session.commit()
+    assert not await leases.try_acquire("job", "b", 60)
+    assert await leases.try_acquire("job", "a", 60)
+    await leases.release("job", "a")
+    await async_session.commit()
+    assert await leases.try_acquire("job", "b", 0)
+    await async_session.commit()
+    # A zero TTL lease is already expired, so it can be taken over
+    assert await leases.try_acquire("job", "a", 60)
+
+
+@pytest.mark.asyncio
+async def test_leader_only_job_runs_on_one_worker(shared_session) -> None:
+    """Test two workers sharing a database run a leader job once.
+
+    Args:
+        shared_session: Database session used by the scheduler.
+    """
+    runs = []
+
+    async def work() -> None:
+        runs.append(1)
+
+    job = Job("work", 60, work)
+    local = Job("local", 60, work, leader_only=False)
+    first = Scheduler([job, local], holder="worker-1")
+    second = Scheduler([job, local], holder="worker-2")
+
+    assert await first.run_once(job)
+    assert not await second.run_once(job)
+    assert await first.run_once(job)
+    assert await second.run_once(local)
+    assert len(runs) == 3
+
+
+@pytest.mark.asyncio
+async def test_stop_cancels_jobs_and_hands_over_leases(
+    shared_session,
+) -> None:
+    """Test shutdown cancels running jobs and frees their leases.
+
+    Args:
+        shared_session: Database session used by the scheduler.
+    """
+    started = asyncio.Event()
+
+    async def slow() -> None:
+        started.set()
+        await asyncio.sleep(3600)
+
+    job = Job("slow", 60, slow)
+    scheduler = Scheduler([job], holder="worker-1")
+    scheduler.start()
+    await asyncio.wait_for(started.wait(), 1)
+
+    await asyncio.wait_for(scheduler.stop(), 1)
+
+    assert await Scheduler([job], holder="worker-2")._acquire(job)
+
+
+@pytest.mark.asyncio
+async def test_rollover_and_reminders_jobs(shared_session) -> None:
+    """Test missed chores roll forward and each due time is announced once.
+
+    Args:
+        shared_session: Database session used by the jobs.
+    """
+    chores = await setup_test_chores(shared_session, 2)
+    today = datetime.combine(datetime.utcnow().date(), datetime.min.time())
+    chores[0].recurrence = "daily"
+    chores[0].next_due_at = today - timedelta(days=3)
+    chores[1].next_due_at = today - timedelta(days=3)
+    await shared_session.commit()
+    subscription = broker.subscribe()
+
+    rolled = await tasks.roll_over_missed_chores()
+    sent = await tasks.send_due_reminders()
+    sent_again = await tasks.send_due_reminders()
+
+    assert rolled == 1
+    assert chores[0].next_due_at == today
+    # The one-off chore is not rolled, and is too old for a reminder
+    assert chores[1].next_due_at == today - timedelta(days=3)
+    assert (sent, sent_again) == (1, 0)
+    events = []
+    while not subscription.queue.empty():
+        events.append(subscription.queue.get_nowait())
+    assert [(e.type, e.data["chore_id"]) for e in events] == [
+        ("chore.updated", chores[0].id),
+        ("chore.due", chores[0].id),
+    ]
@@ -0,0 +1,69 @@
+"""Tests for the validated-JWT claims cache."""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+from fastapi.security import HTTPAuthorizationCredentials
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.dependencies.auth import (
+    claims_cache,
+    create_access_token,
+    get_current_person,
+)
+from api.dependencies.token_cache import TokenClaimsCache
+
+
+def test_cache_evicts_least_recently_used() -> None:
+    """Test the cache stays within its size bound."""
+    cache = TokenClaimsCache(max_size=2)
+    expires_at = time.time() + 60
+    cache.put("a", {"person_id": 1}, expires_at)
+    cache.put("b", {"person_id": 2}, expires_at)
+    assert cache.get("a") == {"person_id": 1}
+
+    cache.put("c", {"person_id": 3}, expires_at)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == {"person_id": 1}
+    assert len(cache) == 2
+
+
+def test_cache_drops_expired_tokens() -> None:
+    """Test entries are not served past the token's exp."""
+    cache = TokenClaimsCache(max_size=2)
+    cache.put("a", {"person_id": 1}, time.time() - 1)
+
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_get_current_person_serves_repeat_tokens_from_cache(
+    async_session: AsyncSession,
+    monkeypatch,
+) -> None:
+    """Test a repeated token is not decoded a second time.
+
+    Args:
+        async_session: Database session.
+        monkeypatch: Pytest monkeypatch fixture.
+    """
+    claims_cache.clear()
+    token = create_access_token(person_id=7, is_admin=False)
+    credentials = HTTPAuthorizationCredentials(
+        scheme="Bearer", credentials=token
+    )
+    first = await get_current_person(credentials, async_session)
+
+    def fail_decode(*args, **kwargs):
+        raise AssertionError("token decoded twice")
+
+    monkeypatch.setattr("api.dependencies.auth.jwt.decode", fail_decode)
+    second = await get_current_person(credentials, async_session)
+
+    assert first == second
+    assert first["person_id"] == 7
+    assert first["is_admin"] is False
@@ -0,0 +1,98 @@
+"""Tests for the token revocation store."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.dependencies.revocation import TokenRevocationStore
+from choreboss.models.revoked_token import RevokedToken
+from choreboss.repositories import TokenRevocationRepository
+
+
+@pytest.mark.asyncio
+async def test_sync_picks_up_other_workers_revocations(
+    async_session: AsyncSession,
+) -> None:
+    """Test a store sees revocations written elsewhere after syncing.
+
+    Args:
+        async_session: Database session.
+    """
+    store = TokenRevocationStore(sync_interval=60)
+    await store.sync(async_session)
+    assert not store.is_revoked(1, "abc", 0)
+
+    repo = TokenRevocationRepository(async_session)
+    now = datetime.utcnow()
+    await repo.revoke_token("abc", now + timedelta(days=1))
+    await repo.revoke_person(2, now, now + timedelta(days=7))
+    await async_session.commit()
+
+    # Within the interval the mirror is not refreshed
+    await store.maybe_sync(async_session)
+    assert not store.is_revoked(1, "abc", 0)
+
+    await store.sync(async_session)
+    revoked_at = now.replace(tzinfo=timezone.utc).timestamp()
+    issued_before = revoked_at - 60
+    assert store.is_revoked(1, "abc", 0)
+    assert store.is_revoked(2, "other", issued_before)
+    assert not store.is_revoked(2, "newer", revoked_at + 60)
+    assert not store.is_revoked(3, "other", issued_before)
+
+
+@pytest.mark.asyncio
+async def test_sync_catches_revocations_committed_out_of_order(
+    async_session: AsyncSession,
+) -> None:
+    """Test a row with a lower ID that commits late is still applied.
+
+    Args:
+        async_session: Database session.
+    """
+    now = datetime.utcnow()
+    expires_at = now + timedelta(days=1)
+    async_session.add(
+        RevokedToken(id=2, jti="fast", expires_at=expires_at, created_at=now)
+    )
+    await async_session.commit()
+    store = TokenRevocationStore(sync_interval=0, sync_overlap=60)
+    await store.sync(async_session)
+
+    # Inserted before the row above, but committed after the first sync
+    async_session.add(
+        RevokedToken(
+            id=1,
+            jti="slow",
+            expires_at=expires_at,
+            created_at=now - timedelta(seconds=5),
+        )
+    )
+    await async_session.commit()
+    await store.sync(async_session)
+
+    assert store.is_revoked(1, "fast", 0)
+    assert store.is_revoked(1, "slow", 0)
+
+
+@pytest.mark.asyncio
+async def test_expired_revocations_are_not_loaded(
+    async_session: AsyncSession,
+) -> None:
+    """Test revocations for already-expired tokens are skipped and pruned.
+
+    Args:
+        async_session: Database session.
+    """
+    repo = TokenRevocationRepository(async_session)
+    await repo.revoke_token("old", datetime.utcnow() - timedelta(seconds=1))
+    await async_session.commit()
+    store = TokenRevocationStore(sync_interval=0)
+
+    await store.sync(async_session)
+
+    assert not store.is_revoked(1, "old", 0)
+    assert await repo.delete_expired() == 1
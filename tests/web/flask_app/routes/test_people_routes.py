@@ -1,3 +1,4 @@
+import asyncio
 from datetime import datetime
 import json
 import unittest
@@ -281,8 +282,8 @@ class TestPeopleRoutes(unittest.TestCase):
         expected_response = self.client.get('/people/1/edit')
         self.assertEqual(response.data, expected_response.data)
         edited_person = self.app.people_service.get_person_by_id(1)
-        self.assertEqual(edited_person.verify_pin('123456'), False)
-        self.assertEqual(edited_person.verify_pin('654321'), True)
+        self.assertEqual(asyncio.run(edited_person.verify_pin('123456')), False)
+        self.assertEqual(asyncio.run(edited_person.verify_pin('654321')), True)
 
         # Verify incorrect PIN
         response = self.client.post(
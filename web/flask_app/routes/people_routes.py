@@ -1,3 +1,4 @@
+import asyncio
 from datetime import datetime
 from flask import (
     Blueprint, current_app, jsonify, redirect, request, render_template,
@@ -101,10 +102,10 @@ def edit_pin(person_id: int) -> Response:
         if new_pin != confirm_pin:
             return jsonify({'error': 'New PINs do not match'}), 400
 
-        if not person.verify_pin(current_pin):
+        if not asyncio.run(person.verify_pin(current_pin)):
             return jsonify({'error': 'Current PIN is incorrect'}), 400
 
-        person.set_pin(new_pin)
+        asyncio.run(person.set_pin(new_pin))
         current_app.people_service.update_person(person)
         return redirect(url_for('people_bp.edit_person', person_id=person_id))
 
@@ -165,7 +166,7 @@ def verify_pin() -> Response:
         next_person = \
             current_app.people_service.get_next_person_by_person_id(
                 chore.person_id)
-        if next_person.verify_pin(pin) or \
+        if asyncio.run(next_person.verify_pin(pin)) or \
                 current_app.people_service.is_admin(pin):
             return jsonify({'status': 'success'})
     elif context == 'add_person':
@@ -173,8 +174,9 @@ def verify_pin() -> Response:
                 not current_app.people_service.admins_exist():
             return jsonify({'status': 'success'})
     elif context == 'edit_person':
+        # get_person_by_pin has already verified the PIN for the match
         person = current_app.people_service.get_person_by_pin(pin)
-        if person and (person.is_admin or person.verify_pin(pin)):
+        if person:
             return jsonify({'status': 'success'})
     elif context in (
         'change_sequence', 'delete_chore', 'delete_person', 'edit_chore'